@@ -0,0 +1 @@
+"""Benchmarks for overrides, run them from the repository root with `python -m`."""
@@ -0,0 +1,48 @@
+"""Cost of defining a class of overriding methods at each check level.
+
+python -m benchmarks.check_levels
+"""
+
+import timeit
+
+from overrides import CheckLevel, set_check_level
+
+METHODS = 50
+
+SOURCE = "\n".join(
+    [
+        "from typing import Dict, List, Optional",
+        "from overrides import EnforceOverrides, override",
+        "class Base(EnforceOverrides):",
+    ]
+    + [
+        f"    def method_{i}(self, key: str, values: List[int]) -> Optional[Dict[str, int]]:\n"
+        f"        pass"
+        for i in range(METHODS)
+    ]
+    + ["class Sub(Base):"]
+    + [
+        f"    @override\n"
+        f"    def method_{i}(self, key: str, values: List[int]) -> Optional[Dict[str, int]]:\n"
+        f"        pass"
+        for i in range(METHODS)
+    ]
+)
+
+
+def main(number: int = 200) -> None:
+    code = compile(SOURCE, "<benchmark>", "exec")
+    print(f"Defining a base class and a subclass overriding {METHODS} methods:")
+    for level in CheckLevel:
+        set_check_level(level)
+        seconds = min(
+            timeit.repeat(
+                lambda: exec(code, {"__name__": "benchmark"}), number=number, repeat=5
+            )
+        )
+        print(f"{level.name.lower():>10}: {seconds / number * 1e6:10.1f} us")
+    set_check_level(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Steady-state cost of calling a method decorated with check_at_runtime=True.
+
+python -m benchmarks.runtime_check
+"""
+
+import timeit
+
+from overrides import override
+
+
+class Base:
+    def handle(self, request: int) -> int:
+        return request
+
+
+class Plain(Base):
+    def handle(self, request: int) -> int:
+        return request
+
+
+class Checked(Base):
+    @override(check_at_runtime=True)
+    def handle(self, request: int) -> int:
+        return request
+
+
+def main(number: int = 1_000_000) -> None:
+    plain = Plain()
+    checked = Checked()
+    checked.handle(0)  # The first call validates the override.
+    plain_time = min(timeit.repeat(lambda: plain.handle(1), number=number, repeat=5))
+    checked_time = min(
+        timeit.repeat(lambda: checked.handle(1), number=number, repeat=5)
+    )
+    print(f"undecorated:      {plain_time / number * 1e9:8.1f} ns/call")
+    print(f"check_at_runtime: {checked_time / number * 1e9:8.1f} ns/call")
+    print(f"overhead:         {(checked_time / plain_time - 1) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
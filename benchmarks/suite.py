@@ -0,0 +1,346 @@
+"""Microbenchmarks of the costs overrides adds, with JSON baselines.
+
+python -m benchmarks.suite run [--save baseline.json]
+python -m benchmarks.suite compare baseline.json [--threshold 0.25]
+
+`run` prints the time per operation of every benchmark and optionally saves it.
+`compare` runs the benchmarks again and exits with status 1 if any of them got
+slower than the baseline by more than the threshold (a fraction, 0.25 = 25 %).
+Baselines are only comparable on the same machine and Python version.
+"""
+
+import argparse
+import collections.abc
+import functools
+import json
+import platform
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Sized,
+    Tuple,
+    TypeVar,
+)
+
+from overrides import (
+    EnforceOverrides,
+    EnforceOverridesMeta,
+    Sampling,
+    frameless_override,
+    override,
+)
+from overrides.typing_utils import (
+    _is_normal_subtype,
+    _is_origin_subtype,
+    issubtype,
+    normalize,
+)
+
+METHODS = 20
+REPEAT = 5
+
+# Number of classes in the MRO of a class, and of methods of a metaclass, for
+# the `EnforceOverridesMeta` benchmarks.
+DEPTH = 20
+METACLASS_METHODS = 500
+
+
+class Request:
+    pass
+
+
+class Response:
+    pass
+
+
+_SIGNATURES = {
+    "untyped": "(self, key, values)",
+    "typed": "(self, key: str, values: List[int]) -> Optional[Dict[str, int]]",
+    "user_classes": "(self, key: Request, values: List[Request]) -> Optional[Response]",
+}
+
+
+def _class_source(signature: str, enforce: bool, decorator: str) -> str:
+    base = "EnforceOverrides" if enforce else "object"
+    lines = ["from typing import Dict, List, Optional", f"class Base({base}):"]
+    lines += [
+        f"    def method_{i}{_SIGNATURES[signature]}:\n        pass"
+        for i in range(METHODS)
+    ]
+    lines += ["class Sub(Base):"]
+    lines += [
+        f"    @{decorator}\n    def method_{i}{_SIGNATURES[signature]}:\n        pass"
+        for i in range(METHODS)
+    ]
+    return "\n".join(lines)
+
+
+def _define_classes(
+    signature: str, enforce: bool, decorator: str = "override"
+) -> Callable[[], object]:
+    code = compile(_class_source(signature, enforce, decorator), "<benchmark>", "exec")
+    namespace = {
+        "__name__": "benchmark",
+        "EnforceOverrides": EnforceOverrides,
+        "override": override,
+        "frameless_override": frameless_override,
+        "Request": Request,
+        "Response": Response,
+    }
+    return lambda: exec(code, dict(namespace))
+
+
+def _methods(prefix: str, number: int) -> Dict[str, Callable]:
+    return {f"{prefix}_{i}": lambda self: None for i in range(number)}
+
+
+def _subclass(*bases: type) -> Callable[[], object]:
+    return lambda: type("Sub", bases, _methods("sub", 1))
+
+
+def _subclass_deep_hierarchy() -> Callable[[], object]:
+    base: type = EnforceOverrides
+    for level in range(DEPTH):
+        base = type(f"Level{level}", (base,), _methods(f"level{level}", 5))
+    return _subclass(base)
+
+
+def _subclass_many_mixins() -> Callable[[], object]:
+    mixins = [type(f"Mixin{i}", (), _methods(f"mixin{i}", 5)) for i in range(DEPTH)]
+    return _subclass(*mixins, EnforceOverrides)
+
+
+def _subclass_large_metaclass() -> Callable[[], object]:
+    metaclass = type(
+        "LargeMeta",
+        (EnforceOverridesMeta,),
+        _methods("helper", METACLASS_METHODS),
+    )
+    return _subclass(metaclass("Base", (), {}))
+
+
+class _Enforced(EnforceOverrides):
+    def handle(self, request: int) -> int:
+        return request
+
+
+def _instantiate() -> Callable[[], object]:
+    return _Enforced
+
+
+class _Base:
+    def handle(self, request: int) -> int:
+        return request
+
+
+class _Checked(_Base):
+    @override(check_at_runtime=True)
+    def handle(self, request: int) -> int:
+        return request
+
+
+def _call_checked() -> Callable[[], object]:
+    checked = _Checked()
+    checked.handle(0)  # The first call validates the override.
+    return lambda: checked.handle(1)
+
+
+class _ValuesChecked(_Base):
+    @override(check_values=True)
+    def handle(self, request: int) -> int:
+        return request
+
+
+class _ValuesSampled(_Base):
+    @override(check_values=Sampling(every=100))
+    def handle(self, request: int) -> int:
+        return request
+
+
+def _call_values_checked(cls: type) -> Callable[[], object]:
+    checked = cls()
+    checked.handle(0)  # The first call compiles the validator.
+    return lambda: checked.handle(1)
+
+
+ISSUBTYPE_PAIRS: Dict[str, Tuple[Any, Any]] = {
+    "int_float": (int, float),
+    "list_sequence": (List[int], Sequence[int]),
+    "dict_optional": (Dict[str, int], Optional[Dict[str, int]]),
+    "callable": (Callable[[int], str], Callable[[int], object]),
+}
+
+
+def _issubtype(left: Any, right: Any) -> Callable[[], object]:
+    return lambda: issubtype(left, right)
+
+
+# Subclass relations between origins, which `issubtype` decisions not in its
+# cache are made of.
+ORIGIN_PAIRS: Dict[str, Tuple[Any, Any]] = {
+    "class": (bool, int),
+    "abc": (list, collections.abc.Sequence),
+    "typing_alias": (list, Sized),
+}
+
+
+def _origin_subtype(left: Any, right: Any) -> Callable[[], object]:
+    return lambda: _is_origin_subtype(left, right)
+
+
+_Bound = TypeVar("_Bound", bound=int)
+
+# Subtype checks not in the `issubtype` cache, by the kind of the types.
+KIND_PAIRS: Dict[str, Tuple[Any, Any]] = {
+    "any": (List[int], Any),
+    "union": (int, Optional[int]),
+    "literal": (Literal["a"], Literal["a", "b"]),
+    "typevar": (_Bound, int),
+    "generic": (List[int], Sequence[int]),
+    "class": (bool, int),
+}
+
+
+def _normal_subtype(left: Any, right: Any) -> Callable[[], object]:
+    normal_left, normal_right = normalize(left), normalize(right)
+    return lambda: _is_normal_subtype(normal_left, normal_right, None)
+
+
+# Name, function making the callable to time, and the number of operations
+# one call of it performs.
+BENCHMARKS: List[Tuple[str, Callable[[], Callable[[], object]], int]] = (
+    [
+        ("override_untyped", lambda: _define_classes("untyped", False), METHODS),
+        ("override_typed", lambda: _define_classes("typed", False), METHODS),
+        (
+            "override_user_classes",
+            lambda: _define_classes("user_classes", False),
+            METHODS,
+        ),
+        (
+            "frameless_override_untyped",
+            lambda: _define_classes("untyped", False, "frameless_override"),
+            METHODS,
+        ),
+        ("enforce_class_creation", lambda: _define_classes("typed", True), 1),
+        ("enforce_deep_hierarchy", _subclass_deep_hierarchy, 1),
+        ("enforce_many_mixins", _subclass_many_mixins, 1),
+        ("enforce_large_metaclass", _subclass_large_metaclass, 1),
+        ("enforce_instantiation", _instantiate, 1),
+        ("runtime_wrapper_call", _call_checked, 1),
+        (
+            "value_check_call",
+            functools.partial(_call_values_checked, _ValuesChecked),
+            1,
+        ),
+        (
+            "value_check_sampled_call",
+            functools.partial(_call_values_checked, _ValuesSampled),
+            1,
+        ),
+    ]
+    + [
+        (f"issubtype_{name}", functools.partial(_issubtype, left, right), 1)
+        for name, (left, right) in ISSUBTYPE_PAIRS.items()
+    ]
+    + [
+        (f"origin_subtype_{name}", functools.partial(_origin_subtype, left, right), 1)
+        for name, (left, right) in ORIGIN_PAIRS.items()
+    ]
+    + [
+        (f"subtype_{name}", functools.partial(_normal_subtype, left, right), 1)
+        for name, (left, right) in KIND_PAIRS.items()
+    ]
+)
+
+
+def run(names: Optional[Sequence[str]] = None) -> Dict[str, float]:
+    """Run the benchmarks, all of them or those in `names`.
+
+    :return: nanoseconds per operation of each benchmark.
+    """
+    results = {}
+    for name, make, operations in BENCHMARKS:
+        if names and name not in names:
+            continue
+        timer = timeit.Timer(make())
+        number, _ = timer.autorange()
+        seconds = min(timer.repeat(repeat=REPEAT, number=number))
+        results[name] = seconds / number / operations * 1e9
+    return results
+
+
+def compare(
+    baseline: Dict[str, float], results: Dict[str, float], threshold: float
+) -> List[str]:
+    """Get the names of the benchmarks in `results` that are slower than in
+    `baseline` by more than `threshold`.
+    """
+    return [
+        name
+        for name, value in results.items()
+        if name in baseline and value > baseline[name] * (1 + threshold)
+    ]
+
+
+def _environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--save", metavar="PATH", help="save a JSON baseline")
+    compare_parser = commands.add_parser("compare", help="compare with a baseline")
+    compare_parser.add_argument("baseline", help="JSON baseline saved by run")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown as a fraction (default: 0.25)",
+    )
+    for command in (run_parser, compare_parser):
+        command.add_argument("-k", dest="names", action="append", help="benchmark")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.names)
+        for name, value in results.items():
+            print(f"{name:32} {value:12.1f} ns")
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(
+                    {"environment": _environment(), "results": results}, f, indent=2
+                )
+                f.write("\n")
+        return 0
+
+    with open(args.baseline) as f:
+        saved = json.load(f)
+    if saved.get("environment") != _environment():
+        print(f"warning: baseline is from {saved.get('environment')}", file=sys.stderr)
+    baseline = saved["results"]
+    results = run(args.names)
+    regressions = compare(baseline, results, args.threshold)
+    for name, value in results.items():
+        before = baseline.get(name)
+        change = f"{(value / before - 1) * 100:+7.1f} %" if before else "    new"
+        mark = "  REGRESSION" if name in regressions else ""
+        print(f"{name:32} {value:12.1f} ns {change}{mark}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
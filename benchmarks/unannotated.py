@@ -0,0 +1,46 @@
+"""Cost of checking overrides without any annotations, like generated gRPC
+servicers and clients.
+
+python -m benchmarks.unannotated
+"""
+
+import timeit
+
+from overrides import override
+
+METHODS = 200
+
+SOURCE = "\n".join(
+    ["class Servicer:"]
+    + [
+        f"    def Method{i}(self, request, context):\n"
+        f"        raise NotImplementedError()"
+        for i in range(METHODS)
+    ]
+    + ["class Implementation(Servicer):"]
+    + [
+        f"    @override\n"
+        f"    def Method{i}(self, request, context):\n"
+        f"        return request"
+        for i in range(METHODS)
+    ]
+)
+
+
+def main(number: int = 20) -> None:
+    code = compile(SOURCE, "<benchmark>", "exec")
+    seconds = min(
+        timeit.repeat(
+            lambda: exec(code, {"__name__": "benchmark", "override": override}),
+            number=number,
+            repeat=5,
+        )
+    )
+    print(
+        f"Overriding {METHODS} unannotated methods: "
+        f"{seconds / number / METHODS * 1e6:.1f} us per override"
+    )
+
+
+if __name__ == "__main__":
+    main()
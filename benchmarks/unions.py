@@ -0,0 +1,47 @@
+"""Cost of subtype checks between large Unions and Literals, like annotation
+aliases listing many accepted types or values. The `issubtype` decision cache is
+bypassed, so that every check does the work.
+
+python -m benchmarks.unions
+"""
+
+import timeit
+import typing
+
+from overrides.typing_utils import _is_normal_subtype, normalize
+
+MEMBERS = 50
+VALUES = 500
+
+CLASSES = [type(f"Class{i}", (), {}) for i in range(MEMBERS)]
+SUBCLASSES = [type(f"SubClass{i}", (base,), {}) for i, base in enumerate(CLASSES)]
+VALUES_LIST = [f"value{i}" for i in range(VALUES)]
+
+CASES: typing.Dict[str, typing.Tuple[typing.Any, typing.Any]] = {
+    f"Union of {MEMBERS} subclasses <: Union of their bases": (
+        typing.Union[tuple(SUBCLASSES)],
+        typing.Union[tuple(CLASSES)],
+    ),
+    f"Literal of {VALUES} values <: wider Literal": (
+        typing.Literal[tuple(VALUES_LIST)],
+        typing.Literal[tuple(VALUES_LIST + ["other"])],
+    ),
+}
+
+
+def main(number: int = 200) -> None:
+    for name, (left, right) in CASES.items():
+        normal_left, normal_right = normalize(left), normalize(right)
+        assert _is_normal_subtype(normal_left, normal_right, None)
+        seconds = min(
+            timeit.repeat(
+                lambda: _is_normal_subtype(normal_left, normal_right, None),
+                number=number,
+                repeat=5,
+            )
+        )
+        print(f"{name}: {seconds / number * 1e6:.1f} us per check")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from overrides.config import CheckLevel, get_check_level, set_check_level
 from overrides.enforce import EnforceOverrides, EnforceOverridesMeta
 import sys
 
@@ -5,14 +6,36 @@ if sys.version_info < (3, 11):
     from overrides.final import final
 else:
     from typing import final
-from overrides.overrides import __VERSION__, overrides, override
+from overrides.overrides import (
+    __VERSION__,
+    check_class,
+    frameless_override,
+    overrides,
+    override,
+    validate_class,
+    verify_all,
+)
+from overrides.protocols import implements
+from overrides.stats import reset_stats, stats
+from overrides.validators import Sampling
 
 
 __all__ = [
     "__VERSION__",
     "override",
     "overrides",
+    "frameless_override",
     "final",
     "EnforceOverrides",
     "EnforceOverridesMeta",
+    "verify_all",
+    "check_class",
+    "validate_class",
+    "implements",
+    "Sampling",
+    "CheckLevel",
+    "get_check_level",
+    "set_check_level",
+    "stats",
+    "reset_stats",
 ]
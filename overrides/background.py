@@ -0,0 +1,200 @@
+"""Check overrides in the background instead of while modules are imported.
+
+While background checking is active every `@override` is recorded as if it was
+decorated with `defer_check=True`, and the recorded overrides are checked either
+by a thread pool or by an asyncio task working in short time slices between
+iterations of the event loop:
+
+    from overrides import background
+
+    background.start(on_error="raise")   # before importing the application
+    import application
+
+Overrides that fail the check are reported to the `on_error` handler:
+
+- `"log"` logs the error to the `overrides` logger,
+- `"raise"` makes the next call of the overriding method raise the error, or
+  logs it if the class of the method cannot be found,
+- `"exit"` logs the error and exits the process,
+- or any callable taking the method and the error.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional, Union
+
+from overrides.overrides import (
+    _claim_listeners,
+    _replace_in_owner,
+    _take_pending_claim,
+    _validate_claim,
+)
+
+ErrorHandler = Callable[[Callable, TypeError], None]
+
+logger = logging.getLogger("overrides")
+
+_lock = threading.Lock()
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_scheduled: int = 0
+_max_workers: int = 0
+_idle = threading.Condition(_lock)
+_task: Optional["asyncio.Task[None]"] = None
+_error_handler: Optional[ErrorHandler] = None
+
+
+def log_error(method: Callable, error: TypeError) -> None:
+    logger.error("Invalid override %s: %s", method.__qualname__, error)
+
+
+def raise_on_next_call(method: Callable, error: TypeError) -> None:
+    @functools.wraps(method)
+    def raising(*args, **kwargs):
+        raise error
+
+    if not _replace_in_owner(method, raising):
+        log_error(method, error)
+
+
+def exit_process(method: Callable, error: TypeError) -> None:
+    logger.critical("Invalid override %s: %s", method.__qualname__, error)
+    os._exit(1)
+
+
+ERROR_HANDLERS = {
+    "log": log_error,
+    "raise": raise_on_next_call,
+    "exit": exit_process,
+}
+
+
+def start(
+    mode: str = "thread",
+    on_error: Union[str, ErrorHandler] = "log",
+    *,
+    max_workers: int = 1,
+    time_slice: float = 0.005,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> None:
+    """Start checking overrides in the background.
+
+    :param mode: `"thread"` to check in a thread pool, `"asyncio"` to check in a
+        task of `loop`, or of the running event loop.
+    :param on_error: how to report overrides that fail the check.
+    :param max_workers: number of threads checking overrides in `"thread"` mode.
+    :param time_slice: seconds spent checking before yielding to the event loop
+        in `"asyncio"` mode.
+    """
+    global _error_handler, _executor, _max_workers, _task
+    stop()
+    if isinstance(on_error, str):
+        try:
+            _error_handler = ERROR_HANDLERS[on_error]
+        except KeyError:
+            raise ValueError(
+                f"Unknown error handler {on_error!r}, use one of {', '.join(ERROR_HANDLERS)}"
+            )
+    else:
+        _error_handler = on_error
+    if mode == "thread":
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="overrides"
+        )
+        _max_workers = max_workers
+        listener = _schedule_workers
+    elif mode == "asyncio":
+        loop = loop or asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        _task = loop.create_task(_check_in_time_slices(wakeup, time_slice))
+
+        def listener() -> None:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    else:
+        raise ValueError(f"Unknown mode {mode!r}, use 'thread' or 'asyncio'")
+    _claim_listeners.append(listener)
+    listener()
+
+
+def stop() -> None:
+    """Stop checking overrides in the background. Overrides recorded but not
+    checked yet stay pending for `verify_all()`.
+    """
+    global _executor, _task
+    _claim_listeners.clear()
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    if _task is not None:
+        _task.cancel()
+        _task = None
+
+
+def wait(timeout: Optional[float] = None) -> bool:
+    """Wait until the thread pool has checked all recorded overrides.
+
+    :return: False if `timeout` seconds passed before that.
+    """
+    with _idle:
+        return _idle.wait_for(lambda: _scheduled == 0, timeout)
+
+
+def _schedule_workers() -> None:
+    global _scheduled
+    with _lock:
+        executor = _executor
+        if executor is None or _scheduled >= _max_workers:
+            return
+        _scheduled += 1
+    try:
+        executor.submit(_check_in_thread)
+    except RuntimeError:  # The executor has been shut down.
+        _finish_worker()
+
+
+def _check_in_thread() -> None:
+    try:
+        while _check_next():
+            pass
+    finally:
+        _finish_worker()
+
+
+def _finish_worker() -> None:
+    global _scheduled
+    with _idle:
+        _scheduled -= 1
+        _idle.notify_all()
+
+
+async def _check_in_time_slices(wakeup: asyncio.Event, time_slice: float) -> None:
+    while True:
+        deadline = time.perf_counter() + time_slice
+        while time.perf_counter() < deadline:
+            if not _check_next():
+                wakeup.clear()
+                await wakeup.wait()
+                break
+        else:
+            await asyncio.sleep(0)
+
+
+def _check_next() -> bool:
+    """Check the oldest recorded override.
+
+    :return: False if there was no override to check.
+    """
+    claim = _take_pending_claim()
+    if claim is None:
+        return False
+    try:
+        _validate_claim(claim)
+    except TypeError as error:
+        handler = _error_handler or log_error
+        handler(claim.method, error)
+    return True
@@ -0,0 +1,192 @@
+"""Check all modules of packages in a pool of worker processes.
+
+python -m overrides check <package> [<package> ...] [--jobs N] [--format json]
+
+The workers import the modules at the `full` check level and record every
+`@override` instead of checking it right away, so that one module can report
+all of its errors and forward references defined later in the module resolve.
+Errors found by `EnforceOverridesMeta` are reported without stopping the class
+from being created. Methods decorated with `check_at_runtime=True` are checked
+only when they are called.
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import importlib.util
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import sys
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from overrides.config import CheckLevel, set_check_level
+from overrides.overrides import (
+    _claim_listeners,
+    _error_listeners,
+    _take_pending_claim,
+    _validate_claim,
+)
+
+
+class Violation(NamedTuple):
+    module: str
+    """Module defining the offending method or class."""
+    name: str
+    """Qualified name of the offending method or class."""
+    file: Optional[str]
+    line: Optional[int]
+    message: str
+
+
+# Violations found by a worker process in modules it has not been asked to check
+# yet, modules it imported as dependencies of the modules it checked.
+_violations_by_module: Dict[str, List[Violation]] = {}
+
+
+def find_modules(package: str) -> List[str]:
+    """Get the names of `package` and all modules and packages below it, without
+    importing them.
+
+    :raises ValueError: if `package` cannot be found.
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        raise ValueError(f"No module named {package!r}")
+    names = [package]
+    if spec.submodule_search_locations is not None:
+        names.extend(_walk(list(spec.submodule_search_locations), package + "."))
+    return names
+
+
+def _walk(paths: List[str], prefix: str) -> Iterator[str]:
+    for module in pkgutil.iter_modules(paths, prefix):
+        yield module.name
+        if module.ispkg:
+            path = getattr(module.module_finder, "path", None)
+            if path is not None:
+                last = module.name.rpartition(".")[2]
+                yield from _walk([os.path.join(path, last)], module.name + ".")
+
+
+def check_modules(names: Sequence[str], jobs: Optional[int] = None) -> List[Violation]:
+    """Import the modules in `names` in `jobs` worker processes and get the
+    violations found in them, sorted by location.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunk_size = max(1, len(names) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+        jobs, initializer=_start_worker
+    ) as executor:
+        results = executor.map(_check_module, names, chunksize=chunk_size)
+        violations = list(itertools.chain.from_iterable(results))
+    return sorted(violations, key=lambda v: (v.file or "", v.line or 0, v.message))
+
+
+def _start_worker() -> None:
+    set_check_level(CheckLevel.FULL)
+    _claim_listeners.append(_ignore)
+    _error_listeners.append(_record_violation)
+
+
+def _ignore() -> None:
+    pass
+
+
+def _check_module(name: str) -> List[Violation]:
+    try:
+        importlib.import_module(name)
+    except (Exception, SystemExit) as error:
+        _violations_by_module.setdefault(name, []).append(
+            Violation(
+                name,
+                name,
+                _get_module_file(name),
+                None,
+                f"Import failed: {type(error).__name__}: {error}",
+            )
+        )
+    while True:
+        claim = _take_pending_claim()
+        if claim is None:
+            break
+        try:
+            _validate_claim(claim)
+        except TypeError as error:
+            _record_violation(claim.method, error)
+    return _violations_by_module.pop(name, [])
+
+
+def _record_violation(culprit: object, error: TypeError) -> None:
+    module = getattr(culprit, "__module__", None) or "<unknown>"
+    name = getattr(culprit, "__qualname__", None) or repr(culprit)
+    file, line = _get_location(culprit)
+    _violations_by_module.setdefault(module, []).append(
+        Violation(module, name, file, line, str(error))
+    )
+
+
+def _get_location(culprit: object):
+    code = getattr(culprit, "__code__", None)
+    if code is not None:
+        return code.co_filename, code.co_firstlineno
+    try:
+        _, line = inspect.getsourcelines(culprit)  # type: ignore
+        return inspect.getsourcefile(culprit), line  # type: ignore
+    except (OSError, TypeError):
+        module = sys.modules.get(getattr(culprit, "__module__", ""))
+        return getattr(module, "__file__", None), None
+
+
+def _get_module_file(name: str) -> Optional[str]:
+    try:
+        spec = importlib.util.find_spec(name)
+    except Exception:
+        return None
+    return spec.origin if spec is not None else None
+
+
+def _format_text(violation: Violation) -> str:
+    location = violation.file or violation.module
+    if violation.line is not None:
+        location = f"{location}:{violation.line}"
+    return f"{location}: {violation.name}: {violation.message}"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m overrides")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check = commands.add_parser(
+        "check", help="check all modules of packages and report all errors"
+    )
+    check.add_argument("packages", nargs="+", metavar="package")
+    check.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    check.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(argv)
+
+    names: List[str] = []
+    for package in args.packages:
+        try:
+            names.extend(find_modules(package))
+        except (ImportError, ValueError) as error:
+            parser.error(str(error))
+    violations = check_modules(names, args.jobs)
+    if args.format == "json":
+        json.dump([v._asdict() for v in violations], sys.stdout, indent=2)
+        print()
+    else:
+        for violation in violations:
+            print(_format_text(violation))
+        print(
+            f"Checked {len(names)} modules, found {len(violations)} errors.",
+            file=sys.stderr,
+        )
+    return 1 if violations else 0
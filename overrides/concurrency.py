@@ -0,0 +1,129 @@
+"""How overrides behaves when classes are defined in several threads at once, as
+when modules are imported in parallel on free-threaded (PEP 703) builds of
+CPython.
+
+- No lock is held while signatures are extracted, annotations evaluated, modules
+  imported or any other code of the user runs. Imports running in different
+  threads never wait for each other because of overrides.
+- Caches are filled by computing the value first and then storing it with a
+  single dictionary operation. Threads missing the same entry at once may both
+  compute it, and get equal values. Entries that must be unique, like interned
+  normalized types, are stored with `dict.setdefault`, so that all threads use
+  the first one stored.
+- Bounded caches are `StripedCache`s: lookups, insertions and evictions take
+  the lock of one of the stripes the keys are spread over, so threads only wait
+  for each other when they use keys of the same stripe.
+- Weak sets and weak dictionaries run Python code while they are iterated, so
+  they are iterated through `snapshot`, which is not disturbed by other threads
+  changing them.
+- `__override__`, `__final__` and `__ignored__` are only ever set to True, with
+  `set_flag`, which does not write them again once they are set. Functions
+  shared by many classes, like the methods of a metaclass, are then only read.
+- The counters of `stats()` are kept per thread and added up when read. The
+  hit and miss counts of the signature cache may miss some concurrent updates.
+- Overrides waiting for a deferred or background check are kept in a dictionary
+  and a deque changed with single operations. An override checked by two
+  threads at once is checked twice.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, TypeVar
+
+_T = TypeVar("_T")
+
+# Number of stripes of a `StripedCache`.
+STRIPES = 16
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Stripe:
+    __slots__ = ("entries", "lock", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.entries: Dict[Any, Any] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+
+_missing = object()
+
+
+class StripedCache:
+    """A cache of at most about `maxsize` values of hashable keys, spread over
+    stripes by the hash of the keys. When a stripe is full its least recently
+    used entry is evicted.
+    """
+
+    __slots__ = ("maxsize", "_stripes", "_stripe_size")
+
+    def __init__(self, maxsize: int, stripes: int = STRIPES):
+        self.maxsize = maxsize
+        self._stripes = tuple(_Stripe() for _ in range(stripes))
+        self._stripe_size = max(1, maxsize // stripes)
+
+    def get(self, key, default=None):
+        """Get the value cached for `key`, or `default` if there is none.
+
+        :raises TypeError: if `key` is not hashable.
+        """
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        with stripe.lock:
+            entries = stripe.entries
+            value = entries.pop(key, _missing)
+            if value is _missing:
+                stripe.misses += 1
+                return default
+            entries[key] = value  # Now the most recently used entry.
+            stripe.hits += 1
+        return value
+
+    def set(self, key, value) -> None:
+        """Cache `value` for `key`."""
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        with stripe.lock:
+            entries = stripe.entries
+            if key not in entries and len(entries) >= self._stripe_size:
+                del entries[next(iter(entries))]
+            entries[key] = value
+
+    def clear(self) -> None:
+        """Remove all values and reset the statistics."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.hits = stripe.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Report hits, misses, maximum size and size of the cache."""
+        return CacheInfo(
+            sum(stripe.hits for stripe in self._stripes),
+            sum(stripe.misses for stripe in self._stripes),
+            self.maxsize,
+            sum(len(stripe.entries) for stripe in self._stripes),
+        )
+
+
+def snapshot(container: Iterable[_T]) -> List[_T]:
+    """Get the items of a container that other threads may change meanwhile.
+
+    Iterating a set or dictionary that grows or shrinks raises RuntimeError, the
+    iteration is then repeated.
+    """
+    while True:
+        try:
+            return list(container)
+        except RuntimeError:
+            continue
+
+
+def set_flag(obj: object, name: str) -> None:
+    """Set the attribute `name` of `obj` to True, unless it already is."""
+    if getattr(obj, name, False) is not True:
+        setattr(obj, name, True)
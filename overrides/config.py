@@ -0,0 +1,94 @@
+"""How much work `override`, `final` and `EnforceOverridesMeta` do.
+
+The check level is taken from the first of:
+
+1. `set_check_level` called at runtime,
+2. the `OVERRIDES_CHECK_LEVEL` environment variable,
+3. `check_level` in the `[tool.overrides]` table of the nearest `pyproject.toml`
+   in or above the current working directory,
+4. `mark` when Python runs with `-O`, `full` otherwise.
+"""
+
+import enum
+import os
+import sys
+from typing import Optional, Union
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:
+        tomllib = None  # type: ignore
+
+ENVIRONMENT_VARIABLE = "OVERRIDES_CHECK_LEVEL"
+
+
+class CheckLevel(enum.IntEnum):
+    OFF = 0
+    """Decorators return the function untouched, classes are not checked."""
+    MARK = 1
+    """Decorators only set `__override__` and `__final__`, nothing is checked."""
+    STRUCTURAL = 2
+    """Everything but type hints is checked: parameter kinds, names and order."""
+    FULL = 3
+    """Everything is checked, including type hints."""
+
+
+_check_level: Optional[CheckLevel] = None
+
+
+def get_check_level() -> CheckLevel:
+    global _check_level
+    if _check_level is None:
+        _check_level = _default_check_level()
+    return _check_level
+
+
+def set_check_level(level: Union[CheckLevel, str, None]) -> None:
+    """Set the check level for decorators and classes created from now on.
+    `None` goes back to the level from the environment or `pyproject.toml`.
+
+    :raises ValueError: if `level` is not the name of a `CheckLevel`.
+    """
+    global _check_level
+    _check_level = None if level is None else _parse_check_level(level)
+
+
+def _parse_check_level(level: Union[CheckLevel, str]) -> CheckLevel:
+    if isinstance(level, CheckLevel):
+        return level
+    try:
+        return CheckLevel[level.strip().upper()]
+    except KeyError:
+        choices = ", ".join(level.name.lower() for level in CheckLevel)
+        raise ValueError(f"Unknown check level {level!r}, use one of {choices}")
+
+
+def _default_check_level() -> CheckLevel:
+    level = os.environ.get(ENVIRONMENT_VARIABLE)
+    if level:
+        return _parse_check_level(level)
+    level = _read_pyproject_check_level(os.getcwd())
+    if level:
+        return _parse_check_level(level)
+    return CheckLevel.MARK if sys.flags.optimize else CheckLevel.FULL
+
+
+def _read_pyproject_check_level(directory: str) -> Optional[str]:
+    if tomllib is None:
+        return None
+    while True:
+        path = os.path.join(directory, "pyproject.toml")
+        if os.path.isfile(path):
+            try:
+                with open(path, "rb") as f:
+                    config = tomllib.load(f)
+            except (OSError, ValueError):
+                return None
+            return config.get("tool", {}).get("overrides", {}).get("check_level")
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
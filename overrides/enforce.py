@@ -1,36 +1,210 @@
+import functools
 import types
+import weakref
 from abc import ABCMeta
+from typing import Callable, Dict, FrozenSet, Iterator, List, Mapping, NamedTuple, Tuple
 
+from overrides.concurrency import set_flag
+from overrides.config import CheckLevel, get_check_level
+from overrides.overrides import (
+    _OverrideDescriptor,
+    _has_deferred_check,
+    _raise_or_report,
+    _verify_pending,
+)
+from overrides.stats import _add_time, _count, clock
 
-class EnforceOverridesMeta(ABCMeta):
+# State of the attributes of a class, see `_class_state`.
+_ClassState = Tuple[Tuple[str, ...], Tuple[int, ...]]
+
+# Metaclasses whose methods have been marked as ignored, with the state of the
+# metaclass at that time as returned by `_unwatched_state`.
+_ignored_metaclass_scans: (
+    "weakref.WeakKeyDictionary[type, Tuple[_ClassState, ...]]"
+) = weakref.WeakKeyDictionary()
+
+# Overrides decorated with `defer_check=True` in the body of each class or of its
+# bases, for the classes that have not been instantiated yet.
+_pending_by_class: "weakref.WeakKeyDictionary[type, List[Callable]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Flags describing a member of a class as seen by `EnforceOverridesMeta`.
+_CALLABLE = 1
+_FINAL = 2
+_IGNORED = 4
+
+# Flags of the members defined directly in a class, and of all members found on
+# a class through its MRO. They are only kept for classes whose changes are seen,
+# see `_is_watched`, and updated by `EnforceOverridesMeta.__setattr__` and
+# `__delattr__`.
+_MemberFlags = Dict[str, int]
+_own_member_flags: "weakref.WeakKeyDictionary[type, _MemberFlags]" = (
+    weakref.WeakKeyDictionary()
+)
+_member_flags: "weakref.WeakKeyDictionary[type, _MemberFlags]" = (
+    weakref.WeakKeyDictionary()
+)
+# Flags of all members a metaclass provides to its classes, together with the
+# state they were computed in as returned by `_unwatched_state`.
+_metaclass_member_flags: (
+    "weakref.WeakKeyDictionary[type, Tuple[Tuple[_ClassState, ...], _MemberFlags]]"
+) = weakref.WeakKeyDictionary()
+
+# `Py_TPFLAGS_IMMUTABLETYPE`, set on the types whose attributes cannot be changed.
+_IMMUTABLE_TYPE = 1 << 8
+
+
+class OverrideIndex(NamedTuple):
+    """Names of the members of a class that matter when subclassing it."""
+
+    callables: FrozenSet[str]
+    """Members that can only be overridden with `@override`."""
+    finals: FrozenSet[str]
+    """Members decorated with `@final`, these cannot be overridden."""
+    ignored: FrozenSet[str]
+    """Callable members provided by the metaclass, these can be overridden freely."""
+
+
+class _EnforceOverridesMetaType(type):
+    """Metaclass of `EnforceOverridesMeta`, which sees changes made to it and to
+    the metaclasses derived from it, so that they are only scanned again then.
+    """
+
+    def __setattr__(mcls, name, value):
+        super().__setattr__(name, value)
+        _metaclass_changed(mcls)
+
+    def __delattr__(mcls, name):
+        super().__delattr__(name)
+        _metaclass_changed(mcls)
+
+
+class EnforceOverridesMeta(ABCMeta, metaclass=_EnforceOverridesMetaType):
     def __new__(mcls, name, bases, namespace, **kwargs):
-        # Ignore any methods defined on the metaclass when enforcing overrides.
+        if get_check_level() < CheckLevel.STRUCTURAL:
+            return super().__new__(mcls, name, bases, namespace, **kwargs)
+        _count("enforce_class_creations")
+        start = clock()
+        try:
+            mcls._ignore_metaclass_methods(mcls)
+
+            cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+            metaclass_members = {
+                metaclass: _get_metaclass_member_flags(metaclass)
+                for metaclass in set(map(type, bases))
+            }
+            base_members = [
+                (base, _get_base_member_flags(base), metaclass_members[type(base)])
+                for base in bases
+            ]
+            for name, value in namespace.items():
+                try:
+                    mcls._check_if_overrides_final_method(name, base_members)
+                    if not name.startswith("__"):
+                        value = mcls._handle_special_value(value)
+                        mcls._check_if_overrides_without_overrides_decorator(
+                            name, value, base_members
+                        )
+                except TypeError as error:
+                    _raise_or_report(
+                        value if isinstance(value, types.FunctionType) else cls, error
+                    )
+            pending = [
+                value
+                for value in map(mcls._handle_special_value, namespace.values())
+                if _has_deferred_check(value)
+            ]
+            if _pending_by_class:
+                # Also checked by subclasses, whose `__init__` may not call the
+                # one of the class.
+                for base in cls.__mro__[1:]:
+                    pending.extend(
+                        value
+                        for value in _pending_by_class.get(base, ())
+                        if _has_deferred_check(value)
+                    )
+            if pending:
+                _pending_by_class[cls] = pending
+                mcls._check_pending_on_first_instantiation(cls, pending)
+            if len(bases) == 1 and bases[0] in _member_flags:
+                # Cheap to build from the flags of the base now, subclasses of
+                # classes with several bases build them when first created.
+                _get_member_flags(cls)
+            return cls
+        finally:
+            _add_time("enforce_class_creation", start)
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        _member_changed(cls, name)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        _member_changed(cls, name)
+
+    @staticmethod
+    def _check_pending_on_first_instantiation(cls, pending: List[Callable]):
+        """Check the overrides in `pending` that were decorated with
+        `defer_check=True` when the first instance of `cls` is created. Only
+        those classes pay for the check, it is removed again once the overrides
+        are valid.
+
+        `__init__` is wrapped rather than `__new__`, since CPython keeps calling
+        a `__new__` that was deleted from a class through its Python slot.
+        """
+        original_init = vars(cls).get("__init__")
+
+        def __init__(self, *args, **kwargs):
+            _verify_pending(pending)
+            _pending_by_class.pop(cls, None)
+            if vars(cls).get("__init__") is __init__:
+                try:
+                    if original_init is None:
+                        delattr(cls, "__init__")
+                    else:
+                        setattr(cls, "__init__", original_init)
+                except AttributeError:  # Removed by another thread meanwhile.
+                    pass
+            if original_init is not None:
+                return original_init(self, *args, **kwargs)
+            init = super(cls, self).__init__
+            if init == object.__init__.__get__(self):
+                if (args or kwargs) and type(self).__new__ is object.__new__:
+                    raise TypeError(f"{type(self).__qualname__}() takes no arguments")
+                return init()
+            return init(*args, **kwargs)
+
+        if original_init is not None:
+            __init__ = functools.wraps(original_init)(__init__)
+        setattr(cls, "__init__", __init__)
+
+    @staticmethod
+    def _ignore_metaclass_methods(mcls):
+        """Ignore any methods defined on the metaclass when enforcing overrides.
+        The metaclass is scanned again only if attributes have been added to,
+        removed from or replaced on it since the last scan.
+        """
+        state = _unwatched_state(mcls)
+        if _ignored_metaclass_scans.get(mcls) == state:
+            return
         for method in dir(mcls):
             if not method.startswith("__") and method != "mro":
                 value = getattr(mcls, method)
                 if not isinstance(
                     value, (bool, str, int, float, tuple, list, dict, types.MethodType)
                 ):
-                    setattr(getattr(mcls, method), "__ignored__", True)
-
-        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
-        for name, value in namespace.items():
-            mcls._check_if_overrides_final_method(name, bases)
-            if not name.startswith("__"):
-                value = mcls._handle_special_value(value)
-                mcls._check_if_overrides_without_overrides_decorator(name, value, bases)
-        return cls
+                    set_flag(getattr(mcls, method), "__ignored__")
+        _ignored_metaclass_scans[mcls] = state
 
     @staticmethod
-    def _check_if_overrides_without_overrides_decorator(name, value, bases):
+    def _check_if_overrides_without_overrides_decorator(name, value, base_members):
         is_override = getattr(value, "__override__", False)
-        for base in bases:
-            base_class_method = getattr(base, name, False)
-            if (
-                not base_class_method
-                or not callable(base_class_method)
-                or getattr(base_class_method, "__ignored__", False)
-            ):
+        for base, members, metaclass_members in base_members:
+            flags = members.get(name)
+            if flags is None:
+                flags = metaclass_members.get(name, 0)
+            if not flags & _CALLABLE or flags & _IGNORED:
                 continue
             if not is_override:
                 raise TypeError(
@@ -38,24 +212,222 @@ class EnforceOverridesMeta(ABCMeta):
                 )
 
     @staticmethod
-    def _check_if_overrides_final_method(name, bases):
-        for base in bases:
-            base_class_method = getattr(base, name, False)
+    def _check_if_overrides_final_method(name, base_members):
+        for base, members, metaclass_members in base_members:
+            flags = members.get(name)
+            if flags is None:
+                flags = metaclass_members.get(name, 0)
             # `__final__` is added by `@final` decorator
-            if getattr(base_class_method, "__final__", False):
+            if flags & _FINAL:
                 raise TypeError(
                     f"Method {name} is finalized in {base}, it cannot be overridden"
                 )
 
     @staticmethod
     def _handle_special_value(value):
-        if isinstance(value, classmethod) or isinstance(value, staticmethod):
+        if isinstance(value, (classmethod, staticmethod)) and isinstance(
+            value.__func__, _OverrideDescriptor
+        ):
+            value = value.__func__
+        elif isinstance(value, classmethod) or isinstance(value, staticmethod):
             value = value.__get__(None, dict)
         elif isinstance(value, property):
             value = value.fget
+        if isinstance(value, _OverrideDescriptor):
+            return EnforceOverridesMeta._handle_special_value(value.method)
         return value
 
 
+def _class_state(klass: type) -> _ClassState:
+    """Get the names and the identities of the values of the attributes of
+    `klass`, which change when an attribute is added, removed or replaced.
+    """
+    namespace = dict(vars(klass))
+    return tuple(namespace), tuple(map(id, namespace.values()))
+
+
+def _unwatched_state(cls: type) -> Tuple[_ClassState, ...]:
+    """Get the state of the classes in the MRO of `cls` whose changes are not
+    seen otherwise, see `_is_watched`.
+    """
+    return tuple(_class_state(klass) for klass in cls.__mro__ if not _is_watched(klass))
+
+
+def get_override_index(cls: type) -> OverrideIndex:
+    """Get the names of the members of `cls` that are checked by
+    `EnforceOverridesMeta` when a subclass of `cls` is created.
+    """
+    members = dict(_get_metaclass_member_flags(type(cls)))
+    members.update(_get_member_flags(cls))
+    return OverrideIndex(
+        callables=frozenset(
+            name
+            for name, flags in members.items()
+            if flags & _CALLABLE and not flags & _IGNORED
+        ),
+        finals=frozenset(name for name, flags in members.items() if flags & _FINAL),
+        ignored=frozenset(
+            name
+            for name, flags in members.items()
+            if flags & _CALLABLE and flags & _IGNORED
+        ),
+    )
+
+
+def _is_watched(klass: type) -> bool:
+    """Whether all changes to the attributes of `klass` are seen: those of classes
+    created by `EnforceOverridesMeta` and of the metaclasses derived from it are
+    reported by `__setattr__` and `__delattr__` of their metaclass, builtin types
+    cannot be changed. The members of other classes, like mixins, are looked up
+    again whenever they are needed.
+    """
+    return isinstance(klass, (EnforceOverridesMeta, _EnforceOverridesMetaType)) or bool(
+        klass.__flags__ & _IMMUTABLE_TYPE
+    )
+
+
+def _get_base_member_flags(base: type) -> Mapping[str, int]:
+    """Get the flags of the members of `base` that a new subclass is checked
+    against. They are looked up by name, as needed, if changes to a class in the
+    MRO of `base` are not seen, since building the flags of every member would
+    take longer than the checks.
+    """
+    if not _is_watched(base):
+        return _FoundMemberFlags(base)
+    members = _member_flags.get(base)
+    if members is not None:
+        return members
+    if all(map(_is_watched, base.__mro__)):
+        return _get_member_flags(base)
+    return _FoundMemberFlags(base)
+
+
+class _FoundMemberFlags(Mapping[str, int]):
+    """Flags of the members of a class, looked up by name when they are needed."""
+
+    __slots__ = ("_cls",)
+
+    def __init__(self, cls: type):
+        self._cls = cls
+
+    def __getitem__(self, name: str) -> int:
+        flags = self.get(name)
+        if flags is None:
+            raise KeyError(name)
+        return flags
+
+    def get(self, name, default=None):
+        for klass in self._cls.__mro__:
+            if name in vars(klass):
+                return _get_flags(self._cls, name)
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_get_member_flags(self._cls))
+
+    def __len__(self) -> int:
+        return len(_get_member_flags(self._cls))
+
+
+def _get_member_flags(cls: type) -> _MemberFlags:
+    """Get the flags of every member defined in `cls` or its bases, as
+    `getattr(cls, name)` would find them. Built from the flags of its base when
+    there is only one, and kept only if `cls` and its bases are all watched.
+    """
+    members = _member_flags.get(cls)
+    if members is not None:
+        return members
+    bases = cls.__bases__
+    base_members = _member_flags.get(bases[0]) if len(bases) == 1 else None
+    if base_members is not None:
+        members = dict(base_members)
+        members.update(_get_own_member_flags(cls))
+        watched = _is_watched(cls)
+    else:
+        members = {}
+        for klass in reversed(cls.__mro__):
+            members.update(_get_own_member_flags(klass))
+        watched = all(map(_is_watched, cls.__mro__))
+    if watched:
+        _member_flags[cls] = members
+    return members
+
+
+def _get_own_member_flags(klass: type) -> _MemberFlags:
+    members = _own_member_flags.get(klass)
+    if members is not None:
+        return members
+    members = {name: _get_flags(klass, name) for name in list(vars(klass))}
+    if _is_watched(klass):
+        _own_member_flags[klass] = members
+    return members
+
+
+def _member_changed(cls: type, name: str) -> None:
+    """Update the flags of `cls` after `name` was set on or deleted from it. The
+    flags of its subclasses are forgotten if the member found on `cls` changed.
+    """
+    own = _own_member_flags.get(cls)
+    if own is not None:
+        own = dict(own)
+        if name in vars(cls):
+            own[name] = _get_flags(cls, name)
+        else:
+            own.pop(name, None)
+        _own_member_flags[cls] = own
+    members = _member_flags.get(cls)
+    if members is not None:
+        if any(name in vars(klass) for klass in cls.__mro__):
+            if members.get(name) == _get_flags(cls, name):
+                return
+        elif name not in members:
+            return
+    classes = [cls]
+    while classes:
+        klass = classes.pop()
+        _member_flags.pop(klass, None)
+        classes.extend(type.__subclasses__(klass))
+
+
+def _metaclass_changed(mcls: type) -> None:
+    """Forget the scans and flags of `mcls` and of the metaclasses derived from
+    it after one of its attributes was set or deleted.
+    """
+    metaclasses = [mcls]
+    while metaclasses:
+        metaclass = metaclasses.pop()
+        _ignored_metaclass_scans.pop(metaclass, None)
+        _metaclass_member_flags.pop(metaclass, None)
+        metaclasses.extend(type.__subclasses__(metaclass))
+
+
+def _get_metaclass_member_flags(mcls: type) -> _MemberFlags:
+    state = _unwatched_state(mcls)
+    cached = _metaclass_member_flags.get(mcls)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+    members: _MemberFlags = {}
+    for klass in reversed(mcls.__mro__):
+        members.update((name, _get_flags(mcls, name)) for name in list(vars(klass)))
+    _metaclass_member_flags[mcls] = (state, members)
+    return members
+
+
+def _get_flags(owner: type, name: str) -> int:
+    try:
+        value = getattr(owner, name, False)
+    except Exception:
+        return 0
+    flags = 0
+    if callable(value) and value:
+        flags |= _CALLABLE
+    if getattr(value, "__final__", False):
+        flags |= _FINAL
+    if getattr(value, "__ignored__", False):
+        flags |= _IGNORED
+    return flags
+
+
 class EnforceOverrides(metaclass=EnforceOverridesMeta):
     "Use this as the parent class for your custom classes"
     pass
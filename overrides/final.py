@@ -16,6 +16,9 @@
 from types import FunctionType
 from typing import Callable, TypeVar, Union
 
+from overrides.concurrency import set_flag
+from overrides.config import CheckLevel, get_check_level
+
 _WrappedMethod = TypeVar("_WrappedMethod", bound=Union[FunctionType, Callable])
 
 
@@ -41,5 +44,6 @@ def final(method: _WrappedMethod) -> _WrappedMethod:
     :raises AssertionError: if there exists a match in sub classes for the method name
     :return: method
     """
-    setattr(method, "__final__", True)
+    if get_check_level() is not CheckLevel.OFF:
+        set_flag(method, "__final__")
     return method
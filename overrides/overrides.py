@@ -14,20 +14,80 @@
 #  limitations under the License.
 #
 
+import collections
 import dis
 import functools
-import inspect
 import sys
-from types import FrameType, FunctionType
-from typing import Callable, List, Optional, Tuple, TypeVar, Union, overload
+import weakref
+from types import CodeType, FrameType, FunctionType
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 __VERSION__ = "7.7.0"
 
-from overrides.signature import ensure_signature_is_compatible
+from overrides import persistent_cache
+from overrides.concurrency import set_flag, snapshot
+from overrides.config import CheckLevel, get_check_level
+from overrides.signature import ensure_signature_is_compatible, is_static_method
+from overrides.stats import _add_time, _count, clock
+from overrides.validators import Sampling, checking_values
 
 _WrappedMethod = TypeVar("_WrappedMethod", bound=Union[FunctionType, Callable])
 _DecoratorMethod = Callable[[_WrappedMethod], _WrappedMethod]
 
+# Base class names found for a class statement, keyed by the code object
+# containing the statement and the offset of the instruction building the class.
+_base_class_names_cache: (
+    "weakref.WeakKeyDictionary[CodeType, Dict[int, List[List[str]]]]"
+) = weakref.WeakKeyDictionary()
+
+
+class _OverrideClaim(NamedTuple):
+    method: Callable
+    super_class: type
+    check_signature: bool
+    check_types: bool
+    deferred: bool
+    """Decorated with `defer_check=True`, rather than recorded for the background."""
+
+
+# Overrides decorated with `defer_check=True` or recorded to be checked in the
+# background that have not been checked yet, keyed by the decorated method.
+_pending_claims: Dict[Callable, _OverrideClaim] = {}
+# Functions called whenever an override has been recorded to be checked in the
+# background, and the methods of those overrides, oldest first. While there are
+# any listeners, all overrides are recorded as if decorated with `defer_check=True`.
+_claim_listeners: List[Callable[[], None]] = []
+_background_claims: Deque[Callable] = collections.deque()
+# Functions called with the offending method or class and the error instead of
+# raising errors that do not stop a class from being created. Used to report all
+# errors of a module at once.
+_error_listeners: List[Callable[[object, TypeError], None]] = []
+
+# Methods that have been checked, or are going to be checked, by the override
+# decorators, and are skipped by `validate_class`.
+_handled_overrides: "weakref.WeakSet[Callable]" = weakref.WeakSet()
+
+# Base classes resolved for a class statement whose bases are plain names, keyed
+# like `_base_class_names_cache`, with the identity of the namespace the names
+# were looked up in and the objects they were bound to. Rebinding one of the
+# names invalidates the entry. Frames are never kept.
+_base_classes_cache: (
+    "weakref.WeakKeyDictionary[CodeType, Dict[int, Tuple[int, tuple, List]]]"
+) = weakref.WeakKeyDictionary()
+_missing = object()
+
 
 @overload
 def overrides(
@@ -35,6 +95,8 @@ def overrides(
     *,
     check_signature: bool = True,
     check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> _DecoratorMethod:
     ...
 
@@ -45,6 +107,8 @@ def overrides(
     *,
     check_signature: bool = True,
     check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> _WrappedMethod:
     ...
 
@@ -54,6 +118,8 @@ def overrides(
     *,
     check_signature: bool = True,
     check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> Union[_DecoratorMethod, _WrappedMethod]:
     """Decorator to indicate that the decorated method overrides a method in
     superclass.
@@ -75,17 +141,27 @@ def overrides(
 
     :param check_signature: Whether or not to check the signature of the overridden method.
     :param check_at_runtime: Whether or not to check the overridden method at runtime.
+    :param defer_check: Whether or not to only record the override here and check it
+        on first instantiation of an `EnforceOverrides` class or in `verify_all()`.
+    :param check_values: Whether or not to check on every call that the arguments
+        are of the types the method is annotated with and the returned value of the
+        return type of the overridden method, or a `Sampling` of the calls to check.
+        Only done at the `full` check level.
     :raises AssertionError: if no match in super classes for the method name
     :return: method with possibly added (if the method doesn't have one)
         docstring from super class
     """
     if method is not None:
-        return _overrides(method, check_signature, check_at_runtime)
+        return _overrides(
+            method, check_signature, check_at_runtime, defer_check, check_values
+        )
     else:
         return functools.partial(
             overrides,
             check_signature=check_signature,
             check_at_runtime=check_at_runtime,
+            defer_check=defer_check,
+            check_values=check_values,
         )
 
 
@@ -95,6 +171,8 @@ def override(
     *,
     check_signature: bool = True,
     check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> _DecoratorMethod:
     ...
 
@@ -105,6 +183,8 @@ def override(
     *,
     check_signature: bool = True,
     check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> _WrappedMethod:
     ...
 
@@ -114,6 +194,8 @@ def override(
     *,
     check_signature: bool = True,
     check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> Union[_DecoratorMethod, _WrappedMethod]:
     """Decorator to indicate that the decorated method overrides a method in
     superclass.
@@ -135,17 +217,27 @@ def override(
 
     :param check_signature: Whether or not to check the signature of the overridden method.
     :param check_at_runtime: Whether or not to check the overridden method at runtime.
+    :param defer_check: Whether or not to only record the override here and check it
+        on first instantiation of an `EnforceOverrides` class or in `verify_all()`.
+    :param check_values: Whether or not to check on every call that the arguments
+        are of the types the method is annotated with and the returned value of the
+        return type of the overridden method, or a `Sampling` of the calls to check.
+        Only done at the `full` check level.
     :raises AssertionError: if no match in super classes for the method name
     :return: method with possibly added (if the method doesn't have one)
         docstring from super class
     """
     if method is not None:
-        return _overrides(method, check_signature, check_at_runtime)
+        return _overrides(
+            method, check_signature, check_at_runtime, defer_check, check_values
+        )
     else:
         return functools.partial(
             overrides,
             check_signature=check_signature,
             check_at_runtime=check_at_runtime,
+            defer_check=defer_check,
+            check_values=check_values,
         )
 
 
@@ -153,32 +245,434 @@ def _overrides(
     method: _WrappedMethod,
     check_signature: bool,
     check_at_runtime: bool,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
 ) -> _WrappedMethod:
-    setattr(method, "__override__", True)
+    _count("decorations")
+    level = get_check_level()
+    if level is CheckLevel.OFF:
+        return method
+    set_flag(method, "__override__")
+    if level is CheckLevel.MARK:
+        return method
+    check_types = level is CheckLevel.FULL
     global_vars = getattr(method, "__globals__", None)
     if global_vars is None:
         global_vars = vars(sys.modules[method.__module__])
-    for super_class in _get_base_classes(sys._getframe(3), global_vars):
+    start = clock()
+    base_classes = _get_base_classes(sys._getframe(2), global_vars)
+    _add_time("base_class_discovery", start)
+    return _override_from(
+        base_classes,
+        method,
+        check_signature,
+        check_at_runtime,
+        defer_check,
+        check_types,
+        check_values,
+    )
+
+
+def _override_from(
+    base_classes: Iterable[type],
+    method: _WrappedMethod,
+    check_signature: bool,
+    check_at_runtime: bool,
+    defer_check: bool,
+    check_types: bool,
+    check_values: Union[bool, Sampling] = False,
+) -> _WrappedMethod:
+    """Check `method` against the first of `base_classes` having an attribute of
+    the same name, or arrange for it to be checked later.
+
+    :return: `method`, or a wrapper checking it on the first call or checking
+        the values on every call.
+    """
+    for super_class in base_classes:
         if hasattr(super_class, method.__name__):
+            replacement: Callable = method
+            if check_values and check_types:
+                replacement = checking_values(
+                    method,
+                    getattr(super_class, method.__name__),
+                    check_values if isinstance(check_values, Sampling) else None,
+                )
             if check_at_runtime:
+                replacement = _check_on_first_call(
+                    method, super_class, check_signature, check_types, replacement
+                )
+            elif defer_check or _claim_listeners:
+                _pending_claims[method] = _OverrideClaim(
+                    method, super_class, check_signature, check_types, defer_check
+                )
+                if not defer_check:
+                    _background_claims.append(method)
+                    for listener in list(_claim_listeners):
+                        listener()
+            else:
+                _validate_method(method, super_class, check_signature, check_types)
+            try:
+                _handled_overrides.add(method)
+                _handled_overrides.add(replacement)
+            except TypeError:
+                pass
+            return replacement  # type: ignore
+    _raise_or_report(
+        method, TypeError(f"{method.__qualname__}: No super class method found")
+    )
+    return method
 
-                @functools.wraps(method)
-                def wrapper(*args, **kwargs):
-                    _validate_method(method, super_class, check_signature)
-                    return method(*args, **kwargs)
 
-                return wrapper  # type: ignore
-            else:
-                _validate_method(method, super_class, check_signature)
-                return method
-    raise TypeError(f"{method.__qualname__}: No super class method found")
+@overload
+def frameless_override(
+    method: None = None,
+    *,
+    check_signature: bool = True,
+    check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
+) -> _DecoratorMethod:
+    ...
 
 
-def _validate_method(method, super_class, check_signature):
-    super_method = getattr(super_class, method.__name__)
-    is_static = isinstance(
-        inspect.getattr_static(super_class, method.__name__), staticmethod
+@overload
+def frameless_override(
+    method: _WrappedMethod,
+    *,
+    check_signature: bool = True,
+    check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
+) -> _WrappedMethod:
+    ...
+
+
+def frameless_override(
+    method: Optional[_WrappedMethod] = None,
+    *,
+    check_signature: bool = True,
+    check_at_runtime: bool = False,
+    defer_check: bool = False,
+    check_values: Union[bool, Sampling] = False,
+) -> Union[_DecoratorMethod, _WrappedMethod]:
+    """Decorator to indicate that the decorated method overrides a method in
+    superclass, like `override`, with the same parameters and errors.
+
+    Instead of inspecting the frame and bytecode of the class body to find the
+    base classes, it returns a placeholder that Python hands the class to once it
+    has been created (`__set_name__`). The method is checked against the classes
+    in the MRO of that class and the placeholder replaced with the method.
+
+    Under `@staticmethod`, `@classmethod` or `@property` it does not receive the
+    class, as those do not pass `__set_name__` on. It is then checked on the first
+    call, if the class can be found from the qualified name of the method or the
+    first argument of the call. On Python 3.10 and 3.11 errors raised from
+    `__set_name__` are wrapped in a `RuntimeError`.
+    """
+    if method is None:
+        return functools.partial(
+            frameless_override,
+            check_signature=check_signature,
+            check_at_runtime=check_at_runtime,
+            defer_check=defer_check,
+            check_values=check_values,
+        )
+    _count("decorations")
+    level = get_check_level()
+    if level is CheckLevel.OFF:
+        return method
+    set_flag(_unwrap_method(method), "__override__")
+    if level is CheckLevel.MARK:
+        return method
+    return _OverrideDescriptor(  # type: ignore
+        method,
+        check_signature,
+        check_at_runtime,
+        defer_check,
+        level is CheckLevel.FULL,
+        check_values,
     )
+
+
+class _OverrideDescriptor:
+    """Placeholder for a method decorated with `frameless_override` until the
+    class it is defined in has been created.
+    """
+
+    __override__ = True
+
+    def __init__(
+        self,
+        method: Callable,
+        check_signature: bool,
+        check_at_runtime: bool,
+        defer_check: bool,
+        check_types: bool,
+        check_values: Union[bool, Sampling] = False,
+    ):
+        self.method = method
+        self.check_signature = check_signature
+        self.check_at_runtime = check_at_runtime
+        self.defer_check = defer_check
+        self.check_types = check_types
+        self.check_values = check_values
+        self.checked = False
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.checked = True
+        setattr(owner, name, self._override_in(owner, self.method))
+
+    def _override_in(self, owner: type, method):
+        function = _unwrap_method(method)
+        replacement = _override_from(
+            owner.__mro__[1:],
+            function,
+            self.check_signature,
+            self.check_at_runtime,
+            self.defer_check,
+            self.check_types,
+            self.check_values,
+        )
+        if replacement is function:
+            return method
+        if method is function:
+            return replacement
+        return _rewrap(method, replacement)
+
+    # Used when another decorator has been applied on top and `__set_name__`
+    # has not been called.
+    def __get__(self, instance, owner=None):
+        args = (instance,) if instance is not None else ()
+        return self._check_late(args).__get__(instance, owner)
+
+    def __call__(self, *args, **kwargs):
+        return self._check_late(args)(*args, **kwargs)
+
+    def _check_late(self, args):
+        if self.checked:
+            return self.method
+        name = self.method.__name__
+        for owner in _owner_candidates(self.method, args):
+            value = vars(owner).get(name)
+            if getattr(value, "__func__", None) is self or (
+                isinstance(value, property) and value.fget is self
+            ):
+                self.checked = True
+                replacement = self._override_in(owner, self.method)
+                setattr(owner, name, _rewrap(value, replacement))
+                return replacement
+        return self.method
+
+
+def _unwrap_method(method):
+    if isinstance(method, (staticmethod, classmethod)):
+        return method.__func__
+    return method
+
+
+def _rewrap(wrapper, function):
+    """Get a copy of the static method, class method or property `wrapper` for
+    `function`.
+    """
+    if isinstance(wrapper, property):
+        return wrapper.getter(function)
+    return type(wrapper)(function)
+
+
+def _raise_or_report(culprit: object, error: TypeError) -> None:
+    """Raise `error`, or pass it to the error listeners if there are any."""
+    if not _error_listeners:
+        raise error
+    for listener in list(_error_listeners):
+        listener(culprit, error)
+
+
+_Class = TypeVar("_Class", bound=type)
+
+
+def check_class(cls: _Class) -> _Class:
+    """Class decorator checking all methods of the class marked as overrides at
+    once, see `validate_class`.
+
+    How to use:
+    from typing import override
+    from overrides import check_class
+
+    @check_class
+    class SubClass(SuperClass):
+
+        @override
+        def method(self):
+            return 1
+    """
+    validate_class(cls)
+    return cls
+
+
+def validate_class(cls: type) -> None:
+    """Check all methods defined in `cls` that are marked as overrides, for
+    instance by `typing.override` or by `override` at the `mark` check level,
+    against the classes in the MRO of `cls`.
+
+    Methods decorated with `override(defer_check=True)` are checked now as well,
+    and methods already checked by the override decorators are skipped.
+
+    :raises TypeError: for the first method that is not a valid override, as
+        `override` would.
+    """
+    level = get_check_level()
+    if level < CheckLevel.STRUCTURAL:
+        return
+    check_types = level is CheckLevel.FULL
+    base_classes = cls.__mro__[1:]
+    for value in list(vars(cls).values()):
+        method = _unwrap_method(value.fget if isinstance(value, property) else value)
+        if isinstance(method, _OverrideDescriptor) or not getattr(
+            method, "__override__", False
+        ):
+            continue
+        claim = _pending_claims.get(method)
+        if claim is not None and not claim.deferred:
+            claim = None  # Reported by the background checks.
+        if claim is None and method in _handled_overrides:
+            continue
+        super_class = next(
+            (base for base in base_classes if hasattr(base, method.__name__)), None
+        )
+        if super_class is None:
+            _raise_or_report(
+                method,
+                TypeError(f"{method.__qualname__}: No super class method found"),
+            )
+            continue
+        check_signature = claim.check_signature if claim is not None else True
+        _validate_method(method, super_class, check_signature, check_types)
+        _pending_claims.pop(method, None)
+
+
+def verify_all() -> None:
+    """Check all overrides decorated with `defer_check=True` that have not been
+    checked yet. Overrides that fail the check stay pending.
+
+    :raises TypeError: for the first override that is not valid.
+    """
+    _verify_pending(snapshot(_pending_claims))
+
+
+def _verify_pending(methods: Iterable[Callable]) -> None:
+    """Check the overrides among `methods` that have not been checked yet."""
+    for method in methods:
+        claim = _pending_claims.get(method)
+        if claim is not None:
+            _validate_claim(claim)
+            _pending_claims.pop(method, None)
+
+
+def _take_pending_claim() -> Optional[_OverrideClaim]:
+    """Remove the oldest override recorded to be checked in the background from
+    the pending ones and return it.
+    """
+    while True:
+        try:
+            method = _background_claims.popleft()
+        except IndexError:
+            return None
+        claim = _pending_claims.pop(method, None)
+        if claim is not None:
+            return claim
+
+
+def _validate_claim(claim: _OverrideClaim) -> None:
+    _validate_method(
+        claim.method, claim.super_class, claim.check_signature, claim.check_types
+    )
+
+
+def _has_deferred_check(method) -> bool:
+    """Whether `method` was decorated with `defer_check=True` and has not been
+    checked yet. Overrides recorded for the background are reported by it only.
+    """
+    try:
+        claim = _pending_claims.get(method)
+    except TypeError:
+        return False
+    return claim is not None and claim.deferred
+
+
+def _check_on_first_call(
+    method: _WrappedMethod,
+    super_class: type,
+    check_signature: bool,
+    check_types: bool,
+    replacement: Optional[Callable] = None,
+) -> _WrappedMethod:
+    """Wrap `method` so that it is validated when it is called for the first time.
+
+    Once the validation has passed the wrapper replaces itself with `replacement`,
+    `method` by default, in the class owning it, so that later calls cost the same
+    as calling it directly. Calls through references to the wrapper taken before
+    that skip the validation.
+    """
+    validated = False
+    target = method if replacement is None else replacement
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        nonlocal validated
+        _count("runtime_check_calls")
+        if not validated:
+            _validate_method(method, super_class, check_signature, check_types)
+            validated = True
+            _replace_in_owner(wrapper, target, args)
+        return target(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def _replace_in_owner(current, replacement, args=()) -> bool:
+    """Replace `current` with `replacement` in the class dictionary holding it.
+
+    The owner is looked up from the qualified name of `replacement` and, failing
+    that, from the class of the first argument of the call.
+
+    :return: whether `current` was replaced.
+    """
+    name = replacement.__name__
+    for owner in _owner_candidates(replacement, args):
+        value = owner.__dict__.get(name)
+        if value is current:
+            new_value = replacement
+        elif (
+            isinstance(value, (classmethod, staticmethod)) and value.__func__ is current
+        ):
+            new_value = type(value)(replacement)
+        else:
+            continue
+        try:
+            setattr(owner, name, new_value)
+        except (AttributeError, TypeError):
+            return False
+        return True
+    return False
+
+
+def _owner_candidates(method, args):
+    owner_path = method.__qualname__.split(".")[:-1]
+    module = sys.modules.get(getattr(method, "__module__", None) or "")
+    if owner_path and module is not None and "<locals>" not in owner_path:
+        owner = functools.reduce(
+            lambda obj, component: getattr(obj, component, None), owner_path, module
+        )
+        if isinstance(owner, type):
+            yield owner
+    if args:
+        first = args[0]
+        yield from (first if isinstance(first, type) else type(first)).__mro__
+
+
+def _validate_method(method, super_class, check_signature, check_types=True):
+    super_method = getattr(super_class, method.__name__)
+    is_static = is_static_method(super_class, method.__name__)
     if getattr(super_method, "__final__", False):
         raise TypeError(f"{method.__name__}: is finalized in {super_class}")
     if not method.__doc__:
@@ -188,24 +682,69 @@ def _validate_method(method, super_class, check_signature):
         and not method.__name__.startswith("__")
         and not isinstance(super_method, property)
     ):
-        ensure_signature_is_compatible(super_method, method, is_static)
+        key = persistent_cache.validation_key(
+            super_method, method, is_static, check_types
+        )
+        if not persistent_cache.is_known_valid(key):
+            ensure_signature_is_compatible(super_method, method, is_static, check_types)
+            persistent_cache.add_valid(key)
+
 
+def _get_base_classes(class_body_frame: FrameType, namespace) -> List:
+    """Get the base classes of the class whose body `class_body_frame` executes.
 
-def _get_base_classes(frame, namespace):
-    return [
+    The resolved base classes are shared by all decorators in the bodies of the
+    same class statement, as long as the names of the bases are bound to the same
+    objects in `namespace`.
+    """
+    class_statement_frame = class_body_frame.f_back
+    assert class_statement_frame is not None
+    code = class_statement_frame.f_code
+    offset = class_statement_frame.f_lasti
+    by_offset = _base_classes_cache.get(code)
+    entry = by_offset.get(offset) if by_offset is not None else None
+    if (
+        entry is not None
+        and entry[0] == id(namespace)
+        and all(namespace.get(name, _missing) is value for name, value in entry[1])
+    ):
+        return entry[2]
+    names = _get_base_class_names(class_statement_frame)
+    base_classes = [
         _get_base_class(class_name_components, namespace)
-        for class_name_components in _get_base_class_names(frame)
+        for class_name_components in names
     ]
+    if all(len(components) == 1 for components in names):
+        bound = tuple(
+            (components[0], namespace.get(components[0], _missing))
+            for components in names
+        )
+        if by_offset is None:
+            by_offset = _base_classes_cache.setdefault(code, {})
+        by_offset[offset] = (id(namespace), bound, base_classes)
+    return base_classes
 
 
 def _get_base_class_names(frame: FrameType) -> List[List[str]]:
     """Get baseclass names from the code object"""
+    names_by_offset = _base_class_names_cache.get(frame.f_code)
+    if names_by_offset is None:
+        names_by_offset = _base_class_names_cache.setdefault(frame.f_code, {})
+    try:
+        return names_by_offset[frame.f_lasti]
+    except KeyError:
+        items = _scan_base_class_names(frame.f_code, frame.f_lasti)
+        names_by_offset[frame.f_lasti] = items
+        return items
+
+
+def _scan_base_class_names(code: CodeType, last_offset: int) -> List[List[str]]:
     current_item: List[str] = []
     items: List[List[str]] = []
     add_last_step = True
 
-    for instruction in dis.get_instructions(frame.f_code):
-        if instruction.offset > frame.f_lasti:
+    for instruction in dis.get_instructions(code):
+        if instruction.offset > last_offset:
             break
         if instruction.opcode not in dis.hasname:
             continue
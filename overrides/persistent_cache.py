@@ -0,0 +1,245 @@
+"""Opt-in cache of passed signature checks that persists between runs.
+
+Whether an override has a compatible signature only changes when the code,
+defaults or annotations of the overriding or the overridden function change.
+With the cache enabled, passed checks are remembered under a hash of those and
+of the Python version, and a warm restart skips resolving signatures and type
+hints for them. Failed checks are never cached.
+
+    from overrides import persistent_cache
+
+    persistent_cache.enable(".overrides_cache")   # or set OVERRIDES_CACHE_DIR
+
+The cache is a single file per Python and overrides version holding a sorted
+array of keys. It is memory-mapped for lookups and replaced atomically when new
+keys are written, so that concurrent processes can share the directory.
+
+Classes named in annotations, also as arguments of generic types like
+`Optional[Foo]`, are hashed by their name and the names in their MRO, except
+for annotations given as strings, which are hashed as they are. Clear the
+directory when a class named only in string annotations changes the classes it
+derives from.
+"""
+
+import atexit
+import hashlib
+import marshal
+import mmap
+import os
+import sys
+import tempfile
+import threading
+from types import FunctionType
+from typing import Optional, Set, Tuple, get_args, get_origin
+
+from overrides.signature import _is_plain_function, _unbound_func
+from overrides.stats import _count
+
+ENVIRONMENT_VARIABLE = "OVERRIDES_CACHE_DIR"
+# Number of new keys collected before they are written to the cache file. The
+# remaining ones are written when the interpreter exits.
+FLUSH_THRESHOLD = 256
+
+_HEADER = b"OVERRIDES-CACHE1"
+_KEY_SIZE = 16
+
+
+class _CacheFile:
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        # Mapped cache file and the number of keys in it.
+        self.mapped: Tuple[Optional[mmap.mmap], int] = (None, 0)
+        self.new_keys: Set[bytes] = set()
+        self._map()
+
+    def __contains__(self, key: bytes) -> bool:
+        if key in self.new_keys:
+            return True
+        mapped, count = self.mapped
+        if mapped is None:
+            return False
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            start = len(_HEADER) + middle * _KEY_SIZE
+            probe = mapped[start : start + _KEY_SIZE]
+            if probe < key:
+                low = middle + 1
+            elif probe > key:
+                high = middle
+            else:
+                return True
+        return False
+
+    def add(self, key: bytes) -> None:
+        with self.lock:
+            self.new_keys.add(key)
+            full = len(self.new_keys) >= FLUSH_THRESHOLD
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Merge the new keys with the keys in the cache file, which may have been
+        written by other processes, and replace the file atomically.
+        """
+        with self.lock:
+            if not self.new_keys:
+                return
+            keys = self.new_keys | set(self._read_keys())
+            directory = os.path.dirname(self.path)
+            try:
+                fd, temporary_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(_HEADER)
+                        f.write(b"".join(sorted(keys)))
+                    os.replace(temporary_path, self.path)
+                except BaseException:
+                    os.unlink(temporary_path)
+                    raise
+            except OSError:
+                return
+            self.new_keys.clear()
+            self._map()
+
+    def _read_keys(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return []
+        if not _is_valid(data):
+            return []
+        return [
+            data[start : start + _KEY_SIZE]
+            for start in range(len(_HEADER), len(data), _KEY_SIZE)
+        ]
+
+    def _map(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Missing or empty file.
+            self.mapped = (None, 0)
+            return
+        if not _is_valid(mapped):
+            self.mapped = (None, 0)
+            return
+        # The previous map is closed once no lookup is using it any more.
+        self.mapped = (mapped, (len(mapped) - len(_HEADER)) // _KEY_SIZE)
+
+
+def _is_valid(data) -> bool:
+    return (
+        data[: len(_HEADER)] == _HEADER and (len(data) - len(_HEADER)) % _KEY_SIZE == 0
+    )
+
+
+_cache_file: Optional[_CacheFile] = None
+_configured = False
+_exit_handler_registered = False
+
+
+def enable(directory: str) -> None:
+    """Cache passed signature checks in `directory`, which is created if needed."""
+    global _cache_file, _exit_handler_registered
+    disable()
+    os.makedirs(directory, exist_ok=True)
+    _cache_file = _CacheFile(os.path.join(directory, _file_name()))
+    if not _exit_handler_registered:
+        atexit.register(flush)
+        _exit_handler_registered = True
+
+
+def disable() -> None:
+    """Write the collected keys and stop using the cache."""
+    global _cache_file, _configured
+    flush()
+    _cache_file = None
+    _configured = True
+
+
+def flush() -> None:
+    """Write the keys collected so far to the cache file."""
+    if _cache_file is not None:
+        _cache_file.flush()
+
+
+def _file_name() -> str:
+    from overrides.overrides import __VERSION__
+
+    return f"signatures.{sys.implementation.cache_tag}.overrides-{__VERSION__}.bin"
+
+
+def _get_cache_file() -> Optional[_CacheFile]:
+    global _configured
+    if not _configured:
+        _configured = True
+        directory = os.environ.get(ENVIRONMENT_VARIABLE)
+        if directory:
+            try:
+                enable(directory)
+            except OSError:
+                pass
+    return _cache_file
+
+
+def validation_key(
+    super_callable, sub_callable, is_static: bool, check_types: bool
+) -> Optional[bytes]:
+    """Get the key of the signature check of `sub_callable` against
+    `super_callable`, or None if the cache is disabled or cannot be used for them.
+    """
+    if _get_cache_file() is None:
+        return None
+    super_callable = _unbound_func(super_callable)
+    sub_callable = _unbound_func(sub_callable)
+    if not (_is_plain_function(super_callable) and _is_plain_function(sub_callable)):
+        return None
+    digest = hashlib.blake2b(digest_size=_KEY_SIZE)
+    digest.update(bytes([is_static, check_types]))
+    try:
+        _hash_function(digest, super_callable)
+        _hash_function(digest, sub_callable)
+    except Exception:
+        return None
+    return digest.digest()
+
+
+def is_known_valid(key: Optional[bytes]) -> bool:
+    cache_file = _cache_file
+    if key is None or cache_file is None:
+        return False
+    if key in cache_file:
+        _count("persistent_cache_hits")
+        return True
+    _count("persistent_cache_misses")
+    return False
+
+
+def add_valid(key: Optional[bytes]) -> None:
+    cache_file = _cache_file
+    if key is not None and cache_file is not None:
+        cache_file.add(key)
+
+
+def _hash_function(digest, function: FunctionType) -> None:
+    digest.update(f"{function.__module__}\0{function.__qualname__}\0".encode())
+    digest.update(marshal.dumps(function.__code__))
+    digest.update(repr((function.__defaults__, function.__kwdefaults__)).encode())
+    for name, annotation in function.__annotations__.items():
+        digest.update(f"\0{name}\0{_describe(annotation)}".encode())
+    digest.update(b"\0\0")
+
+
+def _describe(annotation) -> str:
+    origin = get_origin(annotation)
+    if origin is not None:
+        args = ", ".join(map(_describe, get_args(annotation)))
+        return f"{_describe(origin)}[{args}]"
+    if isinstance(annotation, (list, tuple)):  # Parameters of `Callable`.
+        return f"[{', '.join(map(_describe, annotation))}]"
+    if isinstance(annotation, type):
+        return " ".join(f"{k.__module__}.{k.__qualname__}" for k in annotation.__mro__)
+    return repr(annotation)
@@ -0,0 +1,131 @@
+"""Check that classes implement `typing.Protocol`s they do not inherit from.
+
+Methods of the protocols are checked. Attributes and properties are not, as
+implementations often assign them on the instances.
+
+The members of each protocol are collected once and kept for as long as the
+protocol exists. Their signatures and type hints are cached on the functions,
+so checking another implementation of a protocol only resolves the signatures
+of the implementation.
+"""
+
+import sys
+import typing
+import weakref
+from types import FunctionType
+from typing import AbstractSet, Callable, Iterator, NamedTuple, Tuple, TypeVar
+
+from overrides.config import CheckLevel, get_check_level
+from overrides.signature import ensure_signature_is_compatible
+
+_Class = TypeVar("_Class", bound=type)
+
+if sys.version_info >= (3, 12):
+
+    def _get_protocol_attrs(protocol: type) -> AbstractSet[str]:
+        return protocol.__protocol_attrs__  # type: ignore
+
+else:
+    _get_protocol_attrs = getattr(typing, "_get_protocol_attrs")
+
+
+class _Member(NamedTuple):
+    name: str
+    function: Callable
+    is_static: bool
+
+
+_missing = object()
+
+_members: "weakref.WeakKeyDictionary[type, Tuple[_Member, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def implements(*protocols: type) -> Callable[[_Class], _Class]:
+    """Class decorator checking that the class implements all methods of the
+    protocols, with compatible signatures, like `override` checks overrides.
+
+    How to use:
+    from typing import Protocol
+    from overrides import implements
+
+    class SupportsClose(Protocol):
+        def close(self) -> None: ...
+
+    @implements(SupportsClose)
+    class Resource:
+        def close(self) -> None:
+            pass
+
+    :raises TypeError: if one of `protocols` is not a protocol, or for the first
+        member that is missing or has an incompatible signature.
+    """
+    for protocol in protocols:
+        if not getattr(protocol, "_is_protocol", False):
+            raise TypeError(f"{protocol!r} is not a protocol")
+
+    def decorator(cls: _Class) -> _Class:
+        level = get_check_level()
+        if level >= CheckLevel.STRUCTURAL:
+            for protocol in protocols:
+                _check_implementation(
+                    cls, protocol, check_types=level is CheckLevel.FULL
+                )
+        return cls
+
+    return decorator
+
+
+def _check_implementation(cls: type, protocol: type, check_types: bool) -> None:
+    for member in _get_members(protocol):
+        implementation = _find_attribute(cls, member.name)
+        if implementation is _missing:
+            raise TypeError(
+                f"{cls.__qualname__}: `{member.name}` of protocol "
+                f"`{protocol.__qualname__}` is not implemented"
+            )
+        function = _unwrap(implementation)
+        if not callable(function):
+            raise TypeError(
+                f"{cls.__qualname__}.{member.name}: must be a method to implement "
+                f"`{protocol.__qualname__}`"
+            )
+        ensure_signature_is_compatible(
+            member.function, function, member.is_static, check_types
+        )
+
+
+def _get_members(protocol: type) -> Tuple[_Member, ...]:
+    try:
+        return _members[protocol]
+    except KeyError:
+        pass
+    members = tuple(_collect_members(protocol))
+    _members[protocol] = members
+    return members
+
+
+def _collect_members(protocol: type) -> Iterator[_Member]:
+    members = set(_get_protocol_attrs(protocol))
+    for base in protocol.__mro__[:-1]:
+        for name, value in vars(base).items():
+            if name not in members:
+                continue
+            members.discard(name)
+            function = _unwrap(value)
+            if isinstance(function, FunctionType):
+                yield _Member(name, function, isinstance(value, staticmethod))
+
+
+def _find_attribute(cls: type, name: str):
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return vars(klass)[name]
+    return _missing
+
+
+def _unwrap(value):
+    if isinstance(value, (staticmethod, classmethod)):
+        return value.__func__
+    return value
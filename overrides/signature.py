@@ -1,13 +1,77 @@
 import inspect
+import weakref
 from inspect import Parameter
 from types import FunctionType
-from typing import Callable, Dict, Optional, Tuple, Type, TypeVar, Union, get_type_hints
-
-from .typing_utils import get_args, issubtype
+from typing import (
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+
+from .concurrency import snapshot
+from .stats import _add_time, _count, clock
+from .typing_utils import bind_forward_refs, get_args, issubtype
 
 _WrappedMethod = TypeVar("_WrappedMethod", bound=Union[FunctionType, Callable])
 _WrappedMethod2 = TypeVar("_WrappedMethod2", bound=Union[FunctionType, Callable])
 
+# Signatures and type hints are cached on the functions themselves, so that the
+# cache entries are collected together with the functions and their classes.
+# Type hints are None until they have been resolved.
+_SIGNATURE_INFO = "__overrides_signature_info__"
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class _SignatureInfo:
+    __slots__ = ("function", "signature", "type_hints")
+
+    def __init__(
+        self,
+        function: FunctionType,
+        signature: inspect.Signature,
+        type_hints: Optional[Dict],
+    ):
+        self.function = function
+        self.signature = signature
+        self.type_hints = type_hints
+
+
+_hits = 0
+_misses = 0
+_functions_with_info: "weakref.WeakSet[FunctionType]" = weakref.WeakSet()
+_static_methods: "weakref.WeakKeyDictionary[type, Dict[str, bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def cache_info() -> CacheInfo:
+    """Report statistics of the signature, type hint and static method caches."""
+    size = len(_functions_with_info) + sum(
+        len(_static_methods.get(cls) or ()) for cls in snapshot(_static_methods)
+    )
+    return CacheInfo(_hits, _misses, size)
+
+
+def cache_clear() -> None:
+    """Clear the signature, type hint and static method caches and their statistics."""
+    global _hits, _misses
+    for function in snapshot(_functions_with_info):
+        function.__dict__.pop(_SIGNATURE_INFO, None)
+    _functions_with_info.clear()
+    _static_methods.clear()
+    _hits = _misses = 0
+
 
 def _contains_unbound_typevar(t: Type) -> bool:
     """Recursively check if `t` or any types contained by `t` is a `TypeVar`.
@@ -32,24 +96,99 @@ def _contains_unbound_typevar(t: Type) -> bool:
 
 
 def _issubtype(left, right):
-    if _contains_unbound_typevar(left):
-        return True
     if right is None:
         return True
+    if _contains_unbound_typevar(left):
+        return True
     if _contains_unbound_typevar(right):
         return True
     try:
         return issubtype(left, right)
-    except TypeError:
+    except (TypeError, NameError, RecursionError):
         # Ignore all broken cases
         return True
 
 
+def _has_no_annotations(callable) -> bool:
+    try:
+        return not callable.__annotations__
+    except Exception:  # No annotations attribute, or annotations failing to evaluate.
+        return False
+
+
 def _get_type_hints(callable) -> Optional[Dict]:
+    if _has_no_annotations(callable):
+        return {}
+    _count("type_hint_evaluations")
+    start = clock()
     try:
-        return get_type_hints(callable)
+        type_hints = get_type_hints(callable)
     except (NameError, TypeError):
         return None
+    finally:
+        _add_time("type_hint_evaluation", start)
+    # Forward references left in recursive type aliases are evaluated later, in
+    # the module defining the function.
+    module = getattr(callable, "__module__", None)
+    return {name: bind_forward_refs(hint, module) for name, hint in type_hints.items()}
+
+
+def _get_signature_and_type_hints(
+    callable: _WrappedMethod, with_type_hints: bool = True
+) -> Tuple[inspect.Signature, Optional[Dict]]:
+    """Get the signature and, if `with_type_hints`, the type hints of `callable`,
+    cached for plain functions.
+
+    Type hints that cannot be resolved yet are not cached, so that forward
+    references are retried on the next call.
+
+    :raises ValueError: if no signature can be provided for `callable`.
+    """
+    global _hits, _misses
+    info = getattr(callable, _SIGNATURE_INFO, None)
+    if info is None or info.function is not callable:
+        _misses += 1
+        _count("signature_extractions")
+        start = clock()
+        try:
+            signature = inspect.signature(callable)
+        finally:
+            _add_time("signature_extraction", start)
+        type_hints = _get_type_hints(callable) if with_type_hints else None
+        if isinstance(callable, FunctionType):
+            setattr(
+                callable,
+                _SIGNATURE_INFO,
+                _SignatureInfo(callable, signature, type_hints),
+            )
+            _functions_with_info.add(callable)
+        return signature, type_hints
+    if with_type_hints and info.type_hints is None:
+        _misses += 1
+        info.type_hints = _get_type_hints(callable)
+    else:
+        _hits += 1
+    return info.signature, info.type_hints if with_type_hints else None
+
+
+def is_static_method(cls: type, name: str) -> bool:
+    """Check whether `name` is defined as a `staticmethod` in `cls` or its bases."""
+    global _hits, _misses
+    try:
+        names = _static_methods[cls]
+    except KeyError:
+        names = _static_methods.setdefault(cls, {})
+    except TypeError:
+        return isinstance(inspect.getattr_static(cls, name), staticmethod)
+    try:
+        is_static = names[name]
+    except KeyError:
+        _misses += 1
+        is_static = isinstance(inspect.getattr_static(cls, name), staticmethod)
+        names[name] = is_static
+    else:
+        _hits += 1
+    return is_static
 
 
 def _is_same_module(callable1: _WrappedMethod, callable2: _WrappedMethod2) -> bool:
@@ -67,6 +206,7 @@ def ensure_signature_is_compatible(
     super_callable: _WrappedMethod,
     sub_callable: _WrappedMethod2,
     is_static: bool = False,
+    check_types: bool = True,
 ) -> None:
     """Ensure that the signature of `sub_callable` is compatible with the signature of `super_callable`.
 
@@ -83,22 +223,36 @@ def ensure_signature_is_compatible(
     :param super_callable: Function to check compatibility with.
     :param sub_callable: Function to check compatibility of.
     :param is_static: True if staticmethod and should check first argument.
+    :param check_types: False to check only the parameter kinds, names and order,
+        without resolving type hints.
     """
     super_callable = _unbound_func(super_callable)
     sub_callable = _unbound_func(sub_callable)
+    if (
+        check_types
+        and _has_no_annotations(super_callable)
+        and _has_no_annotations(sub_callable)
+    ):
+        # Without annotations the type hints are empty, only the structural
+        # checks can fail.
+        check_types = False
+    if not check_types and _have_same_parameters(super_callable, sub_callable):
+        return
 
     try:
-        super_sig = inspect.signature(super_callable)
+        super_sig, super_type_hints = _get_signature_and_type_hints(
+            super_callable, check_types
+        )
     except ValueError:
         return
 
-    super_type_hints = _get_type_hints(super_callable)
-    sub_sig = inspect.signature(sub_callable)
-    sub_type_hints = _get_type_hints(sub_callable)
+    sub_sig, sub_type_hints = _get_signature_and_type_hints(sub_callable, check_types)
 
     method_name = sub_callable.__qualname__
     same_main_module = _is_same_module(sub_callable, super_callable)
 
+    if not check_types:
+        super_type_hints = sub_type_hints = {}
     if super_type_hints is not None and sub_type_hints is not None:
         ensure_return_type_compatibility(super_type_hints, sub_type_hints, method_name)
         ensure_all_kwargs_defined_in_sub(
@@ -116,6 +270,37 @@ def ensure_signature_is_compatible(
     ensure_no_extra_args_in_sub(super_sig, sub_sig, is_static, method_name)
 
 
+def _is_plain_function(function) -> bool:
+    # The signatures of wrapped functions and functions with an explicit
+    # signature do not follow from their code.
+    return (
+        type(function) is FunctionType
+        and not hasattr(function, "__wrapped__")
+        and not hasattr(function, "__signature__")
+    )
+
+
+def _have_same_parameters(function1, function2) -> bool:
+    """Check whether two plain functions have parameters of the same names and
+    kinds in the same order. Such functions pass all structural checks.
+    """
+    if not (_is_plain_function(function1) and _is_plain_function(function2)):
+        return False
+    code1 = function1.__code__
+    code2 = function2.__code__
+    flags = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+    count = code1.co_argcount + code1.co_kwonlyargcount
+    count += bool(code1.co_flags & inspect.CO_VARARGS)
+    count += bool(code1.co_flags & inspect.CO_VARKEYWORDS)
+    return (
+        code1.co_argcount == code2.co_argcount
+        and code1.co_posonlyargcount == code2.co_posonlyargcount
+        and code1.co_kwonlyargcount == code2.co_kwonlyargcount
+        and code1.co_flags & flags == code2.co_flags & flags
+        and code1.co_varnames[:count] == code2.co_varnames[:count]
+    )
+
+
 def _unbound_func(callable: _WrappedMethod) -> _WrappedMethod:
     if hasattr(callable, "__self__") and hasattr(callable, "__func__"):
         return callable.__func__  # type: ignore
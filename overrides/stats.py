@@ -0,0 +1,134 @@
+"""Counters of the work done by overrides in this process, see `stats()`."""
+
+import threading
+import time
+import weakref
+from typing import Dict, List, Union
+
+# Counters of events, and total nanoseconds spent in timed steps.
+COUNTS = (
+    "decorations",
+    "signature_extractions",
+    "type_hint_evaluations",
+    "issubtype_calls",
+    "enforce_class_creations",
+    "runtime_check_calls",
+    "value_check_calls",
+    "persistent_cache_hits",
+    "persistent_cache_misses",
+)
+TIMINGS = (
+    "base_class_discovery",
+    "signature_extraction",
+    "type_hint_evaluation",
+    "issubtype",
+    "enforce_class_creation",
+)
+
+clock = time.perf_counter_ns
+
+
+class _Counters:
+    """The counters of one thread. Only that thread updates them, so they are
+    updated without locking and threads never write to the same dictionary.
+    """
+
+    __slots__ = ("counts", "nanoseconds")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = dict.fromkeys(COUNTS, 0)
+        self.nanoseconds: Dict[str, int] = dict.fromkeys(TIMINGS, 0)
+
+
+class _Owner:
+    """Kept by a thread until it ends, then its counters are retired."""
+
+    __slots__ = ("__weakref__",)
+
+
+_local = threading.local()
+# Counters of the running threads that counted anything, and the totals of the
+# threads that have ended. Changed under `_lock`, which is taken once per thread
+# and by `stats()` and `reset_stats()`.
+_lock = threading.RLock()
+_live: List[_Counters] = []
+_retired = _Counters()
+
+
+def stats() -> Dict[str, Union[int, float]]:
+    """Get the counters of the work done by overrides in this process, added up
+    over all threads.
+
+    `decorations`, `signature_extractions`, `type_hint_evaluations`,
+    `issubtype_calls`, `enforce_class_creations`, `runtime_check_calls`,
+    `value_check_calls`, `persistent_cache_hits` and `persistent_cache_misses`
+    are numbers of events, and the keys ending with `_seconds` the total time
+    spent in `base_class_discovery`, `signature_extraction`,
+    `type_hint_evaluation`, `issubtype` and `enforce_class_creation`. The checks
+    done by `@override` run in the class body, so they are not part of
+    `enforce_class_creation`.
+    """
+    counts = dict.fromkeys(COUNTS, 0)
+    nanoseconds = dict.fromkeys(TIMINGS, 0)
+    with _lock:
+        for counters in [_retired, *_live]:
+            for name, value in counters.counts.items():
+                counts[name] += value
+            for name, value in counters.nanoseconds.items():
+                nanoseconds[name] += value
+    result: Dict[str, Union[int, float]] = dict(counts)
+    for name, total in nanoseconds.items():
+        result[f"{name}_seconds"] = total / 1e9
+    return result
+
+
+def reset_stats() -> None:
+    """Set all counters of `stats()` back to zero. Events counted by other
+    threads at the same time may be kept.
+    """
+    with _lock:
+        for counters in [_retired, *_live]:
+            for name in counters.counts:
+                counters.counts[name] = 0
+            for name in counters.nanoseconds:
+                counters.nanoseconds[name] = 0
+
+
+def _thread_counters() -> _Counters:
+    try:
+        return _local.counters
+    except AttributeError:
+        pass
+    counters = _Counters()
+    owner = _Owner()
+    with _lock:
+        _live.append(counters)
+    weakref.finalize(owner, _retire, counters)
+    _local.counters = counters
+    _local.owner = owner
+    return counters
+
+
+def _retire(counters: _Counters) -> None:
+    with _lock:
+        _live.remove(counters)
+        for name, value in counters.counts.items():
+            _retired.counts[name] += value
+        for name, value in counters.nanoseconds.items():
+            _retired.nanoseconds[name] += value
+
+
+def _count(name: str) -> None:
+    try:
+        counts = _local.counters.counts
+    except AttributeError:
+        counts = _thread_counters().counts
+    counts[name] += 1
+
+
+def _add_time(name: str, start: int) -> None:
+    try:
+        nanoseconds = _local.counters.nanoseconds
+    except AttributeError:
+        nanoseconds = _thread_counters().nanoseconds
+    nanoseconds[name] += clock() - start
@@ -12,18 +12,20 @@ Backport Python3.8+ typing utils &amp; issubtype &amp; more
 ```
 """
 
+import abc
 import collections.abc
+import functools
 import io
 import itertools
+import sys
 import types
 import typing
+import weakref
 
-if hasattr(typing, "ForwardRef"):  # python3.8
-    ForwardRef = getattr(typing, "ForwardRef")
-elif hasattr(typing, "_ForwardRef"):  # python3.6
-    ForwardRef = getattr(typing, "_ForwardRef")
-else:
-    raise NotImplementedError()
+from .concurrency import StripedCache, snapshot
+from .stats import _add_time, _count, clock
+
+ForwardRef = typing.ForwardRef
 
 if hasattr(typing, "Literal"):
     Literal = getattr(typing, "Literal")
@@ -40,8 +42,26 @@ if hasattr(types, "UnionType"):
 else:
     UnionType = None
 
+# Typing introspection of the running Python, selected once. Since Python 3.8
+# the typing module provides all of it. Python 3.13 deprecates evaluating
+# forward references without giving the type parameters in scope.
+if hasattr(typing, "get_origin") and hasattr(typing, "_eval_type"):
+    _typing_get_origin = typing.get_origin
+    _typing_get_args = typing.get_args
+    if sys.version_info >= (3, 13):
+        _typing_eval_type = functools.partial(
+            getattr(typing, "_eval_type"), type_params=()
+        )
+    else:
+        _typing_eval_type = getattr(typing, "_eval_type")
+else:
+    raise NotImplementedError()
+
 unknown = None
 
+# Number of (left, right) pairs whose subtype decision is remembered by `issubtype`.
+ISSUBTYPE_CACHE_SIZE = 4096
+
 BUILTINS_MAPPING = {
     typing.List: list,
     typing.Set: set,
@@ -100,9 +120,6 @@ def _hashable(value):
 
 get_type_hints = typing.get_type_hints
 
-GenericClass = type(typing.List)
-UnionClass = type(typing.Union)
-
 Type = typing.Union[None, type, "typing.TypeVar"]
 OriginType = typing.Union[None, type]
 TypeArgs = typing.Union[type, typing.AbstractSet[type], typing.Sequence[type]]
@@ -112,7 +129,8 @@ def _normalize_aliases(type_: Type) -> Type:
     if isinstance(type_, typing.TypeVar):
         return type_
 
-    assert _hashable(type_), "_normalize_aliases should only be called on element types"
+    if not _hashable(type_):
+        return type_
 
     if type_ in BUILTINS_MAPPING:
         return BUILTINS_MAPPING[type_]  # type: ignore
@@ -138,31 +156,11 @@ def get_origin(type_):
         get_origin(List[Tuple[T, T]][int]) == list
     ```
     """
-    if hasattr(typing, "get_origin"):  # python 3.8+
-        _getter = getattr(typing, "get_origin")
-        ori = _getter(type_)
-    elif hasattr(typing.List, "_special"):  # python 3.7
-        if isinstance(type_, GenericClass) and not type_._special:
-            ori = type_.__origin__
-        elif hasattr(type_, "_special") and type_._special:
-            ori = type_
-        elif type_ is typing.Generic:
-            ori = typing.Generic
-        else:
-            ori = None
-    else:  # python 3.6
-        if isinstance(type_, GenericClass):
-            ori = type_.__origin__
-            if ori is None:
-                ori = type_
-        elif isinstance(type_, UnionClass):
-            ori = type_.__origin__
-        elif type_ is typing.Generic:
-            ori = typing.Generic
-        else:
-            ori = None
-    if ori is None and _TypedDictMeta and isinstance(type_, _TypedDictMeta):
-        ori = dict
+    ori = _typing_get_origin(type_)
+    if ori is None:
+        if _TypedDictMeta and isinstance(type_, _TypedDictMeta):
+            return dict
+        return None
     return _normalize_aliases(ori)
 
 
@@ -182,56 +180,124 @@ def get_args(type_) -> typing.Tuple:
         get_args(Callable[[], T][int]) == ([], int)
     ```
     """
-    if hasattr(typing, "get_args"):  # python 3.8+
-        _getter = getattr(typing, "get_args")
-        res = _getter(type_)
-    elif hasattr(typing.List, "_special"):  # python 3.7
-        if (
-            isinstance(type_, GenericClass) and not type_._special  # type: ignore
-        ):  # backport for python 3.8
-            res = type_.__args__  # type: ignore
-            if get_origin(type_) is collections.abc.Callable and res[0] is not Ellipsis:
-                res = (list(res[:-1]), res[-1])
-        else:
-            res = ()
-    else:  # python 3.6
-        if isinstance(type_, (GenericClass, UnionClass)):  # backport for python 3.8
-            res = type_.__args__  # type: ignore
-            if get_origin(type_) is collections.abc.Callable and res[0] is not Ellipsis:
-                res = (list(res[:-1]), res[-1])
-        else:
-            res = ()
     if _TypedDictMeta and isinstance(type_, _TypedDictMeta):
         return str, typing.Any
-    return () if res is None else res
+    return _typing_get_args(type_)
 
 
 def eval_forward_ref(ref, forward_refs=None):
     """
     eval forward_refs in all cPython versions
+
+    References bound to a module by `bind_forward_refs` are evaluated in the
+    namespace of that module, once per module and string unless `forward_refs`
+    are given.
     """
-    localns = forward_refs or {}
+    module = getattr(ref, "__forward_module__", None)
+    if module is not None and not forward_refs:
+        return _eval_bound_forward_ref(ref, module)
+    return _typing_eval_type(ref, globals(), forward_refs or {})
 
-    if hasattr(typing, "_eval_type"):  # python3.8 & python 3.9
-        _eval_type = getattr(typing, "_eval_type")
-        return _eval_type(ref, globals(), localns)
 
-    if hasattr(ref, "_eval_type"):  # python3.6
-        _eval_type = getattr(ref, "_eval_type")
-        return _eval_type(globals(), localns)
+# Values of forward references bound to a module, by module name and string,
+# with the module namespace and the objects that the names in the string referred
+# to. Reloading the module rebinds those names and so invalidates the entries.
+_forward_ref_values: typing.Dict[
+    typing.Tuple[str, str], typing.Tuple[dict, tuple, typing.Any]
+] = {}
+_missing = object()
 
-    raise NotImplementedError()
+
+def _eval_bound_forward_ref(ref, module: str):
+    try:
+        namespace = sys.modules[module].__dict__
+    except KeyError:
+        raise NameError(f"module {module!r} of {ref} is not loaded") from None
+    key = (module, ref.__forward_arg__)
+    code = ref.__forward_code__
+    entry = _forward_ref_values.get(key)
+    if (
+        entry is not None
+        and entry[0] is namespace
+        and all(namespace.get(name, _missing) is value for name, value in entry[1])
+    ):
+        return entry[2]
+    value = bind_forward_refs(eval(code, namespace), module)
+    names = tuple((name, namespace.get(name, _missing)) for name in code.co_names)
+    _forward_ref_values[key] = (namespace, names, value)
+    return value
 
 
-class NormalizedType(typing.NamedTuple):
+def bind_forward_refs(type_, module: typing.Optional[str]):
+    """Bind the unevaluated forward references in `type_`, such as the ones
+    `get_type_hints` leaves in recursive type aliases, to `module`, so that they
+    are evaluated in the namespace of that module.
+    """
+    if module is None:
+        return type_
+    if isinstance(type_, ForwardRef):
+        if type_.__forward_module__ is not None:
+            return type_
+        return ForwardRef(type_.__forward_arg__, module=module)
+    args = getattr(type_, "__args__", None)
+    if not isinstance(args, tuple) or not args:
+        return type_
+    bound = tuple(bind_forward_refs(arg, module) for arg in args)
+    if all(new is old for new, old in zip(bound, args)):
+        return type_
+    try:
+        if UnionType and isinstance(type_, UnionType):
+            return typing.Union[bound]
+        if hasattr(type_, "copy_with"):
+            return type_.copy_with(bound)
+        if isinstance(type_, types.GenericAlias):
+            return types.GenericAlias(type_.__origin__, bound)  # type: ignore
+    except TypeError:
+        pass
+    return type_
+
+
+# Kinds of normalized types, which select the handler of a subtype check.
+_ANY, _UNION, _LITERAL, _TYPEVAR, _FORWARD_REF, _GENERIC, _CLASS = range(7)
+
+
+def _kind_of(origin, args) -> int:
+    if origin is typing.Any:
+        return _ANY
+    if is_union(origin):
+        return _UNION
+    if origin is Literal:
+        return _LITERAL
+    if isinstance(origin, typing.TypeVar):
+        return _TYPEVAR
+    if isinstance(origin, ForwardRef):
+        return _FORWARD_REF
+    return _GENERIC if args else _CLASS
+
+
+class NormalizedType:
     """
     Normalized type, made it possible to compare, hash between types.
+    Instances created by `normalize` for static types are interned, so equal
+    normalized types are usually the same object and their hash is computed only
+    once.
     """
 
-    origin: Type
-    args: typing.Union[tuple, frozenset] = tuple()
+    __slots__ = ("origin", "args", "_hash", "_lookup", "_kind")
+
+    def __init__(
+        self, origin: Type, args: typing.Union[tuple, frozenset] = tuple()
+    ) -> None:
+        self.origin = origin
+        self.args = args
+        self._hash: typing.Optional[int] = None
+        # Computed on first use by `_literal_values` or `_union_index`.
+        self._lookup: typing.Any = None
+        self._kind = _kind_of(origin, args)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, NormalizedType):
             if self.origin != other.origin:
                 return False
@@ -243,9 +309,12 @@ class NormalizedType(typing.NamedTuple):
         return False
 
     def __hash__(self) -> int:
-        if not self.args:
-            return hash(self.origin)
-        return hash((self.origin, self.args))
+        if self._hash is None:
+            if not self.args:
+                self._hash = hash(self.origin)
+            else:
+                self._hash = hash((self.origin, self.args))
+        return self._hash
 
     def __repr__(self):
         if not self.args:
@@ -253,6 +322,76 @@ class NormalizedType(typing.NamedTuple):
         return f"{self.origin}[{self.args}])"
 
 
+# Maximum number of entries in the `normalize` caches before they are emptied.
+NORMALIZE_CACHE_SIZE = 4096
+
+# Modules whose classes live as long as the interpreter, besides the standard
+# library.
+_STATIC_MODULES = frozenset({"typing_extensions"})
+
+
+def _is_static(type_) -> bool:
+    """Whether `type_` is only made of classes and type variables of the standard
+    library and of literal values, so that caching it keeps no class alive that
+    could otherwise be collected. Remembered for the types that can be weakly
+    referenced, so that nested types are only walked once.
+    """
+    try:
+        return _static_types[weakref.ref(type_)]
+    except KeyError:
+        pass
+    except TypeError:  # Not weakly referenceable or not hashable.
+        return _compute_is_static(type_)
+    static = _compute_is_static(type_)
+    _static_types[weakref.ref(type_, _forget_static_type)] = static
+    return static
+
+
+# Result of `_is_static` for the types that can be weakly referenced, keyed by
+# weak references to them. A plain dictionary rather than a `WeakKeyDictionary`,
+# whose lookups are much slower.
+_static_types: typing.Dict[weakref.ref, bool] = {}
+
+
+def _forget_static_type(reference: weakref.ref) -> None:
+    _static_types.pop(reference, None)
+
+
+def _compute_is_static(type_) -> bool:
+    if type_ is None or type_ is Ellipsis or isinstance(type_, (str, bytes, int)):
+        return True
+    if isinstance(type_, (list, tuple)):  # Parameters of `Callable`.
+        return all(map(_is_static, type_))
+    if isinstance(type_, ForwardRef):  # May hold on to its evaluated value.
+        return False
+    if isinstance(type_, typing.TypeVar):
+        return _is_static(type_.__bound__) and all(
+            map(_is_static, type_.__constraints__)
+        )
+    origin = _typing_get_origin(type_)
+    if origin is not None:
+        return _is_static(origin) and all(map(_is_static, _typing_get_args(type_)))
+    module = getattr(type_, "__module__", None)
+    if not isinstance(module, str):
+        return False
+    module = module.partition(".")[0]
+    return module in sys.stdlib_module_names or module in _STATIC_MODULES
+
+
+# Canonical instance of every normalized type, and the normalized type of every
+# (hashable) type expression passed to `normalize`. Only static types are kept,
+# see `_is_static`.
+_interned_types: typing.Dict[NormalizedType, NormalizedType] = {}
+_normalized_types: typing.Dict[typing.Any, NormalizedType] = {}
+
+
+def _intern(normal: NormalizedType) -> NormalizedType:
+    try:
+        return _interned_types.setdefault(normal, normal)
+    except TypeError:
+        return normal
+
+
 def _normalize_args(tps: TypeArgs):
     if isinstance(tps, str):
         return tps
@@ -267,6 +406,24 @@ def normalize(type_: Type) -> NormalizedType:
     """
     convert types to NormalizedType instances.
     """
+    try:
+        return _normalized_types[type_]
+    except KeyError:
+        pass
+    except TypeError:
+        return _normalize(type_)
+    normal = _normalize(type_)
+    if not _is_static(type_):
+        return normal
+    if len(_normalized_types) >= NORMALIZE_CACHE_SIZE:
+        _normalized_types.clear()
+        _interned_types.clear()
+    normal = _intern(normal)
+    _normalized_types[type_] = normal
+    return normal
+
+
+def _normalize(type_: Type) -> NormalizedType:
     args = get_args(type_)
     origin = get_origin(type_)
     if not origin:
@@ -280,10 +437,60 @@ def normalize(type_: Type) -> NormalizedType:
     return NormalizedType(origin, args)
 
 
+# Subtype relation of origins that are not both plain classes, keyed by weak
+# references to them, so that caching does not keep classes alive. Entries of
+# collected classes are removed on the next insertion after a collection. Classes
+# whose metaclass customizes `issubclass` are not kept, see `_is_origin_subtype`.
+_origin_subtypes: typing.Dict[typing.Tuple[weakref.ref, weakref.ref], bool] = {}
+_collected_origins = [False]
+
+
+def _forget_collected_origins(_: weakref.ref) -> None:
+    _collected_origins[0] = True
+
+
 def _is_origin_subtype(left: OriginType, right: OriginType) -> bool:
     if left is right:
         return True
+    # A class whose metaclass is `type` cannot customize `issubclass`.
+    if type(left) is type and type(right) is type:
+        return (
+            issubclass(left, right)  # type: ignore
+            or STATIC_SUBTYPE_MAPPING.get(left) is right  # type: ignore
+        )
 
+    # The result can change after e.g. `ABCMeta.register`, `ABCMeta` caches it
+    # itself and forgets it when needed.
+    if (
+        isinstance(right, type)
+        and type(right).__subclasscheck__ is not type.__subclasscheck__
+    ):
+        return _compute_origin_subtype(left, right)
+
+    try:
+        key = (weakref.ref(left), weakref.ref(right))  # type: ignore
+        hash(key)
+    except TypeError:  # Not weakly referenceable or not hashable.
+        return _compute_origin_subtype(left, right)
+    try:
+        return _origin_subtypes[key]
+    except KeyError:
+        pass
+    result = _compute_origin_subtype(left, right)
+    if _collected_origins[0]:
+        _collected_origins[0] = False
+        for key in snapshot(_origin_subtypes):
+            if key[0]() is None or key[1]() is None:
+                _origin_subtypes.pop(key, None)
+    key = (
+        weakref.ref(left, _forget_collected_origins),  # type: ignore
+        weakref.ref(right, _forget_collected_origins),  # type: ignore
+    )
+    _origin_subtypes[key] = result
+    return result
+
+
+def _compute_origin_subtype(left: OriginType, right: OriginType) -> bool:
     if (
         left is not None
         and left in STATIC_SUBTYPE_MAPPING
@@ -302,6 +509,54 @@ def _is_origin_subtype(left: OriginType, right: OriginType) -> bool:
     return left == right
 
 
+def _literal_values(literal: NormalizedType) -> typing.FrozenSet:
+    """Get the set of values of a normalized Literal."""
+    if literal._lookup is None:
+        literal._lookup = frozenset(literal.args)
+    return literal._lookup
+
+
+def _union_index(union: NormalizedType):
+    """Get the members of a normalized Union whose origin is a plain class (or
+    None), by origin, and a list of the other members.
+
+    A class whose metaclass is `type` is a subclass of another class only if the
+    other class is in its MRO. Other members, such as ABCs, protocols, Literals
+    and TypeVars, may match anything.
+    """
+    if union._lookup is None:
+        by_origin: typing.Dict[typing.Any, typing.List[NormalizedType]] = {}
+        others = []
+        for member in union.args:
+            if member.origin is None or type(member.origin) is type:
+                by_origin.setdefault(member.origin, []).append(member)
+            else:
+                others.append(member)
+        union._lookup = (by_origin, others)
+    return union._lookup
+
+
+def _union_candidates(
+    left: NormalizedType, union: NormalizedType
+) -> typing.Iterable[NormalizedType]:
+    """Get the members of `union` that `left` may be a subtype of. `left` is not
+    a subtype of the other members.
+    """
+    origin = left.origin
+    if origin is not None and not isinstance(origin, type):
+        return union.args
+    by_origin, others = _union_index(union)
+    if origin is None:
+        return itertools.chain(by_origin.get(None, ()), others)
+    keys: typing.List[typing.Any] = list(origin.__mro__)
+    if origin in STATIC_SUBTYPE_MAPPING:
+        keys.append(STATIC_SUBTYPE_MAPPING[origin])
+    return itertools.chain(
+        itertools.chain.from_iterable(by_origin.get(key, ()) for key in keys),
+        others,
+    )
+
+
 NormalizedTypeArgs = typing.Union[
     typing.Tuple[typing.Any, ...],
     typing.FrozenSet[NormalizedType],
@@ -309,31 +564,48 @@ NormalizedTypeArgs = typing.Union[
 ]
 
 
+def _is_union_subtype(
+    left: NormalizedType,
+    right: NormalizedType,
+    forward_refs: typing.Optional[typing.Mapping[str, type]],
+) -> bool:
+    excluded: typing.FrozenSet[NormalizedType] = left.args - right.args  # type: ignore
+    if not excluded:
+        # Union[str, int] <> Union[int, str]
+        return True
+
+    # Union[list, int] <> Union[typing.Sequence, int]
+    return all(
+        any(_is_normal_subtype(e, r, forward_refs) for r in _union_candidates(e, right))
+        for e in excluded
+    )
+
+
 def _is_origin_subtype_args(
     left: "NormalizedTypeArgs",
     right: "NormalizedTypeArgs",
     forward_refs: typing.Optional[typing.Mapping[str, type]],
 ) -> typing.Optional[bool]:
+    if isinstance(left, NormalizedType):
+        assert isinstance(right, NormalizedType)
+        return _is_normal_subtype(left, right, forward_refs)
+
     if isinstance(left, frozenset):
         if not isinstance(right, frozenset):
             return False
 
         excluded = left - right
         if not excluded:
-            # Union[str, int] <> Union[int, str]
             return True
 
-        # Union[list, int] <> Union[typing.Sequence, int]
         return all(
             any(_is_normal_subtype(e, r, forward_refs) for r in right) for e in excluded
         )
 
-    if isinstance(left, collections.abc.Sequence) and not isinstance(
-        left, NormalizedType
-    ):
-        if not isinstance(right, collections.abc.Sequence) or isinstance(
-            right, NormalizedType
-        ):
+    if isinstance(left, tuple) or isinstance(left, collections.abc.Sequence):
+        if not (
+            isinstance(right, tuple) or isinstance(right, collections.abc.Sequence)
+        ) or isinstance(right, NormalizedType):
             return False
 
         if (
@@ -355,10 +627,7 @@ def _is_origin_subtype_args(
             for l, r in itertools.zip_longest(left, right)
         )
 
-    assert isinstance(left, NormalizedType)
-    assert isinstance(right, NormalizedType)
-
-    return _is_normal_subtype(left, right, forward_refs)
+    raise AssertionError(f"Unexpected type arguments {left!r}")
 
 
 def _is_normal_subtype(
@@ -366,68 +635,112 @@ def _is_normal_subtype(
     right: NormalizedType,
     forward_refs: typing.Optional[typing.Mapping[str, type]],
 ) -> typing.Optional[bool]:
-    if isinstance(left.origin, ForwardRef):
-        left = normalize(eval_forward_ref(left.origin, forward_refs=forward_refs))
+    return _SUBTYPE_HANDLERS[left._kind][right._kind](left, right, forward_refs)
+
 
-    if isinstance(right.origin, ForwardRef):
+def _is_forward_ref_subtype(left, right, forward_refs):
+    if left._kind == _FORWARD_REF:
+        left = normalize(eval_forward_ref(left.origin, forward_refs=forward_refs))
+    if right._kind == _FORWARD_REF:
         right = normalize(eval_forward_ref(right.origin, forward_refs=forward_refs))
+    # A reference evaluating to another one is compared like a class.
+    left_kind = _CLASS if left._kind == _FORWARD_REF else left._kind
+    right_kind = _CLASS if right._kind == _FORWARD_REF else right._kind
+    return _SUBTYPE_HANDLERS[left_kind][right_kind](left, right, forward_refs)
+
+
+def _is_any_subtype(left, right, forward_refs):
+    return True
 
-    # Any
-    if right.origin is typing.Any:
+
+def _is_member_of_union_subtype(left, right, forward_refs):
+    if left in right.args:
         return True
+    return optional_any(
+        _is_normal_subtype(left, a, forward_refs)
+        for a in _union_candidates(left, right)
+    )
 
-    # Union
-    if is_union(right.origin) and is_union(left.origin):
-        return _is_origin_subtype_args(left.args, right.args, forward_refs)
-    if is_union(right.origin):
-        return optional_any(
-            _is_normal_subtype(left, a, forward_refs) for a in right.args
-        )
-    if is_union(left.origin):
-        return optional_all(
-            _is_normal_subtype(a, right, forward_refs) for a in left.args
-        )
 
-    # Literal
-    if right.origin is Literal:
-        if left.origin is not Literal:
-            return False
-        return set(left.args).issubset(set(right.args))
+def _is_union_of_subtypes(left, right, forward_refs):
+    return optional_all(_is_normal_subtype(a, right, forward_refs) for a in left.args)
 
-    # TypeVar
-    if isinstance(left.origin, typing.TypeVar) and isinstance(
-        right.origin, typing.TypeVar
-    ):
-        if left.origin is right.origin:
-            return True
 
-        left_bound = getattr(left.origin, "__bound__", None)
-        right_bound = getattr(right.origin, "__bound__", None)
-        if right_bound is None or left_bound is None:
-            return unknown
-        return _is_normal_subtype(
-            normalize(left_bound), normalize(right_bound), forward_refs
-        )
-    if isinstance(right.origin, typing.TypeVar):
+def _is_not_literal_subtype(left, right, forward_refs):
+    return False
+
+
+def _is_literal_subtype(left, right, forward_refs):
+    return _literal_values(left) <= _literal_values(right)
+
+
+def _is_typevar_subtype(left, right, forward_refs):
+    if left.origin is right.origin:
+        return True
+
+    left_bound = getattr(left.origin, "__bound__", None)
+    right_bound = getattr(right.origin, "__bound__", None)
+    if right_bound is None or left_bound is None:
         return unknown
-    if isinstance(left.origin, typing.TypeVar):
-        left_bound = getattr(left.origin, "__bound__", None)
-        if left_bound is None:
-            return unknown
-        return _is_normal_subtype(normalize(left_bound), right, forward_refs)
+    return _is_normal_subtype(
+        normalize(left_bound), normalize(right_bound), forward_refs
+    )
 
-    if not left.args and not right.args:
-        return _is_origin_subtype(left.origin, right.origin)
 
-    if not right.args:
-        return _is_origin_subtype(left.origin, right.origin)
+def _is_unknown_subtype(left, right, forward_refs):
+    return unknown
+
 
+def _is_bound_subtype(left, right, forward_refs):
+    left_bound = getattr(left.origin, "__bound__", None)
+    if left_bound is None:
+        return unknown
+    return _is_normal_subtype(normalize(left_bound), right, forward_refs)
+
+
+def _is_class_subtype(left, right, forward_refs):
+    return _is_origin_subtype(left.origin, right.origin)
+
+
+def _is_generic_subtype(left, right, forward_refs):
     if _is_origin_subtype(left.origin, right.origin):
         return _is_origin_subtype_args(left.args, right.args, forward_refs)
-
     return False
 
 
+def _select_handler(left: int, right: int):
+    """Get the handler of subtype checks between normalized types of the kinds
+    `left` and `right`, in the order of precedence of the checks.
+    """
+    if _FORWARD_REF in (left, right):
+        return _is_forward_ref_subtype
+    if right == _ANY:
+        return _is_any_subtype
+    if left == _UNION and right == _UNION:
+        return _is_union_subtype
+    if right == _UNION:
+        return _is_member_of_union_subtype
+    if left == _UNION:
+        return _is_union_of_subtypes
+    if right == _LITERAL:
+        return _is_literal_subtype if left == _LITERAL else _is_not_literal_subtype
+    if left == _TYPEVAR and right == _TYPEVAR:
+        return _is_typevar_subtype
+    if right == _TYPEVAR:
+        return _is_unknown_subtype
+    if left == _TYPEVAR:
+        return _is_bound_subtype
+    if right == _GENERIC:
+        return _is_generic_subtype
+    return _is_class_subtype
+
+
+_KINDS = range(_CLASS + 1)
+_SUBTYPE_HANDLERS = [
+    [_select_handler(left, right) for right in _KINDS] for left in _KINDS
+]
+
+
 def issubtype(
     left: Type,
     right: Type,
@@ -460,7 +773,79 @@ def issubtype(
         issubtype(typing.Dict[str, bytes], JSON, forward_refs={'JSON': JSON}) == False
     ```
     """
-    return _is_normal_subtype(normalize(left), normalize(right), forward_refs)
+    _count("issubtype_calls")
+    if forward_refs:
+        return _timed_issubtype(left, right, forward_refs)
+    try:
+        key = (_cache_key(left), _cache_key(right), abc.get_cache_token())
+        cached = _issubtype_cache.get(key, _missing)
+    except TypeError:  # Not hashable, or not static and not weakly referenceable.
+        return _timed_issubtype(left, right, None)
+    if cached is not _missing:
+        return cached[0]
+    result = _timed_issubtype(left, right, None)
+    # Static types are kept alive by the entry, so that it is found as long as
+    # it is cached even if they are created anew for every call.
+    _issubtype_cache.set(key, (result, tuple(filter(_is_static, (left, right)))))
+    return result
+
+
+# Decisions of `issubtype` calls without `forward_refs`, and the static types
+# among their arguments, see `_cache_key`. The token of `abc` in the keys changes
+# with every `ABCMeta.register`. A `StripedCache` rather than
+# `functools.lru_cache`, which serializes all calls on free-threaded builds.
+_issubtype_cache = StripedCache(ISSUBTYPE_CACHE_SIZE)
+
+
+def _cache_key(type_):
+    """Get the key of `type_` in the `issubtype` cache. Types are weakly
+    referenced so that caching them does not keep classes alive, entries of
+    collected types are no longer found and evicted in time. The hash of a weak
+    reference is computed once, unlike that of most type aliases.
+
+    :raises TypeError: if `type_` is neither weakly referenceable nor static, see
+        `_is_static`.
+    """
+    try:
+        return weakref.ref(type_)
+    except TypeError:
+        if _is_static(type_):
+            return type_
+        raise
+
+
+def _timed_issubtype(
+    left: Type, right: Type, forward_refs: typing.Optional[dict]
+) -> typing.Optional[bool]:
+    # Only decisions that are not cached are timed, the clock costs more than a
+    # cache hit.
+    start = clock()
+    try:
+        return _is_normal_subtype(normalize(left), normalize(right), forward_refs)
+    finally:
+        _add_time("issubtype", start)
+
+
+def cache_info():
+    """Report hits, misses and size of the `issubtype` decision cache.
+    Calls with `forward_refs`, with unhashable types or with `X | Y` unions of
+    classes from outside the standard library bypass the cache.
+    """
+    return _issubtype_cache.cache_info()
+
+
+def cache_clear() -> None:
+    """Forget all remembered `issubtype` decisions, normalized types, subclass
+    relations and forward reference values and reset the statistics. Needed when
+    the subclass relation changes other than through `ABCMeta.register`, which
+    is picked up by itself.
+    """
+    _issubtype_cache.clear()
+    _normalized_types.clear()
+    _interned_types.clear()
+    _origin_subtypes.clear()
+    _static_types.clear()
+    _forward_ref_values.clear()
 
 
 __all__ = [
@@ -0,0 +1,438 @@
+"""Checks of the values passed to and returned from overrides, for
+`override(check_values=True)`.
+
+On the first call of the method a validator is generated from the resolved type
+hints: a function with the same parameters as the method, so that Python binds
+the arguments, checking each annotated parameter with a check compiled for its
+type. Plain classes are checked with a single `isinstance`, Unions of classes
+with one `isinstance` on a tuple, and the items of lists, tuples, sets and dicts
+with the check of their item type. Later calls do no signature or type hint
+work. Arguments are checked against the type hints of the overriding method and
+the returned value against the return type of the overridden method, the
+contract callers of the base class rely on.
+
+Types that cannot be checked at runtime, such as unbound TypeVars, protocols
+that are not `runtime_checkable` and unresolved forward references, accept any
+value. Iterators and other lazy iterables are never consumed.
+
+With a `Sampling` only some calls are checked, so that the checks can stay
+enabled under production traffic.
+"""
+
+import collections
+import collections.abc
+import functools
+import inspect
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from overrides.signature import _get_signature_and_type_hints, _unbound_func
+from overrides.stats import _count, clock
+from overrides.typing_utils import _TypedDictMeta, is_union
+
+_Check = Callable[[Any], bool]
+
+# Classes accepted in place of others (PEP 484 numeric promotion).
+_PROMOTIONS: Dict[type, Tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+# Containers whose items are checked. Iterating other iterables may consume them
+# or be expensive.
+_ITERATED = (list, tuple, set, frozenset, dict, collections.deque)
+
+
+def compile_check(hint) -> Optional[_Check]:
+    """Get a function checking whether a value is of the type `hint`, or None if
+    every value is accepted.
+    """
+    if hint is typing.Any or hint is object:
+        return None
+    if hint is None or hint is type(None):
+        return _is_none
+    if isinstance(hint, (str, typing.ForwardRef)):
+        return None
+    if isinstance(hint, typing.TypeVar):
+        if hint.__bound__ is not None:
+            return compile_check(hint.__bound__)
+        if hint.__constraints__:
+            return compile_check(typing.Union[hint.__constraints__])
+        return None
+    supertype = getattr(hint, "__supertype__", None)
+    if supertype is not None:  # NewType
+        return compile_check(supertype)
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin is None:
+        classes = _get_classes(hint)
+        return None if classes is None else _instance_check(classes)
+    if origin is typing.Annotated:
+        return compile_check(args[0])
+    if is_union(origin):
+        return _compile_union(args)
+    if origin is typing.Literal:
+        return _compile_literal(args)
+    if origin is type:
+        return _compile_type(args[0] if args else typing.Any)
+    if origin is collections.abc.Callable:
+        return callable
+    if not isinstance(origin, type):  # ClassVar, Final, Concatenate, ...
+        return None
+    if origin is tuple:
+        return _compile_tuple(args)
+    is_origin = _instance_check((origin,))
+    if issubclass(origin, collections.abc.Mapping) and len(args) == 2:
+        return _compile_mapping(is_origin, args)
+    if issubclass(origin, collections.abc.Iterable) and len(args) == 1:
+        return _compile_items(is_origin, compile_check(args[0]))
+    return is_origin
+
+
+def _is_none(value) -> bool:
+    return value is None
+
+
+def _get_classes(hint) -> Optional[Tuple[type, ...]]:
+    """Get the classes a plain class hint accepts instances of, or None if they
+    cannot be checked with `isinstance`.
+    """
+    if not isinstance(hint, type):
+        return None
+    if _TypedDictMeta is not None and isinstance(hint, _TypedDictMeta):
+        return (dict,)
+    if getattr(hint, "_is_protocol", False) and not getattr(
+        hint, "_is_runtime_protocol", False
+    ):
+        return None
+    return _PROMOTIONS.get(hint, (hint,))
+
+
+def _instance_check(classes: Tuple[type, ...]) -> _Check:
+    def check(value) -> bool:
+        return isinstance(value, classes)
+
+    return check
+
+
+def _compile_union(args) -> Optional[_Check]:
+    classes: List[type] = []
+    others = []
+    for arg in args:
+        arg_classes = _get_classes(arg)
+        if arg_classes is not None:
+            classes.extend(arg_classes)
+            continue
+        arg_check = compile_check(arg)
+        if arg_check is None:
+            return None
+        others.append(arg_check)
+    if not others:
+        return _instance_check(tuple(classes))
+    union_classes = tuple(classes)
+
+    def check(value) -> bool:
+        return isinstance(value, union_classes) or any(c(value) for c in others)
+
+    return check
+
+
+def _compile_literal(values) -> _Check:
+    hashable = []
+    unhashable = []
+    for value in values:
+        try:
+            hash(value)
+            hashable.append((type(value), value))
+        except TypeError:
+            unhashable.append(value)
+    allowed = frozenset(hashable)
+
+    def check(value) -> bool:
+        try:
+            if (type(value), value) in allowed:
+                return True
+        except TypeError:
+            pass
+        return any(type(value) is type(v) and value == v for v in unhashable)
+
+    return check
+
+
+def _compile_type(arg) -> _Check:
+    if arg is typing.Any or isinstance(arg, typing.TypeVar):
+        classes: Optional[Tuple[type, ...]] = None
+    elif is_union(typing.get_origin(arg)):
+        classes = tuple(a for a in typing.get_args(arg) if isinstance(a, type))
+    else:
+        classes = (arg,) if isinstance(arg, type) else None
+
+    def check(value) -> bool:
+        return isinstance(value, type) and (
+            classes is None or issubclass(value, classes)
+        )
+
+    return check
+
+
+def _compile_tuple(args) -> _Check:
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _compile_items(_instance_check((tuple,)), compile_check(args[0]))
+    if args == ((),):  # Tuple[()]
+        args = ()
+    checks = [compile_check(arg) for arg in args]
+    if not args:
+        return _instance_check((tuple,))
+    if all(c is None for c in checks):
+
+        def check_length(value) -> bool:
+            return isinstance(value, tuple) and len(value) == len(checks)
+
+        return check_length
+
+    def check(value) -> bool:
+        return (
+            isinstance(value, tuple)
+            and len(value) == len(checks)
+            and all(c is None or c(item) for c, item in zip(checks, value))
+        )
+
+    return check
+
+
+def _compile_items(is_container: _Check, item_check: Optional[_Check]) -> _Check:
+    if item_check is None:
+        return is_container
+
+    def check(value) -> bool:
+        if not is_container(value):
+            return False
+        if isinstance(value, dict) or not isinstance(value, _ITERATED):
+            return True
+        return all(item_check(item) for item in value)
+
+    return check
+
+
+def _compile_mapping(is_mapping: _Check, args) -> _Check:
+    key_check = compile_check(args[0])
+    value_check = compile_check(args[1])
+    if key_check is None and value_check is None:
+        return is_mapping
+
+    def check(value) -> bool:
+        if not is_mapping(value):
+            return False
+        if not isinstance(value, dict):
+            return True
+        return all(
+            (key_check is None or key_check(k))
+            and (value_check is None or value_check(v))
+            for k, v in value.items()
+        )
+
+    return check
+
+
+class Sampling:
+    """Which calls of an `override(check_values=...)` method are checked.
+
+    How to use:
+    from overrides import Sampling, override
+
+    class SubClass(SuperClass):
+        @override(check_values=Sampling(every=100, budget=0.001))
+        def method(self, x: int) -> int:
+            return x
+
+    :param every: Check one call in `every`, starting with the first one.
+    :param budget: Fraction of the time a method may spend checking its values,
+        for example 0.001 for at most 1 ms per second. Calls are not checked once
+        the checks of the method used up the budget of the current `window`.
+    :param window: Length in seconds of the periods the budget is spent in.
+    :raises ValueError: if `every` is below 1 or `budget` or `window` are not
+        positive.
+    """
+
+    __slots__ = ("every", "budget", "window")
+
+    def __init__(
+        self, every: int = 1, budget: Optional[float] = None, window: float = 1.0
+    ):
+        if every < 1:
+            raise ValueError(f"every must be at least 1, not {every!r}")
+        if budget is not None and budget <= 0:
+            raise ValueError(f"budget must be positive, not {budget!r}")
+        if window <= 0:
+            raise ValueError(f"window must be positive, not {window!r}")
+        self.every = every
+        self.budget = budget
+        self.window = window
+
+    def __repr__(self) -> str:
+        return (
+            f"Sampling(every={self.every!r}, budget={self.budget!r}, "
+            f"window={self.window!r})"
+        )
+
+
+class _Sampler:
+    """The state of the `Sampling` of one method. Updated without locking, so
+    concurrent calls may occasionally check a call more or less.
+    """
+
+    __slots__ = ("every", "calls", "window", "budget", "window_start", "spent")
+
+    def __init__(self, sampling: Sampling):
+        self.every = sampling.every
+        self.calls = sampling.every - 1  # The first call is checked.
+        self.window = int(sampling.window * 1e9)
+        self.budget = (
+            None if sampling.budget is None else int(sampling.budget * self.window)
+        )
+        self.window_start = 0
+        self.spent = 0
+
+    def take(self) -> bool:
+        """Whether or not to check the current call."""
+        if self.every > 1:
+            self.calls += 1
+            if self.calls < self.every:
+                return False
+            self.calls = 0
+        if self.budget is None:
+            return True
+        now = clock()
+        if now - self.window_start >= self.window:
+            self.window_start = now
+            self.spent = 0
+        return self.spent < self.budget
+
+
+def checking_values(
+    method: Callable, super_method: Callable, sampling: Optional[Sampling] = None
+) -> Callable:
+    """Wrap `method` so that its arguments and returned values are checked on
+    every call, or on the calls selected by `sampling`.
+
+    :raises TypeError: from the wrapper, for the first argument or returned value
+        that is not of its type.
+    """
+    validators: List[Tuple[Callable, Optional[_Check], Any]] = []
+    sampler = None if sampling is None else _Sampler(sampling)
+    timed = sampler is not None and sampler.budget is not None
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if sampler is not None and not sampler.take():
+            return method(*args, **kwargs)
+        if not validators:
+            validators.append(_compile_validators(method, super_method))
+        validate_arguments, check_return, return_hint = validators[0]
+        _count("value_check_calls")
+        start = clock() if timed else 0
+        validate_arguments(*args, **kwargs)
+        if timed:
+            sampler.spent += clock() - start
+        result = method(*args, **kwargs)
+        if check_return is not None:
+            start = clock() if timed else 0
+            valid = check_return(result)
+            if timed:
+                sampler.spent += clock() - start
+            if not valid:
+                raise TypeError(
+                    f"{method.__qualname__}: returned value of type "
+                    f"`{type(result).__qualname__}` is not a "
+                    f"`{inspect.formatannotation(return_hint)}`"
+                )
+        return result
+
+    return wrapper
+
+
+def _compile_validators(method: Callable, super_method: Callable):
+    """Get a function taking the arguments of `method` and raising TypeError if
+    one of them is not of its type, the check of returned values and the type
+    they are checked against.
+    """
+    signature, type_hints = _get_signature_and_type_hints(_unbound_func(method))
+    type_hints = type_hints or {}
+    try:
+        _, super_type_hints = _get_signature_and_type_hints(_unbound_func(super_method))
+    except ValueError:
+        super_type_hints = None
+    return_hint = (super_type_hints or {}).get("return", type_hints.get("return"))
+    check_return = None if return_hint is None else compile_check(return_hint)
+
+    # Names of the generated function, its helpers and locals start with a
+    # prefix that no parameter starts with, so that none of them is shadowed.
+    reserved = "_v_"
+    while any(name.startswith(reserved) for name in signature.parameters):
+        reserved += "_"
+    namespace: Dict[str, Any] = {
+        f"{reserved}missing": _missing,
+        f"{reserved}fail": functools.partial(_fail, method.__qualname__),
+    }
+    parameters = []
+    body = []
+    marker_added = False
+    for index, (name, parameter) in enumerate(signature.parameters.items()):
+        kind = parameter.kind
+        if kind is inspect.Parameter.KEYWORD_ONLY and not marker_added:
+            parameters.append("*")
+            marker_added = True
+        prefix = ""
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            prefix = "*"
+            marker_added = True
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            prefix = "**"
+        default = (
+            ""
+            if parameter.default is inspect.Parameter.empty
+            else f"={reserved}missing"
+        )
+        parameters.append(f"{prefix}{name}{default}")
+        check = compile_check(type_hints[name]) if name in type_hints else None
+        if check is None:
+            continue
+        namespace[f"{reserved}check_{index}"] = check
+        namespace[f"{reserved}hint_{index}"] = type_hints[name]
+        value = f"{reserved}value"
+        check_value = (
+            f"if not {reserved}check_{index}({value}): "
+            f"{reserved}fail({name!r}, {value}, {reserved}hint_{index})"
+        )
+        if kind is inspect.Parameter.VAR_POSITIONAL:
+            body.append(f"    for {value} in {name}:\n        {check_value}")
+        elif kind is inspect.Parameter.VAR_KEYWORD:
+            body.append(f"    for {value} in {name}.values():\n        {check_value}")
+        elif default:
+            body.append(
+                f"    {value} = {name}\n    if {value} is not {reserved}missing:"
+            )
+            body.append(f"        {check_value}")
+        else:
+            body.append(f"    {value} = {name}\n    {check_value}")
+    positional_only = sum(
+        p.kind is inspect.Parameter.POSITIONAL_ONLY
+        for p in signature.parameters.values()
+    )
+    if positional_only:  # They come first.
+        parameters.insert(positional_only, "/")
+    source = "def {}validate({}):\n{}".format(
+        reserved, ", ".join(parameters), "\n".join(body) or "    pass"
+    )
+    exec(compile(source, f"<validator of {method.__qualname__}>", "exec"), namespace)
+    return namespace[f"{reserved}validate"], check_return, return_hint
+
+
+_missing = object()
+
+
+def _fail(qualname: str, name: str, value, hint) -> None:
+    raise TypeError(
+        f"{qualname}: `{name}` of type `{type(value).__qualname__}` is not a "
+        f"`{inspect.formatannotation(hint)}`"
+    )
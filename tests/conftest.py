@@ -0,0 +1,9 @@
+import pytest
+
+from overrides import set_check_level
+
+
+@pytest.fixture(autouse=True)
+def reset_check_level():
+    yield
+    set_check_level(None)
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import sys
+import types
+import unittest
+
+from overrides import EnforceOverrides, background, override
+from overrides.overrides import _background_claims, _pending_claims
+
+
+class SuperClass:
+    def method(self, x: int) -> int:
+        """Super Class Docs"""
+        return x
+
+
+class EnforcedSuperClass(EnforceOverrides):
+    def __init__(self, value):
+        self.value = value
+
+    def method(self, x: int) -> int:
+        return x
+
+
+INVALID_MODULE_SOURCE = """
+from overrides import override
+from test_background import SuperClass
+
+class Invalid(SuperClass):
+    @override
+    def method(self, x: str) -> int:
+        return 0
+"""
+
+
+class BackgroundTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(self.forget_new_claims, set(_pending_claims))
+        self.addCleanup(background.stop)
+
+    @staticmethod
+    def forget_new_claims(old_claims):
+        _background_claims.clear()
+        for method in set(_pending_claims) - old_claims:
+            _pending_claims.pop(method, None)
+
+    def test_overrides_are_checked_in_a_thread(self):
+        background.start()
+
+        class Valid(SuperClass):
+            @override
+            def method(self, x: int) -> int:
+                return x + 1
+
+        self.assertTrue(background.wait(timeout=5))
+        self.assertEqual(Valid.method.__doc__, "Super Class Docs")
+        self.assertNotIn(Valid.method, _pending_claims)
+
+    def test_invalid_override_is_logged(self):
+        background.start(on_error="log")
+        with self.assertLogs("overrides", logging.ERROR) as logs:
+
+            class Invalid(SuperClass):
+                @override
+                def method(self, x: str) -> int:
+                    return 0
+
+            self.assertTrue(background.wait(timeout=5))
+        self.assertIn("Invalid.method", logs.output[0])
+        self.assertEqual(Invalid().method("x"), 0)
+
+    def test_invalid_override_raises_on_next_call(self):
+        module = types.ModuleType("background_example")
+        self.addCleanup(sys.modules.pop, module.__name__, None)
+        sys.modules[module.__name__] = module
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.addCleanup(background.stop)
+        # The checks run only when the loop runs, after the class has been created.
+        background.start("asyncio", on_error="raise", loop=loop)
+        exec(INVALID_MODULE_SOURCE, vars(module))
+        self.assertEqual(module.Invalid().method("x"), 0)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        with self.assertRaises(TypeError):
+            module.Invalid().method("x")
+
+    def test_custom_error_handler(self):
+        errors = []
+        background.start(on_error=lambda method, error: errors.append(method))
+
+        class Invalid(SuperClass):
+            @override
+            def method(self, x: str) -> int:
+                return 0
+
+        self.assertTrue(background.wait(timeout=5))
+        self.assertEqual(errors, [vars(Invalid)["method"]])
+
+    def test_instantiation_does_not_run_background_checks(self):
+        errors = []
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.addCleanup(background.stop)
+        background.start(
+            "asyncio", on_error=lambda method, error: errors.append(method), loop=loop
+        )
+
+        class Invalid(EnforcedSuperClass):
+            @override
+            def method(self, x: str) -> int:
+                return 0
+
+        self.assertEqual(Invalid(1).value, 1)
+        self.assertEqual(errors, [])
+        loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(errors, [vars(Invalid)["method"]])
+
+    def test_overrides_are_checked_in_asyncio_time_slices(self):
+        errors = []
+
+        async def main():
+            background.start(
+                "asyncio", on_error=lambda method, error: errors.append(method)
+            )
+
+            class Valid(SuperClass):
+                @override
+                def method(self, x: int) -> int:
+                    return x
+
+            class Invalid(SuperClass):
+                @override
+                def method(self, x: str) -> int:
+                    return 0
+
+            self.assertIn(Valid.method, _pending_claims)
+            for _ in range(100):
+                await asyncio.sleep(0)
+                if not _pending_claims:
+                    break
+            background.stop()
+            return Valid, Invalid
+
+        Valid, Invalid = asyncio.run(main())
+        self.assertEqual(Valid.method.__doc__, "Super Class Docs")
+        self.assertEqual(errors, [vars(Invalid)["method"]])
+
+    def test_overrides_are_checked_at_once_after_stop(self):
+        background.start()
+        background.stop()
+
+        class Valid(SuperClass):
+            @override
+            def method(self, x: int) -> int:
+                return x
+
+        self.assertEqual(Valid.method.__doc__, "Super Class Docs")
+
+    def test_unknown_mode_and_handler(self):
+        with self.assertRaises(ValueError):
+            background.start("process")
+        with self.assertRaises(ValueError):
+            background.start(on_error="ignore")
@@ -0,0 +1,16 @@
+from benchmarks import suite
+
+
+def test_compare_reports_slowdowns_beyond_the_threshold():
+    baseline = {"fast": 100.0, "steady": 100.0, "slow": 100.0, "removed": 100.0}
+    results = {"fast": 50.0, "steady": 125.0, "slow": 126.0, "new": 1000.0}
+    assert suite.compare(baseline, results, 0.25) == ["slow"]
+    assert suite.compare(baseline, results, 0.0) == ["steady", "slow"]
+    assert suite.compare({}, results, 0.25) == []
+
+
+def test_benchmarks_run():
+    names = [name for name, _, _ in suite.BENCHMARKS]
+    assert len(names) == len(set(names))
+    for _, make, _ in suite.BENCHMARKS:
+        make()()
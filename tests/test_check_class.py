@@ -0,0 +1,124 @@
+import pytest
+
+from overrides import (
+    CheckLevel,
+    check_class,
+    override,
+    set_check_level,
+    validate_class,
+)
+from overrides.overrides import _pending_claims
+
+
+def mark(method):
+    """Marks an override without checking it, like `typing.override`."""
+    method.__override__ = True
+    return method
+
+
+class SuperClass:
+    def method(self, x: int) -> int:
+        """Super Class Docs"""
+        return x
+
+    def other(self, y: str) -> str:
+        return y
+
+    @staticmethod
+    def static_method(x: int) -> int:
+        return x
+
+    @classmethod
+    def class_method(cls) -> str:
+        return ""
+
+    @property
+    def value(self) -> int:
+        return 0
+
+
+def test_marked_methods_are_checked():
+    @check_class
+    class SubClass(SuperClass):
+        @mark
+        def method(self, x: int) -> int:
+            return x + 1
+
+        @staticmethod
+        @mark
+        def static_method(x: int) -> int:
+            return x
+
+        @classmethod
+        @mark
+        def class_method(cls) -> str:
+            return "sub"
+
+        @property
+        @mark
+        def value(self) -> int:
+            return 1
+
+        def unmarked(self, x: str) -> None:
+            pass
+
+    assert SubClass.method.__doc__ == "Super Class Docs"
+    assert SubClass.class_method() == "sub"
+
+
+def test_same_errors_as_override():
+    def define(decorator):
+        class SubClass(SuperClass):
+            @decorator
+            def method(self, x: str) -> int:
+                return 0
+
+        return SubClass
+
+    with pytest.raises(TypeError) as expected:
+        define(override)
+    with pytest.raises(TypeError) as error:
+        validate_class(define(mark))
+    assert str(error.value) == str(expected.value)
+
+    class Missing(SuperClass):
+        @mark
+        def missing(self) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="Missing.missing: No super class method found"):
+        validate_class(Missing)
+
+
+def test_deferred_overrides_are_checked_and_others_skipped():
+    class SubClass(SuperClass):
+        @override(defer_check=True)
+        def method(self, x: str) -> int:
+            return 0
+
+        @override(check_signature=False)
+        def other(self) -> str:
+            return ""
+
+    method = vars(SubClass)["method"]
+    assert method in _pending_claims
+    with pytest.raises(TypeError):
+        validate_class(SubClass)
+    _pending_claims.pop(method)
+
+    del SubClass.method
+    validate_class(SubClass)
+
+
+def test_marked_methods_at_mark_level():
+    set_check_level(CheckLevel.MARK)
+
+    @check_class
+    class SubClass(SuperClass):
+        @override
+        def method(self, x: str) -> int:
+            return 0
+
+    set_check_level(CheckLevel.FULL)
+    with pytest.raises(TypeError):
+        validate_class(SubClass)
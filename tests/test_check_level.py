@@ -0,0 +1,156 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from overrides import (
+    CheckLevel,
+    EnforceOverrides,
+    final,
+    get_check_level,
+    override,
+    set_check_level,
+)
+from overrides import config
+
+
+class SuperClass:
+    def method(self, x: int) -> int:
+        return x
+
+    @final
+    def finalized(self):
+        pass
+
+
+class EnforcingSuperClass(EnforceOverrides):
+    def method(self, x: int) -> int:
+        return x
+
+
+def test_full_by_default():
+    assert get_check_level() is CheckLevel.FULL
+
+
+def test_off_returns_function_untouched():
+    set_check_level("off")
+
+    class Sub(SuperClass):
+        @override
+        def missing(self):
+            pass
+
+    assert not hasattr(Sub.missing, "__override__")
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11), reason="typing.final is used from Python 3.11"
+)
+def test_off_does_not_mark_final():
+    set_check_level("off")
+
+    class Sub(SuperClass):
+        @final
+        def method(self, y: str) -> str:
+            return y
+
+    assert not hasattr(Sub.method, "__final__")
+
+
+def test_mark_only_sets_attributes():
+    set_check_level(CheckLevel.MARK)
+
+    class Sub(SuperClass):
+        @override
+        def missing(self):
+            pass
+
+    class EnforcedSub(EnforcingSuperClass):
+        def method(self, y: str) -> str:
+            return y
+
+    assert Sub.missing.__override__
+    assert Sub.missing.__doc__ is None
+
+
+def test_structural_ignores_type_hints():
+    set_check_level("structural")
+
+    class Sub(SuperClass):
+        @override
+        def method(self, x: str) -> str:
+            return x
+
+    with pytest.raises(TypeError):
+
+        class WrongName(SuperClass):
+            @override
+            def method(self, y: int) -> int:
+                return y
+
+    with pytest.raises(TypeError):
+
+        class OverridesFinal(SuperClass):
+            @override
+            def finalized(self):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class EnforcedSub(EnforcingSuperClass):
+            def method(self, x: int) -> int:
+                return x
+
+
+def test_full_checks_type_hints():
+    with pytest.raises(TypeError):
+
+        class Sub(SuperClass):
+            @override
+            def method(self, x: str) -> str:
+                return x
+
+
+def test_unknown_level():
+    with pytest.raises(ValueError):
+        set_check_level("some")
+
+
+def test_level_from_environment(monkeypatch):
+    monkeypatch.setenv(config.ENVIRONMENT_VARIABLE, "Structural")
+    set_check_level(None)
+    assert get_check_level() is CheckLevel.STRUCTURAL
+
+
+@pytest.mark.skipif(config.tomllib is None, reason="requires tomllib or tomli")
+def test_level_from_pyproject(monkeypatch, tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[tool.overrides]\ncheck_level = "mark"\n')
+    package = tmp_path / "src" / "package"
+    package.mkdir(parents=True)
+    monkeypatch.delenv(config.ENVIRONMENT_VARIABLE, raising=False)
+    monkeypatch.chdir(package)
+    set_check_level(None)
+    assert get_check_level() is CheckLevel.MARK
+
+
+def test_mark_only_with_optimize(tmp_path):
+    level = subprocess.check_output(
+        [
+            sys.executable,
+            "-O",
+            "-c",
+            "import overrides; print(overrides.get_check_level().name)",
+        ],
+        cwd=tmp_path,
+        env={
+            **{
+                name: value
+                for name, value in os.environ.items()
+                if name != config.ENVIRONMENT_VARIABLE
+            },
+            "PYTHONPATH": os.path.dirname(os.path.dirname(config.__file__)),
+        },
+        text=True,
+    )
+    assert level.strip() == "MARK"
@@ -0,0 +1,237 @@
+from typing import Dict, List, Literal, NewType, Optional, Tuple, Type, Union
+
+import pytest
+
+from overrides import (
+    CheckLevel,
+    Sampling,
+    frameless_override,
+    override,
+    reset_stats,
+    set_check_level,
+    stats,
+)
+from overrides import validators
+from overrides.validators import compile_check
+
+UserId = NewType("UserId", int)
+
+
+class Base:
+    def method(self, x: int, names: Optional[List[str]] = None) -> int:
+        return 0
+
+    def variadic(self, *args: int, **kwargs: str) -> None:
+        pass
+
+    def mode(self, value: Literal["r", "w"]) -> str:
+        return value
+
+    def total(self, value: float) -> float:
+        return value
+
+
+class Parent:
+    @staticmethod
+    def create(x: int) -> int:
+        return x
+
+    @classmethod
+    def named(cls, name: str) -> str:
+        return name
+
+
+def test_valid_values():
+    class Sub(Base):
+        @override(check_values=True)
+        def method(self, x: int, names: Optional[List[str]] = None) -> int:
+            return x + len(names or [])
+
+        @override(check_values=True)
+        def total(self, value: float) -> float:
+            return value
+
+    assert Sub().method(1) == 1
+    assert Sub().method(1, ["a", "b"]) == 3
+    assert Sub().method(x=2, names=None) == 2
+    assert Sub().total(3) == 3
+
+
+def test_invalid_arguments():
+    class Sub(Base):
+        @override(check_values=True)
+        def method(self, x: int, names: Optional[List[str]] = None) -> int:
+            return x
+
+        @override(check_values=True)
+        def variadic(self, *args: int, **kwargs: str) -> None:
+            pass
+
+        @override(check_values=True)
+        def mode(self, value: Literal["r", "w"]) -> str:
+            return value
+
+    with pytest.raises(TypeError, match="`x` of type `str` is not a `int`"):
+        Sub().method("1")
+    with pytest.raises(TypeError, match="`names`"):
+        Sub().method(1, ["a", 2])
+    with pytest.raises(TypeError, match="`args`"):
+        Sub().variadic(1, 2.5)
+    with pytest.raises(TypeError, match="`kwargs`"):
+        Sub().variadic(a=1)
+    with pytest.raises(TypeError, match="`value`"):
+        Sub().mode("x")
+    Sub().variadic(1, 2, a="b")
+    assert Sub().mode("w") == "w"
+
+
+class Helpers:
+    def f(self, x: int, _missing: int = 0, _value: int = 0, _v_check_0: int = 0):
+        pass
+
+
+def test_parameters_named_like_generated_helpers():
+    class Sub(Helpers):
+        @override(check_values=True)
+        def f(self, x: int, _missing: int = 0, _value: int = 0, _v_check_0: int = 0):
+            pass
+
+    Sub().f(1, _missing=2, _value=3, _v_check_0=4)
+    with pytest.raises(TypeError, match="`_missing`"):
+        Sub().f(1, _missing="notint")
+    with pytest.raises(TypeError, match="`x`"):
+        Sub().f("1", _value=2)
+    with pytest.raises(TypeError, match="`_v_check_0`"):
+        Sub().f(1, _v_check_0="notint")
+
+
+def test_returned_value_is_checked_against_overridden_method():
+    class Sub(Base):
+        @override(check_values=True)
+        def method(self, x: int, names: Optional[List[str]] = None) -> int:
+            return str(x)  # type: ignore
+
+    with pytest.raises(TypeError, match="returned value of type `str` is not a `int`"):
+        Sub().method(1)
+
+
+def test_static_and_class_methods():
+    class Child(Parent):
+        @staticmethod
+        @override(check_values=True)
+        def create(x: int) -> int:
+            return x
+
+        @classmethod
+        @override(check_values=True)
+        def named(cls, name: str) -> str:
+            return name
+
+    assert Child.create(1) == 1
+    assert Child.named("a") == "a"
+    with pytest.raises(TypeError):
+        Child.create("1")
+    with pytest.raises(TypeError):
+        Child().named(1)
+
+
+def test_not_checked_below_full_level():
+    set_check_level(CheckLevel.STRUCTURAL)
+
+    class Sub(Base):
+        @override(check_values=True)
+        def method(self, x: int, names: Optional[List[str]] = None) -> int:
+            return 0
+
+    assert Sub().method("1") == 0
+
+
+def test_frameless_override():
+    class Sub(Base):
+        @frameless_override(check_at_runtime=True, check_values=True)
+        def method(self, x: int, names: Optional[List[str]] = None) -> int:
+            return x
+
+    assert Sub().method(1) == 1
+    with pytest.raises(TypeError, match="`x`"):
+        Sub().method("1")
+
+
+def test_calls_are_counted():
+    class Sub(Base):
+        @override(check_values=True)
+        def total(self, value: float) -> float:
+            return value
+
+    reset_stats()
+    Sub().total(1.0)
+    Sub().total(2.0)
+    assert stats()["value_check_calls"] == 2
+
+
+def test_fixed_rate_sampling():
+    class Sub(Base):
+        @override(check_values=Sampling(every=3))
+        def total(self, value: float) -> float:
+            return value
+
+    reset_stats()
+    with pytest.raises(TypeError):
+        Sub().total("1")  # The first call is checked.
+    assert Sub().total("2") == "2"
+    assert Sub().total("3") == "3"
+    with pytest.raises(TypeError):
+        Sub().total("4")
+    assert stats()["value_check_calls"] == 2
+
+
+def test_budget_sampling(monkeypatch):
+    now = [0]
+
+    def clock():
+        now[0] += 1_000_000  # Every reading of the clock takes 1 ms.
+        return now[0]
+
+    monkeypatch.setattr(validators, "clock", clock)
+
+    class Sub(Base):
+        @override(check_values=Sampling(budget=0.005, window=1.0))
+        def total(self, value: float) -> float:
+            return value
+
+    reset_stats()
+    for _ in range(5):
+        Sub().total(1.0)
+    # Each check of the arguments and of the returned value takes 1 ms.
+    assert stats()["value_check_calls"] == 3
+    now[0] += 1_000_000_000
+    with pytest.raises(TypeError):
+        Sub().total("1")
+
+
+def test_invalid_sampling():
+    with pytest.raises(ValueError):
+        Sampling(every=0)
+    with pytest.raises(ValueError):
+        Sampling(budget=0)
+    with pytest.raises(ValueError):
+        Sampling(window=-1)
+
+
+@pytest.mark.parametrize(
+    "hint, valid, invalid",
+    [
+        (UserId, 1, "1"),
+        (Union[int, str, None], None, 1.5),
+        (Tuple[int, str], (1, "a"), (1, 2)),
+        (Tuple[int, ...], (1, 2, 3), (1, "a")),
+        (Dict[str, int], {"a": 1}, {"a": "b"}),
+        (Type[Base], Base, int),
+        (Literal[1, True], 1, 1.0),
+        (complex, 1.5, "1"),
+    ],
+)
+def test_compile_check(hint, valid, invalid):
+    check = compile_check(hint)
+    assert check(valid)
+    assert not check(invalid)
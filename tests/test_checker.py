@@ -0,0 +1,149 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from overrides import checker
+
+MODULES = {
+    "pkg/__init__.py": "",
+    "pkg/base.py": """
+        from overrides import EnforceOverrides, final
+
+
+        class Base(EnforceOverrides):
+            def method(self, x: int) -> int:
+                return x
+
+            @final
+            def finalized(self) -> None:
+                pass
+    """,
+    "pkg/good.py": """
+        from overrides import override
+
+        from pkg.base import Base
+
+
+        class Good(Base):
+            @override
+            def method(self, x: int) -> "DefinedLater":
+                return DefinedLater()
+
+
+        class DefinedLater(int):
+            pass
+    """,
+    "pkg/sub/__init__.py": "",
+    "pkg/sub/bad.py": """
+        from overrides import override
+
+        from pkg.base import Base
+
+
+        class Bad(Base):
+            @override
+            def method(self, x: str) -> int:
+                return 0
+
+            def finalized(self) -> None:
+                pass
+
+            @override
+            def missing(self) -> None:
+                pass
+    """,
+    "pkg/broken.py": """
+        raise RuntimeError("boom")
+    """,
+}
+
+
+@pytest.fixture
+def package_directory(tmp_path):
+    for name, source in MODULES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source).lstrip())
+    return tmp_path
+
+
+def run_checker(directory, *args):
+    return subprocess.run(
+        [sys.executable, "-m", "overrides", "check", "pkg", "--jobs", "2", *args],
+        cwd=directory,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                [os.path.dirname(os.path.dirname(checker.__file__)), str(directory)]
+            ),
+        },
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_find_modules_does_not_import_them(package_directory, monkeypatch):
+    monkeypatch.syspath_prepend(str(package_directory))
+    assert sorted(checker.find_modules("pkg")) == [
+        "pkg",
+        "pkg.base",
+        "pkg.broken",
+        "pkg.good",
+        "pkg.sub",
+        "pkg.sub.bad",
+    ]
+    assert "pkg.broken" not in sys.modules
+
+
+def test_all_violations_are_reported_as_json(package_directory):
+    result = run_checker(package_directory, "--format", "json")
+    assert result.returncode == 1, result.stderr
+    violations = json.loads(result.stdout)
+    assert [(v["module"], v["name"], v["line"]) for v in violations] == [
+        ("pkg.broken", "pkg.broken", None),
+        ("pkg.sub.bad", "Bad.method", 7),
+        ("pkg.sub.bad", "Bad.finalized", 11),
+        ("pkg.sub.bad", "Bad.missing", 14),
+    ]
+    assert "RuntimeError: boom" in violations[0]["message"]
+
+
+def test_modules_creating_instances_at_import(package_directory):
+    (package_directory / "pkg" / "instance.py").write_text(textwrap.dedent("""
+            from overrides import EnforceOverrides, override
+
+
+            class Base(EnforceOverrides):
+                def __init__(self, value: int):
+                    self.value = value
+
+                def method(self, x: int) -> int:
+                    return x
+
+
+            class Sub(Base):
+                @override
+                def method(self, x: str) -> int:
+                    return 0
+
+
+            INSTANCE = Sub(1)
+            """).lstrip())
+    result = run_checker(package_directory, "--format", "json")
+    violations = [v for v in json.loads(result.stdout) if v["module"] == "pkg.instance"]
+    assert [(v["name"], v["line"]) for v in violations] == [("Sub.method", 13)]
+
+
+def test_text_output_and_success(package_directory):
+    result = run_checker(package_directory)
+    assert "bad.py:11: Bad.finalized: Method finalized is finalized" in result.stdout
+
+    (package_directory / "pkg" / "broken.py").unlink()
+    (package_directory / "pkg" / "sub" / "bad.py").unlink()
+    result = run_checker(package_directory)
+    assert result.returncode == 0, result.stdout
+    assert "Checked 4 modules, found 0 errors." in result.stderr
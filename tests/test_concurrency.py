@@ -0,0 +1,214 @@
+import importlib
+import sys
+import threading
+import uuid
+import weakref
+from typing import Dict, List, Optional
+
+import pytest
+
+from overrides import reset_stats, stats
+from overrides.concurrency import StripedCache, snapshot
+
+THREADS = 32
+MODULES = 48
+CLASSES = 4
+
+BASE_SOURCE = """
+from typing import Dict, List, Optional, Protocol
+
+from overrides import EnforceOverrides, final
+
+
+class SupportsHandle(Protocol):
+    def handle(self, request: int, tags: List[str]) -> Optional[int]: ...
+
+
+class Base(EnforceOverrides):
+    def handle(self, request: int, tags: List[str]) -> Optional[int]:
+        return None
+
+    def describe(self, verbose: bool = False) -> str:
+        return ""
+
+    @classmethod
+    def create(cls, options: Dict[str, int]) -> "Base":
+        return cls()
+
+    @staticmethod
+    def version() -> int:
+        return 0
+
+    @final
+    def identity(self) -> int:
+        return id(self)
+"""
+
+MODULE_SOURCE = """
+from typing import Any, Dict, List, Optional, Sequence
+
+from overrides import frameless_override, implements, override
+
+from {package}.base import Base, SupportsHandle
+"""
+
+CLASS_SOURCE = """
+
+@implements(SupportsHandle)
+class Handler{index}(Base):
+    @override(check_values=True)
+    def handle(self, request: int, tags: Sequence[str]) -> Optional[int]:
+        return request + len(tags)
+
+    @frameless_override
+    def describe(self, verbose: bool = False, *args: Any) -> str:
+        return "handler {index}"
+
+    @classmethod
+    @override
+    def create(cls, options: Dict[str, int]) -> "Handler{index}":
+        return cls()
+
+    @staticmethod
+    @override
+    def version() -> int:
+        return {index}
+"""
+
+# Decorations per class: `override` on `handle`, `create` and `version`, and
+# `frameless_override` on `describe`.
+DECORATIONS = 4
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """A package of `MODULES` modules, each defining `CLASSES` subclasses of the
+    same `EnforceOverrides` class.
+    """
+    name = f"synthetic_{uuid.uuid4().hex}"
+    root = tmp_path / name
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "base.py").write_text(BASE_SOURCE)
+    for module in range(MODULES):
+        source = MODULE_SOURCE.format(package=name) + "".join(
+            CLASS_SOURCE.format(index=index) for index in range(CLASSES)
+        )
+        (root / f"module_{module}.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Switch threads as often as possible, so that they interleave even with
+    # the GIL.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield name
+    sys.setswitchinterval(interval)
+    for module in list(sys.modules):
+        if module == name or module.startswith(name + "."):
+            del sys.modules[module]
+
+
+def run_in_threads(target) -> List[BaseException]:
+    barrier = threading.Barrier(THREADS)
+    errors: List[BaseException] = []
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_importing_a_package_from_many_threads(package):
+    names = [f"{package}.module_{module}" for module in range(MODULES)]
+    modules: Dict[str, object] = {}
+
+    def import_all(index):
+        # Every thread imports all modules, starting at a different one.
+        for name in names[index:] + names[:index]:
+            modules[name] = importlib.import_module(name)
+        for name in names:
+            handler = getattr(modules[name], "Handler0")()
+            assert handler.handle(1, ["a"]) == 2
+            with pytest.raises(TypeError):
+                handler.handle("1", ["a"])
+
+    reset_stats()
+    errors = run_in_threads(import_all)
+
+    assert errors == []
+    assert set(modules) == set(names)
+    counts = stats()
+    classes = MODULES * CLASSES
+    assert counts["decorations"] == classes * DECORATIONS
+    assert counts["enforce_class_creations"] == classes + 1
+    assert counts["value_check_calls"] == THREADS * MODULES * 2
+
+
+def test_counters_of_ended_threads_are_kept():
+    def count(index):
+        from overrides.stats import _count
+
+        for _ in range(100):
+            _count("decorations")
+
+    reset_stats()
+    assert run_in_threads(count) == []
+    assert stats()["decorations"] == THREADS * 100
+
+
+def test_striped_cache_from_many_threads():
+    cache = StripedCache(maxsize=64, stripes=4)
+
+    def fill(index):
+        for key in range(1000):
+            value: Optional[int] = cache.get(key)
+            if value is None:
+                cache.set(key, key * 2)
+            else:
+                assert value == key * 2
+
+    assert run_in_threads(fill) == []
+    info = cache.cache_info()
+    assert info.currsize <= info.maxsize
+    assert all(cache.get(key) in (None, key * 2) for key in range(1000))
+
+
+def test_striped_cache_evicts_least_recently_used_entries():
+    cache = StripedCache(maxsize=2, stripes=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.cache_info() == (3, 1, 2, 2)
+
+
+def test_snapshot_of_a_changing_weak_set():
+    class Item:
+        pass
+
+    kept = [Item() for _ in range(100)]
+    items = weakref.WeakSet(kept)
+    stop = threading.Event()
+
+    def change():
+        while not stop.is_set():
+            items.add(Item())  # Collected right away.
+
+    thread = threading.Thread(target=change)
+    thread.start()
+    try:
+        for _ in range(100):
+            assert set(kept) <= set(snapshot(items))
+    finally:
+        stop.set()
+        thread.join()
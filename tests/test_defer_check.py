@@ -0,0 +1,168 @@
+import unittest
+
+from overrides import EnforceOverrides, final, override, verify_all
+from overrides.overrides import _pending_claims
+
+
+class SuperClass(EnforceOverrides):
+    def method(self, x: int) -> int:
+        """Super Class Docs"""
+        return x
+
+
+class PlainSuperClass:
+    def method(self, x: int) -> int:
+        return x
+
+    @final
+    def finalized(self):
+        pass
+
+
+class Deferred(SuperClass):
+    @override(defer_check=True)
+    def method(self, x: int) -> "DefinedLater":
+        return x
+
+
+class DefinedLater(int):
+    pass
+
+
+class WithNew(SuperClass):
+    def __new__(cls, value):
+        instance = super().__new__(cls)
+        instance.value = value
+        return instance
+
+    @override(defer_check=True)
+    def method(self, x: int) -> int:
+        return x
+
+
+class DeferCheckTests(unittest.TestCase):
+    def test_check_is_deferred_to_first_instantiation(self):
+        self.assertIsNone(vars(Deferred)["method"].__doc__)
+        self.assertIn("__init__", vars(Deferred))
+        self.assertEqual(Deferred().method(1), 1)
+        self.assertEqual(Deferred.method.__doc__, "Super Class Docs")
+        self.assertNotIn("__init__", vars(Deferred))
+        with self.assertRaises(TypeError):
+            Deferred(1)
+
+    def test_classes_without_deferred_checks_are_not_patched(self):
+        class Plain(SuperClass):
+            @override
+            def method(self, x: int) -> int:
+                return x
+
+        self.assertNotIn("__init__", vars(Plain))
+        self.assertNotIn("__call__", vars(type(Plain)))
+
+    def test_own_new_is_kept(self):
+        self.assertEqual(WithNew(3).value, 3)
+        self.assertEqual(WithNew(4).value, 4)
+        self.assertIsInstance(vars(WithNew)["__new__"], staticmethod)
+        self.assertEqual(
+            vars(WithNew)["__new__"].__func__.__qualname__, "WithNew.__new__"
+        )
+
+    def test_init_with_arguments(self):
+        class WithInit(SuperClass):
+            def __init__(self, value):
+                self.value = value
+
+            @override(defer_check=True)
+            def method(self, x: int) -> int:
+                return x
+
+        class Child(WithInit):
+            pass
+
+        self.assertEqual(Child(4).value, 4)
+        self.assertNotIn(WithInit.method, _pending_claims)
+        self.assertEqual(WithInit(5).value, 5)
+
+    def test_own_init_is_restored(self):
+        class WithOwnInit(SuperClass):
+            def __init__(self, value):
+                self.value = value
+
+            @override(defer_check=True)
+            def method(self, x: int) -> int:
+                return x
+
+        init = vars(WithOwnInit)["__init__"].__wrapped__
+        self.assertEqual(WithOwnInit(value=1).value, 1)
+        self.assertIs(vars(WithOwnInit)["__init__"], init)
+
+    def test_subclass_init_not_calling_base_init(self):
+        class Invalid(SuperClass):
+            @override(defer_check=True)
+            def method(self, x: str) -> int:
+                return 0
+
+        class Child(Invalid):
+            def __init__(self, value):
+                self.value = value
+
+        self.addCleanup(_pending_claims.pop, Invalid.method, None)
+        with self.assertRaises(TypeError):
+            Child(1)
+
+    def test_subclass_instantiation_checks_deferred_base(self):
+        class Invalid(SuperClass):
+            def __init__(self, value):
+                self.value = value
+
+            @override(defer_check=True)
+            def method(self, x: str) -> int:
+                return 0
+
+        class Child(Invalid):
+            pass
+
+        self.addCleanup(_pending_claims.pop, Invalid.method, None)
+        with self.assertRaises(TypeError):
+            Child(1)
+        with self.assertRaises(TypeError):
+            Invalid(1)
+
+    def test_invalid_override_fails_on_every_instantiation(self):
+        class Invalid(SuperClass):
+            @override(defer_check=True)
+            def method(self, x: str) -> int:
+                return 0
+
+        self.addCleanup(_pending_claims.pop, Invalid.method, None)
+        with self.assertRaises(TypeError):
+            Invalid()
+        with self.assertRaises(TypeError):
+            Invalid()
+
+    def test_verify_all(self):
+        class Valid(PlainSuperClass):
+            @override(defer_check=True)
+            def method(self, x: int) -> int:
+                return x
+
+        self.assertIn(Valid.method, _pending_claims)
+        verify_all()
+        self.assertNotIn(Valid.method, _pending_claims)
+
+    def test_verify_all_fails_until_fixed(self):
+        class Invalid(PlainSuperClass):
+            @override(defer_check=True)
+            def method(self, x: int, y: int) -> int:
+                return x
+
+            @override(defer_check=True)
+            def finalized(self):
+                pass
+
+        self.addCleanup(_pending_claims.pop, Invalid.method, None)
+        self.addCleanup(_pending_claims.pop, Invalid.finalized, None)
+        with self.assertRaises(TypeError):
+            verify_all()
+        with self.assertRaises(TypeError):
+            verify_all()
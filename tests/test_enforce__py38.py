@@ -2,6 +2,8 @@ import unittest
 from typing import Optional, TypeVar, Union
 
 from overrides import EnforceOverrides, final, override
+from overrides import enforce
+from overrides.enforce import get_override_index
 from overrides.signature import ensure_signature_is_compatible
 
 
@@ -382,6 +384,126 @@ class EnforceTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             ensure_signature_is_compatible(A().foo, C.zoo, True)
 
+    def test_override_index(self):
+        index = get_override_index(Enforcing)
+        self.assertLessEqual(
+            {"finality", "nonfinal1", "nonfinal2", "nonfinal_classmethod"},
+            index.callables,
+        )
+        self.assertNotIn("nonfinal_property", index.callables)
+        self.assertNotIn("classVariableIsOk", index.callables)
+        self.assertEqual(index.finals, {"finality", "__and__"})
+        self.assertIn("register", index.ignored)
+
+    def test_override_index_follows_mro(self):
+        class Left(Enforcing):
+            pass
+
+        class Right(Enforcing):
+            @override
+            def nonfinal2(self):
+                return "right"
+
+        Right.nonfinal1 = "not callable"
+
+        class Diamond(Left, Right):
+            pass
+
+        index = get_override_index(Diamond)
+        self.assertNotIn("nonfinal1", index.callables)
+        self.assertIn("nonfinal2", index.callables)
+
+    def test_override_index_picks_up_new_members(self):
+        class Base(EnforceOverrides):
+            pass
+
+        class Sub(Base):
+            def later(self):
+                pass
+
+        self.assertNotIn("later", get_override_index(Base).callables)
+        Base.later = final(lambda self: None)
+        self.assertIn("later", get_override_index(Base).finals)
+        with self.assertRaises(TypeError):
+
+            class SubAfterwards(Base):
+                def later(self):
+                    pass
+
+    def test_override_index_picks_up_replaced_members(self):
+        class Base(EnforceOverrides):
+            handler = None
+
+        class Sub(Base):
+            handler = None
+
+        self.assertNotIn("handler", get_override_index(Base).callables)
+        Base.handler = lambda self: None
+        with self.assertRaises(TypeError):
+
+            class SubAfterwards(Base):
+                def handler(self):
+                    pass
+
+    def test_override_index_picks_up_deleted_members(self):
+        class Base(EnforceOverrides):
+            @final
+            def later(self):
+                pass
+
+        class Sub(Base):
+            pass
+
+        del Base.later
+        self.assertNotIn("later", get_override_index(Sub).finals)
+
+        class SubAfterwards(Sub):
+            def later(self):
+                pass
+
+    def test_override_index_picks_up_changed_mixins(self):
+        class Mixin:
+            handler = None
+
+        class Base(Mixin, EnforceOverrides):
+            pass
+
+        Mixin.handler = lambda self: None
+        with self.assertRaises(TypeError):
+
+            class Sub(Base):
+                def handler(self):
+                    pass
+
+    def test_classes_with_mixins_are_not_indexed(self):
+        class Mixin:
+            pass
+
+        class Base(Mixin, EnforceOverrides):
+            pass
+
+        class Sub(Base):
+            pass
+
+        self.assertNotIn(Base, enforce._member_flags)
+        self.assertNotIn(Sub, enforce._member_flags)
+        Mixin.handler = final(lambda self: None)
+        self.assertIn("handler", get_override_index(Sub).finals)
+
+    def test_override_index_is_kept_when_flags_do_not_change(self):
+        class Base(EnforceOverrides):
+            counter = 0
+
+        class Sub(Base):
+            pass
+
+        members = enforce._member_flags[Sub]
+        Base.counter += 1
+        self.assertIs(enforce._member_flags[Sub], members)
+        Base.counter = lambda self: None
+        self.assertNotIn(Sub, enforce._member_flags)
+        self.assertIn("counter", get_override_index(Sub).callables)
+
     def test_typevar_in_signature(self):
         T = TypeVar("T")
         K = TypeVar("K")
@@ -0,0 +1,76 @@
+import sys
+import types
+import typing
+
+import pytest
+
+from overrides import typing_utils
+from overrides.typing_utils import bind_forward_refs, issubtype
+
+MODULE_SOURCE = """
+from typing import List, Union
+from overrides import override
+
+class Node:
+    pass
+
+class Leaf(Node):
+    pass
+
+Tree = Union[Leaf, List["Tree"]]
+
+class Base:
+    def children(self) -> Tree:
+        return []
+"""
+
+
+@pytest.fixture
+def module():
+    module = types.ModuleType("forward_refs_example")
+    sys.modules[module.__name__] = module
+    exec(MODULE_SOURCE, vars(module))
+    yield module
+    del sys.modules[module.__name__]
+    typing_utils.cache_clear()
+
+
+def define_override(module, return_type: str):
+    source = f"""
+class Sub(Base):
+    @override
+    def children(self) -> {return_type}:
+        return []
+"""
+    exec(source, vars(module))
+
+
+def test_recursive_aliases_resolve_in_the_defining_module(module):
+    define_override(module, "List[List[Leaf]]")
+    with pytest.raises(TypeError, match="return type"):
+        define_override(module, "List[List[Node]]")
+
+
+def test_forward_ref_values_are_cached_per_module_and_string(module):
+    ref = bind_forward_refs(typing.ForwardRef("Tree"), module.__name__)
+    value = typing_utils.eval_forward_ref(ref)
+    assert typing_utils.eval_forward_ref(ref) is value
+    assert (module.__name__, "Tree") in typing_utils._forward_ref_values
+
+
+def test_reloading_the_module_invalidates_forward_refs(module):
+    ref = bind_forward_refs(typing.List[typing.ForwardRef("Leaf")], module.__name__)
+    assert issubtype(typing.List[module.Leaf], ref)
+    old_leaf = module.Leaf
+    exec(MODULE_SOURCE, vars(module))  # As `importlib.reload` does.
+    assert module.Leaf is not old_leaf
+    value = typing_utils.eval_forward_ref(typing.get_args(ref)[0])
+    assert value is module.Leaf
+
+
+def test_unbound_forward_refs_are_left_alone():
+    ref = typing.ForwardRef("Tree")
+    assert bind_forward_refs(int, "anything") is int
+    assert bind_forward_refs(typing.List[ref], None) == typing.List[ref]
+    bound = bind_forward_refs(typing.Dict[str, ref], "some.module")
+    assert typing.get_args(bound)[1].__forward_module__ == "some.module"
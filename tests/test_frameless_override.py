@@ -0,0 +1,152 @@
+import sys
+import unittest
+
+from overrides import (
+    CheckLevel,
+    EnforceOverrides,
+    final,
+    frameless_override,
+    set_check_level,
+    verify_all,
+)
+from overrides.overrides import _pending_claims
+
+
+class SuperClass:
+    def method(self, x: int) -> int:
+        """Super Class Docs"""
+        return x
+
+    @staticmethod
+    def static_method(x: int) -> int:
+        return x
+
+    @classmethod
+    def class_method(cls) -> str:
+        return "super"
+
+    @property
+    def value(self) -> int:
+        return 1
+
+    @final
+    def finalized(self) -> None:
+        pass
+
+
+class EnforcingSuperClass(EnforceOverrides):
+    def method(self, x: int) -> int:
+        return x
+
+
+def custom_override(method):
+    # Calling the decorator through another function needs no frame inspection.
+    return frameless_override(check_signature=True)(method)
+
+
+class FramelessOverrideTests(unittest.TestCase):
+    def assertRaisesOverrideError(self):
+        # Python 3.10 and 3.11 wrap errors raised from __set_name__.
+        if sys.version_info < (3, 12):
+            return self.assertRaises((TypeError, RuntimeError))
+        return self.assertRaises(TypeError)
+
+    def test_valid_override_is_replaced_with_the_method(self):
+        class Local(SuperClass):
+            pass
+
+        # Local base classes are found as well.
+        class SubClass(Local):
+            @frameless_override
+            def method(self, x: int) -> int:
+                return x + 1
+
+        self.assertIs(type(vars(SubClass)["method"]), type(lambda: None))
+        self.assertEqual(SubClass().method(1), 2)
+        self.assertEqual(SubClass.method.__doc__, "Super Class Docs")
+        self.assertTrue(SubClass.method.__override__)
+
+    def test_static_and_class_methods_under_the_decorator(self):
+        class SubClass(SuperClass):
+            @frameless_override
+            @staticmethod
+            def static_method(x: int) -> int:
+                return x + 1
+
+            @frameless_override
+            @classmethod
+            def class_method(cls) -> str:
+                return "sub"
+
+        self.assertIsInstance(vars(SubClass)["static_method"], staticmethod)
+        self.assertEqual(SubClass.static_method(1), 2)
+        self.assertEqual(SubClass.class_method(), "sub")
+
+    def test_decorators_on_top_check_on_first_call(self):
+        class SubClass(SuperClass):
+            @classmethod
+            @frameless_override
+            def class_method(cls) -> str:
+                return "sub"
+
+            @property
+            @frameless_override
+            def value(self) -> int:
+                return 2
+
+        self.assertEqual(SubClass().value, 2)
+        self.assertIs(vars(SubClass)["value"].fget.__override__, True)
+        self.assertEqual(SubClass.class_method(), "sub")
+
+        class Invalid(SuperClass):
+            @classmethod
+            @frameless_override
+            def class_method(cls) -> int:
+                return 0
+
+        with self.assertRaises(TypeError):
+            Invalid.class_method()
+
+    def test_errors(self):
+        with self.assertRaisesOverrideError():
+
+            class WrongSignature(SuperClass):
+                @frameless_override
+                def method(self, x: str) -> int:
+                    return 0
+
+        with self.assertRaisesOverrideError():
+
+            class NoSuperMethod(SuperClass):
+                @frameless_override
+                def missing(self) -> None:
+                    pass
+
+        with self.assertRaisesOverrideError():
+
+            class Finalized(SuperClass):
+                @custom_override
+                def finalized(self) -> None:
+                    pass
+
+    def test_enforce_overrides_and_deferred_checks(self):
+        class SubClass(EnforcingSuperClass):
+            @frameless_override(defer_check=True)
+            def method(self, x: str) -> int:
+                return 0
+
+        self.addCleanup(_pending_claims.pop, vars(SubClass)["method"], None)
+        with self.assertRaises(TypeError):
+            SubClass()
+        with self.assertRaises(TypeError):
+            verify_all()
+
+    def test_mark_level_returns_the_method(self):
+        set_check_level(CheckLevel.MARK)
+        self.addCleanup(set_check_level, None)
+
+        def method(self, x: str) -> int:
+            return 0
+
+        self.assertIs(frameless_override(method), method)
+        self.assertTrue(method.__override__)
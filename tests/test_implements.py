@@ -0,0 +1,121 @@
+from typing import Iterator, List, Protocol, TypeVar
+
+import pytest
+
+from overrides import CheckLevel, implements, reset_stats, set_check_level, stats
+from overrides.protocols import _members
+
+T = TypeVar("T")
+
+
+class SupportsRead(Protocol):
+    name: str  # Not checked.
+
+    def read(self, size: int) -> bytes: ...
+
+    @classmethod
+    def open(cls, path: str) -> "SupportsRead": ...
+
+    @staticmethod
+    def formats() -> List[str]: ...
+
+
+class SupportsIteration(Protocol[T]):
+    def items(self) -> Iterator[T]: ...
+
+
+def test_valid_implementation():
+    @implements(SupportsRead, SupportsIteration)
+    class File:
+        def __init__(self, name: str):
+            self.name: str = name
+
+        def read(self, size: int, offset: int = 0) -> bytes:
+            return b""
+
+        @classmethod
+        def open(cls, path: str) -> "File":
+            return cls(path)
+
+        @staticmethod
+        def formats() -> List[str]:
+            return []
+
+        def items(self) -> Iterator[int]:
+            return iter([])
+
+    assert File.open("x").read(1) == b""
+
+
+def test_missing_member():
+    with pytest.raises(TypeError, match="`read` of protocol `SupportsRead`"):
+
+        @implements(SupportsRead)
+        class NoRead:
+            name = "no read"
+
+            @classmethod
+            def open(cls, path: str) -> "NoRead":
+                return cls()
+
+            @staticmethod
+            def formats() -> List[str]:
+                return []
+
+
+def test_incompatible_signature():
+    with pytest.raises(TypeError, match="Wrong.read"):
+
+        @implements(SupportsRead)
+        class Wrong:
+            name = "wrong"
+
+            def read(self, size: str) -> bytes:
+                return b""
+
+            @classmethod
+            def open(cls, path: str) -> "Wrong":
+                return cls()
+
+            @staticmethod
+            def formats() -> List[str]:
+                return []
+
+
+def test_types_are_not_checked_at_structural_level():
+    set_check_level(CheckLevel.STRUCTURAL)
+
+    @implements(SupportsIteration)
+    class Loose:
+        def items(self) -> int:
+            return 0
+
+    with pytest.raises(TypeError):
+
+        @implements(SupportsIteration)
+        class Broken:
+            def items(self, extra) -> int:
+                return 0
+
+
+def test_not_a_protocol():
+    with pytest.raises(TypeError, match="is not a protocol"):
+        implements(int)
+
+
+def test_protocol_members_are_resolved_once():
+    class SupportsSize(Protocol):
+        def size(self, unit: str) -> int: ...
+
+    def define():
+        @implements(SupportsSize)
+        class Sized:
+            def size(self, unit: str) -> int:
+                return 0
+
+    define()
+    members = _members[SupportsSize]
+    reset_stats()
+    define()
+    assert _members[SupportsSize] is members
+    assert stats()["signature_extractions"] == 1
@@ -1,4 +1,5 @@
 from overrides import EnforceOverrides
+from overrides import enforce
 from overrides.enforce import EnforceOverridesMeta
 import unittest
 
@@ -24,3 +25,75 @@ class InheritanceWithCustomMetaclass(unittest.TestCase):
         sc = SuperbClass()
         self.assertIsInstance(sc, SuperbClass)
         self.assertTrue(issubclass(SuperbClass, EnforceOverrides))
+
+    def test_metaclass_is_scanned_once(self):
+        state = enforce._ignored_metaclass_scans[CustomMetaClass]
+
+        class AnotherSuperbClass(SuperbClass):
+            def bar(self):
+                pass
+
+        self.assertIs(enforce._ignored_metaclass_scans[CustomMetaClass], state)
+
+    def test_metaclass_is_scanned_again_after_it_changed(self):
+        class ChangingMetaClass(EnforceOverridesMeta):
+            pass
+
+        class Base(metaclass=ChangingMetaClass):
+            pass
+
+        def baz(cls):
+            pass
+
+        ChangingMetaClass.baz = baz
+
+        class Sub(Base):
+            def baz(self):
+                pass
+
+        self.assertTrue(baz.__ignored__)
+
+    def test_metaclass_is_scanned_again_after_a_method_was_replaced(self):
+        class ReplacingMetaClass(EnforceOverridesMeta):
+            def helper(cls):
+                pass
+
+        class Base(metaclass=ReplacingMetaClass):
+            pass
+
+        def helper(cls):
+            pass
+
+        ReplacingMetaClass.helper = helper
+
+        class Sub(Base):
+            def helper(self):
+                pass
+
+        self.assertTrue(helper.__ignored__)
+
+    def test_derived_metaclasses_are_scanned_again_after_a_base_changed(self):
+        class ParentMetaClass(EnforceOverridesMeta):
+            pass
+
+        class ChildMetaClass(ParentMetaClass):
+            pass
+
+        class Base(metaclass=ChildMetaClass):
+            pass
+
+        self.assertIn(ChildMetaClass, enforce._ignored_metaclass_scans)
+
+        def helper(cls):
+            pass
+
+        ParentMetaClass.helper = helper
+        self.assertNotIn(ChildMetaClass, enforce._ignored_metaclass_scans)
+
+        class Sub(Base):
+            def helper(self):
+                pass
+
+        self.assertTrue(helper.__ignored__)
+        del ParentMetaClass.helper
+        self.assertNotIn(ChildMetaClass, enforce._ignored_metaclass_scans)
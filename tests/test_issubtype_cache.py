@@ -0,0 +1,188 @@
+import abc
+import collections.abc
+import gc
+import io
+import typing
+import weakref
+
+from overrides import override, typing_utils
+from overrides.typing_utils import issubtype
+
+
+def test_repeated_pairs_hit_the_cache():
+    typing_utils.cache_clear()
+    for _ in range(3):
+        assert issubtype(int, typing.Optional[int])
+        assert not issubtype(str, typing.Optional[int])
+    info = typing_utils.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+
+
+def test_pairs_of_user_classes_hit_the_cache():
+    class Request:
+        pass
+
+    class Response:
+        pass
+
+    typing_utils.cache_clear()
+    for _ in range(3):
+        assert issubtype(Response, Response)
+        assert not issubtype(typing.Optional[Request], Response)
+    info = typing_utils.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+
+
+def test_unknown_results_are_cached():
+    T = typing.TypeVar("T")
+    typing_utils.cache_clear()
+    assert issubtype(int, T) is None
+    assert issubtype(int, T) is None
+    assert typing_utils.cache_info().hits == 1
+
+
+def test_unhashable_types_bypass_the_cache():
+    typing_utils.cache_clear()
+    assert issubtype(typing.Annotated[int, {"unit": "s"}], typing.Any)
+    assert issubtype(typing.Annotated[int, {"unit": "s"}], typing.Any)
+    assert typing_utils.cache_info().currsize == 0
+
+
+def test_forward_refs_bypass_the_cache():
+    JSON = typing.Union[int, str, typing.Sequence["JSON"]]
+    typing_utils.cache_clear()
+    assert issubtype(typing.List[int], JSON, forward_refs={"JSON": JSON})
+    assert typing_utils.cache_info().currsize == 0
+
+
+def test_cache_clear_picks_up_registered_subclasses():
+    class Registered:
+        pass
+
+    assert not issubtype(Registered, collections.abc.Sequence)
+    collections.abc.Sequence.register(Registered)
+    typing_utils.cache_clear()
+    assert issubtype(Registered, collections.abc.Sequence)
+
+
+class Shape(abc.ABC):
+    pass
+
+
+class Square:
+    pass
+
+
+class Drawing:
+    def shape(self) -> Shape:
+        pass
+
+
+def test_subclass_relations_pick_up_registered_subclasses():
+    assert not issubtype(Square, Shape)
+    Shape.register(Square)
+    assert issubtype(Square, Shape)
+
+    class SquareDrawing(Drawing):
+        @override
+        def shape(self) -> Square:
+            pass
+
+
+def test_normalized_types_are_interned():
+    typing_utils.cache_clear()
+    nested = typing.Dict[str, typing.List[typing.Tuple[int, str]]]
+    assert typing_utils.normalize(nested) is typing_utils.normalize(nested)
+    assert typing_utils.normalize(typing.Union[int, str]) is typing_utils.normalize(
+        typing.Union[str, int]
+    )
+    inner = typing_utils.normalize(typing.List[typing.Tuple[int, str]])
+    assert typing_utils.normalize(nested).args[1] is inner
+
+
+def test_interned_types_compare_with_plain_normalized_types():
+    typing_utils.cache_clear()
+    interned = typing_utils.normalize(typing.Optional[int])
+    plain = typing_utils.NormalizedType(
+        typing.Union,
+        frozenset(
+            [typing_utils.NormalizedType(int), typing_utils.NormalizedType(None)]
+        ),
+    )
+    assert interned == plain
+    assert hash(interned) == hash(plain)
+    assert typing_utils.normalize(int) == int
+
+
+def test_large_unions_and_literals():
+    classes = [type(f"Class{i}", (), {}) for i in range(50)]
+    subclasses = [type(f"Sub{i}", (base,), {}) for i, base in enumerate(classes)]
+    bases = typing.Union[tuple(classes)]
+    assert issubtype(typing.Union[tuple(subclasses)], bases)
+    assert not issubtype(typing.Union[tuple(subclasses + [int])], bases)
+    assert issubtype(typing.Union[list, int], typing.Union[typing.Sequence, str, int])
+    assert issubtype(io.StringIO, typing.Union[int, typing.TextIO])
+    assert issubtype(typing.List[int], typing.Optional[typing.Sequence[int]])
+    assert not issubtype(None, typing.Union[int, collections.abc.Hashable])
+
+    values = [f"value{i}" for i in range(300)]
+    literal = typing.Literal[tuple(values)]
+    assert issubtype(typing.Literal["value1", "value299"], literal)
+    assert not issubtype(typing.Literal["value1", "other"], literal)
+    assert issubtype(
+        typing.Literal["value3"], typing.Union[int, typing.Literal["value3"]]
+    )
+
+
+def test_subclass_relations_do_not_keep_classes_alive():
+    class Base:
+        pass
+
+    class Derived(Base, collections.abc.Sized):
+        def __len__(self):
+            return 0
+
+    assert typing_utils._is_origin_subtype(Derived, collections.abc.Sized)
+    assert typing_utils._is_origin_subtype(Derived, Base)
+    assert any(left() is Derived for left, _ in typing_utils._origin_subtypes)
+    reference = weakref.ref(Derived)
+    del Derived
+    gc.collect()
+    assert reference() is None
+    assert typing_utils._is_origin_subtype(collections.abc.Sized, object)
+    assert all(
+        left() is not None and right() is not None
+        for left, right in typing_utils._origin_subtypes
+    )
+
+
+def test_caches_do_not_keep_classes_alive():
+    class Plugin:
+        def __len__(self):
+            return 0
+
+    typing_utils.cache_clear()
+    assert issubtype(Plugin, collections.abc.Sized)
+    # typing caches `List[Plugin]` itself, `list[Plugin]` is not cached.
+    assert issubtype(list[Plugin], typing.Sequence[collections.abc.Sized])
+    assert typing_utils.cache_info().currsize == 2
+    reference = weakref.ref(Plugin)
+    del Plugin
+    gc.collect()
+    assert reference() is None
+
+
+def test_static_types_are_remembered_without_keeping_classes_alive():
+    class Plugin:
+        pass
+
+    typing_utils.cache_clear()
+    inner = dict[str, Plugin]
+    nested = list[inner]
+    typing_utils.normalize(nested)
+    assert typing_utils._static_types[weakref.ref(inner)] is False
+    assert typing_utils._static_types[weakref.ref(str)] is True
+    reference = weakref.ref(Plugin)
+    del Plugin, inner, nested
+    gc.collect()
+    assert reference() is None
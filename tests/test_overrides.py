@@ -1,11 +1,15 @@
+import gc
 import sys
 import unittest
+import weakref
 from contextlib import contextmanager
 from typing import Generic, TypeVar
 
 import test_somepackage
 from overrides import override
 
+overrides_module = sys.modules["overrides.overrides"]
+
 TObject = TypeVar("TObject", bound="Foo")
 
 
@@ -84,6 +88,17 @@ class CheckAtRuntime(SuperClass):
         pass
 
 
+class CheckAtRuntimeOnce(SuperClass):
+    @override(check_at_runtime=True)
+    def some_method(self):
+        return "checked"
+
+    @staticmethod
+    @override(check_at_runtime=True)
+    def this_is_static(x, y, z):
+        return x + y + z
+
+
 class StaticMethodOverridePass(SuperClass):
     @staticmethod
     @override
@@ -165,6 +180,28 @@ class OverridesTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             CheckAtRuntime().some_method(1)
 
+    def test_overrides_check_at_runtime_fails_on_every_call(self):
+        with self.assertRaises(TypeError):
+            CheckAtRuntime().some_method(1)
+        with self.assertRaises(TypeError):
+            CheckAtRuntime().some_method(1)
+
+    def test_overrides_check_at_runtime_replaces_itself_after_first_call(self):
+        wrapper = CheckAtRuntimeOnce.__dict__["some_method"]
+        self.assertEqual(CheckAtRuntimeOnce().some_method(), "checked")
+        method = CheckAtRuntimeOnce.__dict__["some_method"]
+        self.assertIsNot(method, wrapper)
+        self.assertIs(method, wrapper.__wrapped__)
+        self.assertEqual(method.__doc__, "Super Class Docs")
+        self.assertEqual(CheckAtRuntimeOnce().some_method(), "checked")
+
+    def test_overrides_check_at_runtime_replaces_static_method(self):
+        wrapper = CheckAtRuntimeOnce.__dict__["this_is_static"].__func__
+        self.assertEqual(CheckAtRuntimeOnce.this_is_static(1, 2, 3), 6)
+        method = CheckAtRuntimeOnce.__dict__["this_is_static"]
+        self.assertIsInstance(method, staticmethod)
+        self.assertIs(method.__func__, wrapper.__wrapped__)
+
     def test_overrides_builtin_method_correct_signature(self):
         class SubclassOfInt(int):
             @override
@@ -189,6 +226,71 @@ class OverridesTests(unittest.TestCase):
                 def bit_length(self, _):
                     "This will fail, bit_length takes in no arguments"
 
+    def test_base_classes_are_resolved_once_per_class_body(self):
+        resolved = []
+        original = overrides_module._get_base_class
+
+        def counting_get_base_class(components, namespace):
+            resolved.append(components)
+            return original(components, namespace)
+
+        overrides_module._get_base_class = counting_get_base_class
+        try:
+
+            class ManyOverrides(SuperClass):
+                @override
+                def some_method(self):
+                    pass
+
+                @staticmethod
+                @override
+                def this_is_static(x, y, z):
+                    pass
+
+                @override
+                class SomeClass:
+                    pass
+
+        finally:
+            overrides_module._get_base_class = original
+        self.assertEqual(resolved, [["SuperClass"]])
+
+    def test_class_bodies_in_a_loop_resolve_their_own_bases(self):
+        namespace = {
+            "__name__": __name__,
+            "override": override,
+            "bases": [SuperClass, Subber],
+        }
+        source = (
+            "docs = []\n"
+            "for Base in bases:\n"
+            "    class Sub(Base):\n"
+            "        @override\n"
+            "        def some_method(self):\n"
+            "            pass\n"
+            "    docs.append(Sub.some_method.__doc__)\n"
+        )
+        exec(source, namespace)
+        self.assertEqual(namespace["docs"], ["Super Class Docs", "Subber"])
+
+    def test_class_statement_frames_are_not_kept(self):
+        class Marker:
+            pass
+
+        def define():
+            marker = Marker()
+
+            class Sub(SuperClass):
+                @override
+                def some_method(self):
+                    pass
+
+            return weakref.ref(marker)
+
+        reference = define()
+        gc.collect()
+        self.assertIsNone(reference())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+import os
+from typing import Callable, List, Optional
+
+import pytest
+
+from overrides import override, persistent_cache, reset_stats, stats
+from overrides.signature import cache_clear
+
+
+class SuperClass:
+    def method(self, values: List[int]) -> int:
+        return 0
+
+
+@pytest.fixture
+def cache_directory(tmp_path):
+    persistent_cache.enable(str(tmp_path))
+    yield tmp_path
+    persistent_cache.disable()
+
+
+def define_subclass():
+    class SubClass(SuperClass):
+        @override
+        def method(self, values: List[int]) -> int:
+            return 1
+
+    return SubClass
+
+
+def test_disabled_by_default():
+    assert (
+        persistent_cache.validation_key(
+            SuperClass.method, define_subclass().method, False, True
+        )
+        is None
+    )
+
+
+def test_passed_checks_are_reused_after_restart(cache_directory):
+    define_subclass()
+    persistent_cache.flush()
+    assert len(os.listdir(cache_directory)) == 1
+
+    # A new process starts with an empty in-memory cache and maps the file.
+    persistent_cache.enable(str(cache_directory))
+    cache_clear()
+    reset_stats()
+    define_subclass()
+    result = stats()
+    assert result["persistent_cache_hits"] == 1
+    assert result["signature_extractions"] == 0
+    assert result["type_hint_evaluations"] == 0
+
+
+def test_failed_checks_are_not_cached(cache_directory):
+    def define_invalid_subclass():
+        class Invalid(SuperClass):
+            @override
+            def method(self, values: str) -> int:
+                return 1
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            define_invalid_subclass()
+        persistent_cache.flush()
+    assert os.listdir(cache_directory) == []
+
+
+def test_key_depends_on_annotations_and_defaults(cache_directory):
+    def method(self, values: List[int]) -> int:
+        return 0
+
+    key = persistent_cache.validation_key(SuperClass.method, method, False, True)
+    assert key == persistent_cache.validation_key(
+        SuperClass.method, method, False, True
+    )
+    assert key != persistent_cache.validation_key(
+        SuperClass.method, method, False, False
+    )
+    method.__annotations__["values"] = List[str]
+    assert key != persistent_cache.validation_key(
+        SuperClass.method, method, False, True
+    )
+    annotated_key = persistent_cache.validation_key(
+        SuperClass.method, method, False, True
+    )
+    method.__defaults__ = ([],)
+    assert annotated_key != persistent_cache.validation_key(
+        SuperClass.method, method, False, True
+    )
+
+
+def test_key_depends_on_base_classes_in_generic_annotations(cache_directory):
+    def method(self, values: List[int]) -> int:
+        return 0
+
+    def key_with(annotation):
+        method.__annotations__["values"] = annotation
+        return persistent_cache.validation_key(SuperClass.method, method, False, True)
+
+    # The same class before and after it changed its base classes.
+    before = type("Item", (), {"__module__": __name__})
+    after = type("Item", (int,), {"__module__": __name__})
+    assert key_with(Optional[List[before]]) != key_with(Optional[List[after]])
+    assert key_with(Callable[[before], int]) != key_with(Callable[[after], int])
+    assert key_with(list[before]) != key_with(list[after])
+    assert key_with(Optional[List[before]]) == key_with(Optional[List[before]])
+
+
+def test_corrupted_cache_file_is_ignored(cache_directory):
+    define_subclass()
+    persistent_cache.flush()
+    (path,) = cache_directory.iterdir()
+    path.write_bytes(b"garbage")
+
+    persistent_cache.enable(str(cache_directory))
+    reset_stats()
+    define_subclass()
+    assert stats()["persistent_cache_misses"] == 1
+    persistent_cache.flush()
+    assert path.read_bytes().startswith(b"OVERRIDES-CACHE")
@@ -1,6 +1,16 @@
+import gc
+import weakref
 from typing import Any, Type, Union
 
-from overrides import override
+import pytest
+
+from overrides import override, reset_stats, stats
+from overrides.signature import (
+    CacheInfo,
+    _get_signature_and_type_hints,
+    cache_clear,
+    cache_info,
+)
 
 
 class SuperbClass:
@@ -107,3 +117,86 @@ def test_that_this_file_is_ok():
 def test_self_typed_overrides():
     SelfTypedOverride().self_typed_method()
     SelfTypedOverride().self_typed_class_method()
+
+
+class HandlerBase:
+    def handle(self, request: int, *, retries: int = 0) -> str:
+        return ""
+
+
+def test_base_signature_is_computed_once_for_many_subclasses():
+    cache_clear()
+    for _ in range(10):
+
+        class Handler(HandlerBase):
+            @override
+            def handle(self, request: int, *, retries: int = 0) -> str:
+                return "handled"
+
+    # Every subclass method is a miss, the base method and its static method
+    # check are a miss only the first time.
+    assert cache_info() == CacheInfo(hits=9 + 9, misses=10 + 2, currsize=10 + 2)
+
+
+def test_unresolved_type_hints_are_not_cached():
+    class Base:
+        def handle(self) -> "NotYetDefined":  # type: ignore # noqa: F821
+            pass
+
+    cache_clear()
+    assert _get_signature_and_type_hints(Base.handle)[1] is None
+    assert _get_signature_and_type_hints(Base.handle)[1] is None
+    # Only the signature is cached, the type hints are resolved again.
+    assert cache_info() == CacheInfo(hits=0, misses=2, currsize=1)
+
+
+def test_signature_cache_does_not_keep_classes_alive():
+    class Result(str):
+        pass
+
+    class Sub(HandlerBase):
+        @override
+        def handle(self, request: int, *, retries: int = 0) -> Result:
+            return Result()
+
+    Result.owner = Sub  # The cached type hints now refer back to the method.
+    assert Sub.handle.__overrides_signature_info__.type_hints["return"] is Result
+
+    sub = weakref.ref(Sub)
+    del Result, Sub
+    gc.collect()
+    assert sub() is None
+
+
+class UnannotatedServicer:
+    def Call(self, request, context):
+        raise NotImplementedError()
+
+
+def test_unannotated_overrides_skip_type_hints():
+    reset_stats()
+
+    class Servicer(UnannotatedServicer):
+        @override
+        def Call(self, request, context):
+            return request
+
+    result = stats()
+    assert result["type_hint_evaluations"] == 0
+    assert result["issubtype_calls"] == 0
+
+
+def test_unannotated_overrides_keep_structural_errors():
+    with pytest.raises(TypeError, match="`context` is not present"):
+
+        class Renamed(UnannotatedServicer):
+            @override
+            def Call(self, request, ctx):
+                pass
+
+    with pytest.raises(TypeError, match="is not `POSITIONAL_OR_KEYWORD`"):
+
+        class KeywordOnly(UnannotatedServicer):
+            @override
+            def Call(self, request, *, context):
+                pass
@@ -0,0 +1,46 @@
+from typing import List
+
+import overrides
+from overrides import EnforceOverrides, override, reset_stats, stats
+from overrides.stats import COUNTS, TIMINGS
+
+
+class SuperClass(EnforceOverrides):
+    def method(self, values: List[int]) -> int:
+        return 0
+
+    def checked_method(self) -> int:
+        return 0
+
+
+def test_stats_is_a_plain_dict_of_numbers():
+    result = stats()
+    assert type(result) is dict
+    assert set(result) == set(COUNTS) | {f"{name}_seconds" for name in TIMINGS}
+    assert all(isinstance(value, (int, float)) for value in result.values())
+    assert overrides.stats is stats
+
+
+def test_stats_count_the_work_done():
+    reset_stats()
+    assert set(stats().values()) == {0}
+
+    class SubClass(SuperClass):
+        @override
+        def method(self, values: List[int]) -> int:
+            return 1
+
+        @override(check_at_runtime=True)
+        def checked_method(self) -> int:
+            return 1
+
+    SubClass().checked_method()
+    result = stats()
+    assert result["decorations"] == 2
+    assert result["enforce_class_creations"] == 1
+    assert result["runtime_check_calls"] == 1
+    assert result["signature_extractions"] >= 2
+    assert result["type_hint_evaluations"] >= 2
+    assert result["issubtype_calls"] >= 2
+    assert result["enforce_class_creation_seconds"] > 0
+    assert result["base_class_discovery_seconds"] > 0